@@ -4,10 +4,17 @@ Authentication API serializers.
 This module contains serializers for user registration and login functionality.
 """
 
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
-from django.utils.text import slugify
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
+from rest_framework.authtoken.models import Token
+from auth_app.hashing import check_password
 from auth_app.models import UserProfile
+from auth_app.usernames import base_username, next_username, taken_usernames
+
+# Inserts tried before giving up on usernames taken by concurrent requests
+USERNAME_ATTEMPTS = 5
 
 
 class RegistrationSerializer(serializers.ModelSerializer):
@@ -40,21 +47,10 @@ class RegistrationSerializer(serializers.ModelSerializer):
         fields = ['username', 'password', 'email',
                   'repeated_password', 'fullname']
         read_only_fields = ['username']
-        extra_kwargs = {'password': {'write_only': True}}
-
-    def validate_email(self, value):
-
-        if User.objects.filter(email=value).exists():
-            raise serializers.ValidationError(
-                {"error": "Email already in use."})
-        return value
-
-    def validate_fullname(self, value):
-        slug = slugify(value)
-        if User.objects.filter(username=slug).exists():
-            raise serializers.ValidationError(
-                {"error": "username already in use."})
-        return value
+        # The unique email constraint declared on User would add a
+        # UniqueValidator; save() relies on the constraint instead
+        extra_kwargs = {'password': {'write_only': True},
+                        'email': {'validators': []}}
 
     def validate_password(self, value):
         pw = value
@@ -65,33 +61,52 @@ class RegistrationSerializer(serializers.ModelSerializer):
                 {"error": "Passwords do not match."})
         return value
 
-    def save(self):
+    def save(self, password_hash=None):
         """
-        Create and save a new user with associated profile.
+        Create and save a new user with associated profile and token.
+
+        - Generates username from fullname using slugify, suffixed with the
+          lowest free number if it is taken
+        - Creates User, UserProfile with full_name and Token in one
+          transaction
+
+        Email and username uniqueness are enforced by the database: no
+        lookups run before the insert, and only a failed insert checks
+        which constraint was hit.
 
-        - Validates password match
-        - Checks email uniqueness
-        - Generates username from fullname using slugify
-        - Creates UserProfile with full_name
+        Args:
+            password_hash (str): Password already hashed by the caller,
+                e.g. in the hashing pool (optional)
 
         Returns:
             User: The newly created user instance
 
+        Raises:
+            ValidationError: If the email is already in use
         """
-        pw = self.validated_data['password']
-
-        fullname = self.validated_data.pop('fullname')
-        username_slug = slugify(fullname)
-
-        user = User(
-            email=self.validated_data['email'],
-            username=username_slug
-        )
-        user.set_password(pw)
-        user.save()
-        UserProfile.objects.create(user=user, full_name=fullname)
-
-        return user
+        if password_hash is None:
+            password_hash = make_password(self.validated_data['password'])
+        email = self.validated_data['email']
+        fullname = self.validated_data['fullname']
+        base = base_username(fullname)
+        username = base
+
+        for attempt in range(USERNAME_ATTEMPTS):
+            user = User(email=email, username=username,
+                        password=password_hash)
+            try:
+                with transaction.atomic():
+                    user.save()
+                    UserProfile.objects.create(user=user, full_name=fullname)
+                    Token.objects.create(user=user)
+                return user
+            except IntegrityError:
+                if User.objects.filter(email=email).exists():
+                    raise serializers.ValidationError(
+                        {'email': {"error": "Email already in use."}})
+                if attempt == USERNAME_ATTEMPTS - 1:
+                    raise
+                username = next_username(base, taken_usernames([base]))
 
 
 class LoginSerializer(serializers.ModelSerializer):
@@ -113,6 +128,8 @@ class LoginSerializer(serializers.ModelSerializer):
         help_text="User's password"
     )
 
+    user = None
+
     class Meta:
         model = User
         fields = ['email', 'password']
@@ -121,6 +138,9 @@ class LoginSerializer(serializers.ModelSerializer):
         """
         Validate that the email exists in the database.
 
+        Loads the user together with profile and token in one query and
+        keeps it as self.user for authenticate().
+
         Args:
             value (str): Email address to validate
 
@@ -130,27 +150,29 @@ class LoginSerializer(serializers.ModelSerializer):
         Raises:
             ValidationError: If email doesn't exist
         """
-        if not User.objects.filter(email=value).exists():
+        self.user = (User.objects
+                     .select_related('userprofile', 'auth_token')
+                     .filter(email=value).first())
+        if self.user is None:
             raise serializers.ValidationError(
                 {"error": "Invalid Email."})
         return value
 
-    def get(self):
+    def authenticate(self):
         """
-        Authenticate user with email and password.
+        Check the password of the validated user in the hashing pool.
 
         Returns:
             User: Authenticated user instance
 
         Raises:
             ValidationError: If password is incorrect
+            HashPoolSaturated: If the hashing pool is busy
         """
-        email = self.validated_data['email']
         password = self.validated_data['password']
+        user = self.user
 
-        user = User.objects.get(email=email)
-
-        if not user.check_password(password):
+        if not check_password(user, password):
             raise serializers.ValidationError(
                 {"error": "Invalid password."})
 
@@ -2,6 +2,10 @@
 Authentication API views.
 
 This module contains view classes for user registration and login endpoints.
+
+Both endpoints hash passwords, which is deliberately slow. The hashes run
+in the bounded hashing pool (see auth_app.hashing), which rejects requests
+with 429 when it is saturated.
 """
 
 from django.contrib.auth.models import User
@@ -10,6 +14,8 @@ from rest_framework.authtoken.models import Token
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
+from auth_app.hashing import hash_password
+
 from .serializers import RegistrationSerializer, LoginSerializer
 
 
@@ -28,6 +34,7 @@ class RegistrationView(generics.CreateAPIView):
     Returns:
         201: Registration successful with token and user data
         400: Validation errors (password mismatch, email/username exists, etc.)
+        429: Password hashing pool saturated
     """
 
     serializer_class = RegistrationSerializer
@@ -47,12 +54,12 @@ class RegistrationView(generics.CreateAPIView):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        saved_account = serializer.save()
+        password_hash = hash_password(serializer.validated_data['password'])
 
-        token, created = Token.objects.get_or_create(user=saved_account)
+        saved_account = serializer.save(password_hash=password_hash)
 
         response_data = {
-            'token': token.key,
+            'token': saved_account.auth_token.key,
             'fullname': saved_account.userprofile.full_name,
             'email': saved_account.email,
             'user_id': saved_account.id
@@ -76,6 +83,7 @@ class LoginView(generics.CreateAPIView):
     Returns:
         200: Login successful with token and user data
         400: Invalid credentials or validation errors
+        429: Password hashing pool saturated
     """
 
     serializer_class = LoginSerializer
@@ -86,6 +94,9 @@ class LoginView(generics.CreateAPIView):
         """
         Handle user login request.
 
+        Requests for unknown emails still hash the password once, so a
+        failed login takes as long as a wrong password.
+
         Args:
             request: HTTP request containing login credentials
 
@@ -93,11 +104,17 @@ class LoginView(generics.CreateAPIView):
             Response: User token and profile information
         """
         serializer = LoginSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-
-        user = serializer.get()
-
-        token, created = Token.objects.get_or_create(user=user)
+        if not serializer.is_valid():
+            if serializer.user is None:
+                data = request.data
+                password = (data.get('password', '')
+                            if hasattr(data, 'get') else '')
+                hash_password(str(password))
+            return Response(serializer.errors,
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        user = serializer.authenticate()
+        token = self.get_token(user)
 
         data = {
             'token': token.key,
@@ -107,3 +124,19 @@ class LoginView(generics.CreateAPIView):
         }
 
         return Response(data)
+
+    def get_token(self, user):
+        """
+        Return the user's token, creating it if the user has none.
+
+        Args:
+            user (User): Authenticated user loaded with its token
+
+        Returns:
+            Token: Authentication token of the user
+        """
+        try:
+            return user.auth_token
+        except Token.DoesNotExist:
+            token, created = Token.objects.get_or_create(user=user)
+            return token
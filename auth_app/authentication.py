@@ -0,0 +1,246 @@
+"""
+Cached token authentication.
+
+This module resolves API tokens to users without querying the database on
+every request. Resolved tokens are kept in a bounded, time-limited LRU in
+each process and, when AUTH_TOKEN_CACHE_SHARED is set, in Django's cache
+so all processes share them.
+
+Deleting a token and saving a user (deactivation, password change) or
+their profile drop the user's entries once the transaction commits (see
+auth_app.signals): locally by evicting them, in the shared cache by
+bumping a per-user version that entries are keyed by. Bulk queryset
+updates bypass the signals and only expire with the cache timeout.
+
+Without a shared cache, other processes never see an invalidation, so
+their entries live for at most AUTH_TOKEN_CACHE_LOCAL_TIMEOUT seconds.
+"""
+
+import hashlib
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+
+
+def _timeout():
+    """Return the lifetime of cached tokens in seconds."""
+    return getattr(settings, 'AUTH_TOKEN_CACHE_TIMEOUT', 300)
+
+
+def _shared():
+    """Return whether tokens are also cached in Django's cache."""
+    return getattr(settings, 'AUTH_TOKEN_CACHE_SHARED', False)
+
+
+def _local_timeout():
+    """
+    Return the lifetime of tokens cached in this process in seconds.
+
+    Shared entries are checked against the shared version on every hit, so
+    they may live as long as the cache timeout. Without a shared cache an
+    invalidation only reaches the current process, so the lifetime is
+    capped to bound how long other workers accept a revoked token.
+    """
+    if _shared():
+        return _timeout()
+    return min(_timeout(),
+               getattr(settings, 'AUTH_TOKEN_CACHE_LOCAL_TIMEOUT', 5))
+
+
+class LocalTokenCache:
+    """
+    Bounded in-process LRU of resolved tokens.
+
+    Stores pickled (user, token) pairs, so every request receives its own
+    user instance. Each invalidation advances a generation counter; a
+    lookup only stores its result if no invalidation happened since it
+    started, so it cannot cache a user loaded before a change committed.
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.generation = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Return the entry of a token if it has not expired.
+
+        Args:
+            key (str): Token key
+
+        Returns:
+            tuple | None: (user ID, version, pickled user and token)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1:]
+
+    def set(self, key, user_id, version, data, timeout, generation):
+        """
+        Store an entry unless a user was invalidated since generation.
+
+        Args:
+            key (str): Token key
+            user_id (int): ID of the token's user
+            version: Shared version the entry was loaded under
+            data (bytes): Pickled user and token
+            timeout (int): Lifetime in seconds
+            generation (int): Generation read before the entry was loaded
+        """
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = (
+                time.monotonic() + timeout, user_id, version, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_ids):
+        """Drop the entries of the given users."""
+        with self._lock:
+            self.generation += 1
+            stale = [key for key, entry in self._entries.items()
+                     if entry[1] in user_ids]
+            for key in stale:
+                del self._entries[key]
+
+
+_local_cache = LocalTokenCache(
+    getattr(settings, 'AUTH_TOKEN_CACHE_SIZE', 10000))
+
+
+def _user_version_key(user_id):
+    return f'auth:user:{user_id}:version'
+
+
+def _shared_version(user_id):
+    """
+    Return the shared version of a user's entries, initializing it if needed.
+
+    New versions start from the current time in nanoseconds, so an evicted
+    version key never restarts at a value used before.
+    """
+    key = _user_version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def _shared_key(key, version):
+    digest = hashlib.sha256(key.encode()).hexdigest()
+    return f'auth:token:{digest}:{version}'
+
+
+def invalidate_user_tokens(user_ids):
+    """
+    Invalidate the cached tokens of users once the transaction commits.
+
+    Args:
+        user_ids (iterable): IDs of users whose tokens or account changed
+    """
+    user_ids = {pk for pk in user_ids if pk is not None}
+
+    def invalidate():
+        _local_cache.invalidate(user_ids)
+        for user_id in user_ids:
+            if _shared():
+                try:
+                    cache.incr(_user_version_key(user_id))
+                except ValueError:
+                    cache.set(_user_version_key(user_id), time.time_ns(),
+                              timeout=None)
+
+    if user_ids:
+        transaction.on_commit(invalidate)
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Token authentication with cached token lookups.
+
+    Behaves like TokenAuthentication, but repeated requests with the same
+    token are answered from the token cache. The user is loaded with its
+    profile.
+    """
+
+    def authenticate_credentials(self, key):
+        """
+        Return the user and token of a key.
+
+        Args:
+            key (str): Token key sent by the client
+
+        Returns:
+            tuple: (User, Token)
+
+        Raises:
+            AuthenticationFailed: If the token is invalid or the user is
+            inactive
+        """
+        entry = _local_cache.get(key)
+        if entry is not None and (
+                not _shared() or _shared_version(entry[0]) == entry[1]):
+            user, token = pickle.loads(entry[2])
+        else:
+            user, token = self._load(key)
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed(
+                _('User inactive or deleted.'))
+        return user, token
+
+    def _load(self, key):
+        """
+        Resolve a key through the shared cache or the database.
+
+        The versions are read before the user is loaded, so a user changed
+        meanwhile is stored under a version nobody reads anymore.
+        """
+        model = self.get_model()
+        generation = _local_cache.generation
+        version = None
+        if _shared():
+            user_id = cache.get(_shared_key(key, 'user'))
+            if user_id is None:
+                user_id = (model.objects.filter(key=key)
+                           .values_list('user_id', flat=True).first())
+                if user_id is None:
+                    raise exceptions.AuthenticationFailed(_('Invalid token.'))
+                cache.set(_shared_key(key, 'user'), user_id, _timeout())
+            version = _shared_version(user_id)
+            data = cache.get(_shared_key(key, version))
+            if data is not None:
+                _local_cache.set(key, user_id, version, data,
+                                 _local_timeout(), generation)
+                return pickle.loads(data)
+
+        try:
+            token = (model.objects.select_related('user__userprofile')
+                     .get(key=key))
+        except model.DoesNotExist:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+
+        data = pickle.dumps((token.user, token))
+        if _shared():
+            cache.set(_shared_key(key, version), data, _timeout())
+        _local_cache.set(key, token.user_id, version, data,
+                         _local_timeout(), generation)
+        return token.user, token
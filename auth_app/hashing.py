@@ -0,0 +1,191 @@
+"""
+Bounded password hashing pool.
+
+Password hashes are deliberately slow. Registration and login run them in
+a dedicated thread pool of AUTH_HASH_WORKERS threads, so however many
+sign-in requests arrive at once, at most that many hashes compete with
+every other endpoint for CPU. hashlib releases the GIL while hashing, so
+the pool uses that many cores.
+
+At most AUTH_HASH_WORKERS + AUTH_HASH_QUEUE_SIZE jobs are admitted at a
+time; further requests are rejected with 429 Too Many Requests instead of
+queueing without bound, and so are requests that wait longer than
+AUTH_HASH_TIMEOUT seconds for their result. Pool utilization is available
+from stats() and rejections are logged at most once a second.
+
+The views calling the pool are synchronous DRF views, so a request thread
+waits while its hash runs; the API is served by WSGI and has no async
+views to await the pool from. The admission limit therefore also bounds
+how many request threads sign-ins can hold, and the short default timeout
+bounds how long they hold them. Both defaults (2 workers, 4 queued jobs,
+2 seconds) leave most threads of a worker process to other endpoints.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from functools import lru_cache
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password, verify_password
+from rest_framework.exceptions import Throttled
+
+logger = logging.getLogger(__name__)
+
+
+class HashPoolSaturated(Throttled):
+    """Raised when the hashing pool admits no further jobs."""
+
+    default_detail = ("Too many sign-in requests in progress, "
+                      "try again shortly.")
+
+
+class PasswordHashPool:
+    """
+    Thread pool with a bounded number of admitted jobs.
+
+    Args:
+        workers (int): Threads hashing in parallel
+        queue_size (int): Jobs that may wait for a free thread
+        timeout (float): Seconds a caller waits for a result (optional)
+    """
+
+    def __init__(self, workers, queue_size, timeout=None):
+        self.workers = workers
+        self.capacity = workers + queue_size
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix='password-hash')
+        self._lock = threading.Lock()
+        self._admitted = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_time = 0.0
+        self._run_time = 0.0
+        self._warned_at = 0.0
+
+    def run(self, func, *args):
+        """
+        Run func(*args) in the pool and wait for its result.
+
+        Returns:
+            Result of func
+
+        Raises:
+            HashPoolSaturated: If the pool admits no further jobs or the
+            result is not ready within the timeout
+        """
+        with self._lock:
+            rejected = self._admitted >= self.capacity
+            if rejected:
+                self._reject()
+            else:
+                self._admitted += 1
+        if rejected:
+            raise HashPoolSaturated(wait=1)
+
+        future = self._executor.submit(
+            self._call, time.monotonic(), func, args)
+        try:
+            return future.result(self.timeout)
+        except TimeoutError:
+            with self._lock:
+                # A job still queued is dropped; a running one finishes
+                if future.cancel():
+                    self._admitted -= 1
+                self._reject()
+            raise HashPoolSaturated(wait=1)
+
+    def _reject(self):
+        """Count a rejected job and log it at most once a second."""
+        self._rejected += 1
+        now = time.monotonic()
+        if now - self._warned_at >= 1:
+            self._warned_at = now
+            logger.warning("Password hashing pool saturated: %s",
+                           self._snapshot())
+
+    def _call(self, submitted, func, args):
+        """Run a job in a pool thread and record its timings."""
+        started = time.monotonic()
+        with self._lock:
+            self._running += 1
+            self._wait_time += started - submitted
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._admitted -= 1
+                self._completed += 1
+                self._run_time += time.monotonic() - started
+
+    def stats(self):
+        """
+        Return a snapshot of the pool utilization.
+
+        Returns:
+            dict: workers, capacity, running and queued jobs, completed and
+            rejected job counts, and average queue wait and run time in
+            milliseconds
+        """
+        with self._lock:
+            return self._snapshot()
+
+    def _snapshot(self):
+        """Return the utilization; the caller holds the lock."""
+        completed = self._completed or 1
+        return {
+            'workers': self.workers,
+            'capacity': self.capacity,
+            'running': self._running,
+            'queued': self._admitted - self._running,
+            'completed': self._completed,
+            'rejected': self._rejected,
+            'avg_wait_ms': round(self._wait_time / completed * 1000, 1),
+            'avg_run_ms': round(self._run_time / completed * 1000, 1),
+        }
+
+
+@lru_cache(maxsize=None)
+def get_hash_pool():
+    """Return the process-wide pool configured by AUTH_HASH_* settings."""
+    return PasswordHashPool(
+        workers=getattr(settings, 'AUTH_HASH_WORKERS', 2),
+        queue_size=getattr(settings, 'AUTH_HASH_QUEUE_SIZE', 4),
+        timeout=getattr(settings, 'AUTH_HASH_TIMEOUT', 2),
+    )
+
+
+def hash_password(password):
+    """
+    Hash a raw password in the pool.
+
+    Returns:
+        str: Encoded password for User.password
+    """
+    return get_hash_pool().run(make_password, password)
+
+
+def check_password(user, password):
+    """
+    Check a user's password in the pool.
+
+    Like User.check_password, the stored hash is upgraded when the hasher
+    settings changed.
+
+    Args:
+        user (User): User whose password is checked
+        password (str): Raw password
+
+    Returns:
+        bool: Whether the password is correct
+    """
+    is_correct, must_update = get_hash_pool().run(
+        verify_password, password, user.password)
+    if is_correct and must_update:
+        user.password = hash_password(password)
+        user.save(update_fields=['password'])
+    return is_correct
@@ -0,0 +1,83 @@
+"""
+Case-insensitive user lookup by email.
+
+Emails are compared lowercased through the expression index on
+LOWER(email) created by the auth_app migrations, so exact lookups and
+prefix searches read a few index entries instead of scanning auth_user.
+The index uses text_pattern_ops on PostgreSQL, which lets it serve the
+LIKE of prefix searches regardless of the database collation.
+"""
+
+from django.contrib.auth.models import User
+from django.db.models import Value
+from django.db.models.functions import Concat, Lower
+
+# Results of a prefix search
+PREFIX_LIMIT = 10
+
+# Shortest prefix that is searched, so the endpoint cannot list every user
+MIN_PREFIX_LENGTH = 3
+
+# Sorts after every character, closing the index range of a prefix
+_MAX_CHAR = '\U0010ffff'
+
+
+def _users():
+    """
+    Return users with their profile joined and their lowercased email.
+
+    Accounts without a profile, e.g. created with createsuperuser, cannot
+    be represented and are left out.
+    """
+    return (User.objects.select_related('userprofile')
+            .filter(userprofile__isnull=False)
+            .alias(email_lower=Lower('email')))
+
+
+def find_user_by_email(email):
+    """
+    Find the user with an email, ignoring case, in one query.
+
+    An exact match is preferred when several emails differ only in case.
+
+    Args:
+        email (str): Email address
+
+    Returns:
+        User | None: User with userprofile loaded, or None
+    """
+    users = list(_users().filter(email_lower=Lower(Value(email)))
+                 .order_by('pk')[:2])
+    for user in users:
+        if user.email == email:
+            return user
+    return users[0] if users else None
+
+
+def find_users_by_email_prefix(prefix, limit=PREFIX_LIMIT, user_ids=None):
+    """
+    Find users whose email starts with a prefix, ignoring case.
+
+    The range condition lets SQLite read the prefix from the index; the
+    LIKE condition does the same on PostgreSQL and keeps the result exact.
+
+    Args:
+        prefix (str): Start of the email address
+        limit (int): Maximum number of users
+        user_ids (iterable): Only search these users (optional)
+
+    Returns:
+        list: Users with userprofile loaded, ordered by email
+    """
+    users = _users()
+    if user_ids is not None:
+        user_ids = list(user_ids)
+        if not user_ids:
+            return []
+        users = users.filter(pk__in=user_ids)
+    lowered = Lower(Value(prefix))
+    return list(users.filter(
+        email_lower__gte=lowered,
+        email_lower__lt=Concat(lowered, Value(_MAX_CHAR)),
+        email_lower__startswith=lowered,
+    ).order_by('email_lower', 'pk')[:limit])
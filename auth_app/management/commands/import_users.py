@@ -0,0 +1,175 @@
+"""
+Management command to create user accounts in bulk from a CSV file.
+
+Usage:
+    python manage.py import_users team.csv
+    python manage.py import_users team.csv --dry-run
+    cat team.csv | python manage.py import_users -
+
+The CSV file needs a header row with the columns email and fullname and
+may have a password column. Users without a password get an unusable one
+and have to set it before they can log in.
+"""
+
+import csv
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.core.validators import validate_email
+from django.db import IntegrityError, transaction
+
+from auth_app.models import UserProfile
+from auth_app.usernames import base_username, next_username, taken_usernames
+
+
+class Command(BaseCommand):
+    """
+    Create users with profiles from a CSV file.
+
+    Rows are validated first and rows with invalid data or an email that is
+    already in use (in the database or earlier in the file) are skipped and
+    reported. Usernames are generated like on registration, passwords are
+    hashed in AUTH_HASH_WORKERS threads and each batch of users and profiles
+    is written with two bulk inserts in one transaction.
+    """
+
+    help = "Create user accounts with profiles from a CSV file."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'path',
+            help="CSV file with email, fullname and optional password "
+                 "columns, or - for stdin."
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help="Only validate the rows and report what would be created."
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help="Number of users written per transaction."
+        )
+
+    def handle(self, *args, **options):
+        rows = self.read_rows(options['path'])
+        accepted, skipped = self.validate_rows(rows)
+
+        for line, reason in skipped:
+            self.stdout.write(f"Line {line}: {reason}")
+
+        if options['dry_run']:
+            self.stdout.write(self.style.SUCCESS(
+                f"Would create {len(accepted)} users, skip {len(skipped)}."))
+            return
+
+        taken = taken_usernames(
+            base_username(row['fullname']) for row in accepted)
+        workers = getattr(settings, 'AUTH_HASH_WORKERS', 2)
+        with ThreadPoolExecutor(workers) as pool:
+            hashes = pool.map(
+                lambda password: make_password(password or None),
+                [row['password'] for row in accepted])
+            users = []
+            for row, password_hash in zip(accepted, hashes):
+                username = next_username(base_username(row['fullname']), taken)
+                taken.add(username)
+                users.append(User(username=username, email=row['email'],
+                                  password=password_hash))
+
+        batch_size = options['batch_size']
+        for start in range(0, len(users), batch_size):
+            batch = users[start:start + batch_size]
+            try:
+                with transaction.atomic():
+                    User.objects.bulk_create(batch)
+                    UserProfile.objects.bulk_create([
+                        UserProfile(user=user, full_name=row['fullname'])
+                        for user, row in zip(
+                            batch, accepted[start:start + batch_size])
+                    ])
+            except IntegrityError:
+                raise CommandError(
+                    f"Users were registered concurrently; imported {start} "
+                    f"users. Run the command again to import the rest.")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {len(users)} users, skipped {len(skipped)}."))
+
+    def read_rows(self, path):
+        """
+        Read the CSV rows.
+
+        Args:
+            path (str): File path or - for stdin
+
+        Returns:
+            list: (line number, row dict) pairs
+
+        Raises:
+            CommandError: If the file cannot be read or lacks columns
+        """
+        if path == '-':
+            return self.parse_rows(sys.stdin)
+        try:
+            with open(path, newline='', encoding='utf-8') as handle:
+                return self.parse_rows(handle)
+        except OSError as exc:
+            raise CommandError(f"Cannot read {path}: {exc}")
+
+    def parse_rows(self, handle):
+        """Parse CSV rows from an open file, checking the header."""
+        reader = csv.DictReader(handle)
+        missing = {'email', 'fullname'} - set(reader.fieldnames or [])
+        if missing:
+            raise CommandError(
+                f"Missing columns: {', '.join(sorted(missing))}.")
+        return [(reader.line_num, row) for row in reader]
+
+    def validate_rows(self, rows):
+        """
+        Split rows into importable and skipped ones.
+
+        Args:
+            rows (list): (line number, row dict) pairs
+
+        Returns:
+            tuple: (list of cleaned rows, list of (line number, reason))
+        """
+        emails = list({(row.get('email') or '').strip() for line, row in rows})
+        existing = set()
+        for start in range(0, len(emails), 500):
+            existing.update(User.objects.filter(
+                email__in=emails[start:start + 500]
+            ).values_list('email', flat=True))
+
+        accepted, skipped = [], []
+        for line, row in rows:
+            email = (row.get('email') or '').strip()
+            fullname = (row.get('fullname') or '').strip()
+            try:
+                validate_email(email)
+            except ValidationError:
+                skipped.append((line, f"invalid email {email!r}"))
+                continue
+            if not fullname or len(fullname) > 100:
+                skipped.append(
+                    (line, "fullname must have 1 to 100 characters"))
+                continue
+            if email in existing:
+                skipped.append((line, f"email {email} already in use"))
+                continue
+            existing.add(email)
+            accepted.append({
+                'email': email,
+                'fullname': fullname,
+                'password': row.get('password') or '',
+            })
+        return accepted, skipped
@@ -0,0 +1,23 @@
+from django.conf import settings
+from django.db import migrations, models
+
+import auth_app.operations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth_app', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # Non-empty user emails are unique; logins look users up by email
+        auth_app.operations.AddUserConstraint(
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('email', ''), _negated=True),
+                fields=('email',),
+                name='auth_user_email_unique',
+            ),
+        ),
+    ]
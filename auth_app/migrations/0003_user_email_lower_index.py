@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.functions.text
+
+import auth_app.operations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth_app', '0002_user_email_unique'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # Lowercased emails for case-insensitive and prefix lookups;
+        # text_pattern_ops lets PostgreSQL serve LIKE 'prefix%' from it
+        auth_app.operations.AddUserIndex(
+            index=models.Index(
+                django.db.models.functions.text.Lower('email'),
+                name='auth_user_email_lower_idx',
+            ),
+            opclass='text_pattern_ops',
+        ),
+    ]
@@ -2,10 +2,12 @@
 Authentication app models.
 
 This module defines the UserProfile model that extends Django's built-in User model
-with additional profile information.
+with additional profile information, and declares the constraints the
+auth_app migrations add to User (see auth_app.operations).
 """
 
 from django.db import models
+from django.db.models.functions import Lower
 from django.contrib.auth.models import User
 
 
@@ -38,3 +40,30 @@ class UserProfile(models.Model):
     class Meta:
         verbose_name = "User Profile"
         verbose_name_plural = "User Profiles"
+
+
+def _declare_on_user(option, value):
+    """
+    Add a constraint or index to the options of Django's User model.
+
+    User cannot be edited, so the auth_app migrations add these through
+    auth_app.operations; declaring them here keeps the model in the state
+    those migrations leave it in.
+    """
+    values = [*getattr(User._meta, option), value]
+    setattr(User._meta, option, values)
+    User._meta.original_attrs[option] = values
+
+
+# Non-empty emails are unique; logins and registration rely on it
+_declare_on_user('constraints', models.UniqueConstraint(
+    fields=['email'],
+    condition=~models.Q(email=''),
+    name='auth_user_email_unique',
+))
+
+# Case-insensitive and prefix lookups by email (see auth_app.lookup)
+_declare_on_user('indexes', models.Index(
+    Lower('email'),
+    name='auth_user_email_lower_idx',
+))
@@ -0,0 +1,111 @@
+"""
+Migration operations on the user model.
+
+auth_app adds constraints and indexes to the user model, which belongs to
+django.contrib.auth. Migration operations resolve models in the app of the
+migration they run in, so these variants apply the stock operations to
+the user model's app instead. Their state changes stay visible to
+sqlmigrate, squashmigrations and makemigrations; auth_app.models declares
+the same options on User so the autodetector finds nothing to change.
+"""
+
+from django.conf import settings
+from django.db import NotSupportedError, migrations, models
+
+
+def _user_model():
+    """Return the app label and lowercased name of the user model."""
+    app_label, model_name = settings.AUTH_USER_MODEL.split('.')
+    return app_label, model_name.lower()
+
+
+class UserModelOperation:
+    """Mixin running an index or constraint operation on the user model."""
+
+    def state_forwards(self, app_label, state):
+        super().state_forwards(_user_model()[0], state)
+
+    def database_forwards(self, app_label, schema_editor, from_state,
+                          to_state):
+        super().database_forwards(
+            _user_model()[0], schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state,
+                           to_state):
+        super().database_backwards(
+            _user_model()[0], schema_editor, from_state, to_state)
+
+    def deconstruct(self):
+        name, args, kwargs = super().deconstruct()
+        del kwargs['model_name']
+        return name, args, kwargs
+
+
+class AddUserConstraint(UserModelOperation, migrations.AddConstraint):
+    """
+    Add a constraint to the user model.
+
+    Schema editors silently skip conditional unique constraints on
+    backends without partial indexes; this operation fails instead, since
+    code relies on the database to enforce the constraint.
+    """
+
+    def __init__(self, constraint):
+        super().__init__(model_name=_user_model()[1], constraint=constraint)
+
+    def database_forwards(self, app_label, schema_editor, from_state,
+                          to_state):
+        features = schema_editor.connection.features
+        if (getattr(self.constraint, 'condition', None) is not None
+                and not features.supports_partial_indexes):
+            raise NotSupportedError(
+                f'{schema_editor.connection.vendor} cannot enforce the '
+                f'conditional constraint {self.constraint.name}.')
+        super().database_forwards(
+            app_label, schema_editor, from_state, to_state)
+
+
+class AddUserIndex(UserModelOperation, migrations.AddIndex):
+    """
+    Add an index to the user model.
+
+    With opclass, every indexed expression uses that operator class on
+    PostgreSQL (e.g. text_pattern_ops for LIKE prefix searches regardless
+    of the collation). Other backends and the migration state get the
+    plain index.
+    """
+
+    def __init__(self, index, opclass=None):
+        super().__init__(model_name=_user_model()[1], index=index)
+        self.opclass = opclass
+
+    def database_index(self, connection):
+        """Return the index as created on the given connection."""
+        if self.opclass is None or connection.vendor != 'postgresql':
+            return self.index
+        from django.contrib.postgres.indexes import OpClass
+        return models.Index(
+            *[OpClass(expression, name=self.opclass)
+              for expression in self.index.expressions],
+            name=self.index.name,
+        )
+
+    def database_forwards(self, app_label, schema_editor, from_state,
+                          to_state):
+        model = to_state.apps.get_model(*_user_model())
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            schema_editor.add_index(
+                model, self.database_index(schema_editor.connection))
+
+    def database_backwards(self, app_label, schema_editor, from_state,
+                           to_state):
+        model = from_state.apps.get_model(*_user_model())
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            schema_editor.remove_index(
+                model, self.database_index(schema_editor.connection))
+
+    def deconstruct(self):
+        name, args, kwargs = super().deconstruct()
+        if self.opclass is not None:
+            kwargs['opclass'] = self.opclass
+        return name, args, kwargs
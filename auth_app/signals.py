@@ -0,0 +1,38 @@
+"""
+Authentication app signal handlers.
+
+Drops cached token lookups (see auth_app.authentication) when a token is
+deleted or the user or profile they resolve to changes, e.g. on
+deactivation or a password change.
+"""
+
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from .authentication import invalidate_user_tokens
+from .models import UserProfile
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    """Forget a deleted token."""
+    invalidate_user_tokens([instance.user_id])
+
+
+@receiver(post_save, sender=User)
+def invalidate_saved_user(sender, instance, update_fields=None, raw=False,
+                          **kwargs):
+    """Forget the tokens of a changed user; last_login updates are ignored."""
+    if raw or (update_fields is not None
+               and set(update_fields) <= {'last_login'}):
+        return
+    invalidate_user_tokens([instance.pk])
+
+
+@receiver(post_save, sender=UserProfile)
+def invalidate_saved_profile(sender, instance, raw=False, **kwargs):
+    """Forget the tokens of a user whose profile changed."""
+    if not raw:
+        invalidate_user_tokens([instance.user_id])
@@ -0,0 +1,305 @@
+"""
+Authentication app tests.
+
+Covers registration and login through the API, the token cache and the
+import_users command.
+"""
+
+import io
+import os
+import tempfile
+import time
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import IntegrityError
+from django.test import TestCase, override_settings
+from rest_framework import exceptions
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from .api.serializers import USERNAME_ATTEMPTS
+from .authentication import CachedTokenAuthentication, LocalTokenCache
+from .hashing import hash_password
+from .models import UserProfile
+from .usernames import taken_usernames
+
+FAST_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+
+@override_settings(PASSWORD_HASHERS=FAST_HASHERS)
+class RegistrationTests(APITestCase):
+    """POST /api/registration/ relies on the database for uniqueness."""
+
+    url = '/api/registration/'
+
+    def register(self, fullname='Jane Doe', email='jane@example.com'):
+        return self.client.post(self.url, {
+            'fullname': fullname, 'email': email,
+            'password': 'secret-password',
+            'repeated_password': 'secret-password',
+        }, format='json')
+
+    def test_duplicate_email_keeps_response_shape(self):
+        self.assertEqual(self.register().status_code, 201)
+        # Savepoint, failed INSERT, rollback and release, then the email
+        # lookup; no validator query runs before the insert
+        with self.assertNumQueries(5):
+            response = self.register(fullname='Other Name')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(),
+                         {'email': {'error': 'Email already in use.'}})
+        self.assertEqual(User.objects.count(), 1)
+
+    def test_taken_username_gets_lowest_free_suffix(self):
+        self.assertEqual(self.register().status_code, 201)
+        response = self.register(email='other@example.com')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            User.objects.get(email='other@example.com').username, 'jane-doe-2')
+        self.assertEqual(set(response.json()),
+                         {'token', 'fullname', 'email', 'user_id'})
+
+    def test_username_taken_concurrently_is_retried(self):
+        User.objects.create(username='jane-doe', email='a@example.com')
+        User.objects.create(username='jane-doe-2', email='b@example.com')
+        # The first lookup misses jane-doe-2, as if it was registered
+        # concurrently; the retry sees it
+        stale = [{'jane-doe'}]
+        with mock.patch('auth_app.api.serializers.taken_usernames',
+                        side_effect=lambda bases: stale.pop() if stale
+                        else taken_usernames(bases)) as lookup:
+            response = self.register()
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(lookup.call_count, 2)
+        self.assertEqual(User.objects.get(email='jane@example.com').username,
+                         'jane-doe-3')
+
+    def test_retries_are_limited(self):
+        User.objects.create(username='jane-doe', email='a@example.com')
+        with mock.patch('auth_app.api.serializers.taken_usernames',
+                        return_value=set()) as lookup:
+            with self.assertRaises(IntegrityError):
+                self.register()
+        self.assertEqual(lookup.call_count, USERNAME_ATTEMPTS - 1)
+        self.assertFalse(
+            User.objects.filter(email='jane@example.com').exists())
+
+
+@override_settings(PASSWORD_HASHERS=FAST_HASHERS)
+class LoginTests(APITestCase):
+    """POST /api/login/ loads the user in one query."""
+
+    url = '/api/login/'
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            'jane-doe', 'jane@example.com', 'secret-password')
+        UserProfile.objects.create(user=self.user, full_name='Jane Doe')
+        self.token = Token.objects.create(user=self.user)
+
+    def login(self, email='jane@example.com', password='secret-password'):
+        return self.client.post(self.url, {'email': email,
+                                           'password': password},
+                                format='json')
+
+    def test_login_runs_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.login()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            'token': self.token.key, 'fullname': 'Jane Doe',
+            'email': 'jane@example.com', 'user_id': self.user.pk,
+        })
+
+    def test_first_login_creates_token(self):
+        self.token.delete()
+        response = self.login()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['token'],
+                         Token.objects.get(user=self.user).key)
+
+    def test_wrong_password(self):
+        response = self.login(password='wrong-password')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(),
+                         {'error': 'Invalid password.'})
+
+    def test_unknown_email_hashes_the_password(self):
+        with mock.patch('auth_app.api.views.hash_password',
+                        wraps=hash_password) as hashed:
+            with self.assertNumQueries(1):
+                response = self.login(email='nobody@example.com')
+        hashed.assert_called_once_with('secret-password')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(),
+                         {'email': {'error': 'Invalid Email.'}})
+
+
+@override_settings(AUTH_TOKEN_CACHE_SHARED=False,
+                   AUTH_TOKEN_CACHE_TIMEOUT=300,
+                   AUTH_TOKEN_CACHE_LOCAL_TIMEOUT=5)
+class TokenCacheTests(TestCase):
+    """
+    Cached tokens are dropped when the token, user or profile changes.
+
+    Invalidation runs in on_commit callbacks, which TestCase only runs
+    inside captureOnCommitCallbacks(execute=True). Each test starts with
+    an empty cache, standing in for a fresh process.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.use_process_cache(LocalTokenCache(100))
+        self.user = User.objects.create_user('jane-doe', 'jane@example.com')
+        self.profile = UserProfile.objects.create(user=self.user,
+                                                  full_name='Jane Doe')
+        self.key = Token.objects.create(user=self.user).key
+
+    def use_process_cache(self, local_cache):
+        """Replace the in-process token cache for the rest of the test."""
+        patcher = mock.patch('auth_app.authentication._local_cache',
+                             local_cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def authenticate(self, queries=None):
+        """Resolve the token, optionally asserting the query count."""
+        if queries is None:
+            return CachedTokenAuthentication().authenticate_credentials(
+                self.key)[0]
+        with self.assertNumQueries(queries):
+            return self.authenticate()
+
+    def test_repeated_lookups_are_cached(self):
+        self.authenticate(queries=1)
+        user = self.authenticate(queries=0)
+        self.assertEqual(user, self.user)
+        self.assertEqual(user.userprofile.full_name, 'Jane Doe')
+
+    def test_deleted_token_is_rejected(self):
+        self.authenticate()
+        with self.captureOnCommitCallbacks(execute=True):
+            Token.objects.filter(key=self.key).delete()
+
+        with self.assertRaisesMessage(exceptions.AuthenticationFailed,
+                                      'Invalid token.'):
+            self.authenticate()
+
+    def test_deactivated_user_is_rejected(self):
+        self.authenticate()
+        self.user.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+            # Not committed yet: the cached entry is still served
+            self.assertTrue(self.authenticate(queries=0).is_active)
+
+        with self.assertRaisesMessage(exceptions.AuthenticationFailed,
+                                      'User inactive or deleted.'):
+            self.authenticate(queries=1)
+
+    def test_profile_change_is_seen(self):
+        self.authenticate()
+        self.profile.full_name = 'Jane Smith'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.profile.save()
+
+        user = self.authenticate(queries=1)
+        self.assertEqual(user.userprofile.full_name, 'Jane Smith')
+
+    def test_last_login_update_keeps_the_entry(self):
+        self.authenticate()
+        self.user.last_login = self.user.date_joined
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save(update_fields=['last_login'])
+
+        self.authenticate(queries=0)
+
+    def test_local_entries_expire_without_a_shared_cache(self):
+        """
+        Changes that bypass the signals, like another process's
+        invalidation, are seen once the local timeout has passed.
+        """
+        self.authenticate()
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        start = time.monotonic()
+
+        with mock.patch('auth_app.authentication.time.monotonic',
+                        return_value=start + 4):
+            self.assertTrue(self.authenticate(queries=0).is_active)
+        with mock.patch('auth_app.authentication.time.monotonic',
+                        return_value=start + 6):
+            with self.assertRaisesMessage(exceptions.AuthenticationFailed,
+                                          'User inactive or deleted.'):
+                self.authenticate(queries=1)
+
+    @override_settings(AUTH_TOKEN_CACHE_SHARED=True)
+    def test_shared_cache_reaches_other_processes(self):
+        first_process = LocalTokenCache(100)
+        self.use_process_cache(first_process)
+        # Token owner, then token with user and profile
+        self.authenticate(queries=2)
+
+        self.use_process_cache(LocalTokenCache(100))
+        self.authenticate(queries=0)
+        self.profile.full_name = 'Jane Smith'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.profile.save()
+
+        # The first process still holds its entry, but under an old version
+        self.use_process_cache(first_process)
+        user = self.authenticate(queries=1)
+        self.assertEqual(user.userprofile.full_name, 'Jane Smith')
+
+
+@override_settings(PASSWORD_HASHERS=FAST_HASHERS)
+class ImportUsersTests(TestCase):
+    """The import_users command bulk-creates users from a CSV file."""
+
+    def import_users(self, content, *args):
+        with tempfile.NamedTemporaryFile(
+                'w', suffix='.csv', delete=False) as handle:
+            handle.write(content)
+        self.addCleanup(os.remove, handle.name)
+        out = io.StringIO()
+        call_command('import_users', handle.name, *args, stdout=out)
+        return out.getvalue()
+
+    def test_import(self):
+        User.objects.create(username='taken', email='taken@example.com')
+        User.objects.create(username='jane-doe', email='jane@example.com')
+        content = ('email,fullname,password\n'
+                   'new@example.com,Jane Doe,secret-password\n'
+                   'second@example.com,Jane Doe,\n'
+                   'not-an-email,Bad Row,\n'
+                   'taken@example.com,Taken Again,\n'
+                   'new@example.com,Duplicate In File,\n')
+        # Existing emails, taken usernames, then one transaction with a
+        # bulk insert each for users and profiles
+        with self.assertNumQueries(6):
+            out = self.import_users(content)
+        self.assertIn('Created 2 users, skipped 3.', out)
+        self.assertIn('Line 4: invalid email', out)
+        self.assertIn('Line 5: email taken@example.com already in use', out)
+        self.assertIn('Line 6: email new@example.com already in use', out)
+
+        first = User.objects.get(email='new@example.com')
+        second = User.objects.get(email='second@example.com')
+        self.assertEqual((first.username, second.username),
+                         ('jane-doe-2', 'jane-doe-3'))
+        self.assertEqual(first.userprofile.full_name, 'Jane Doe')
+        self.assertTrue(first.check_password('secret-password'))
+        self.assertFalse(second.has_usable_password())
+
+    def test_dry_run_writes_nothing(self):
+        out = self.import_users('email,fullname\nnew@example.com,New User\n',
+                                '--dry-run')
+        self.assertIn('Would create 1 users, skip 0.', out)
+        self.assertFalse(User.objects.filter(email='new@example.com').exists())
+
+    def test_missing_columns(self):
+        with self.assertRaisesMessage(CommandError,
+                                      'Missing columns: fullname.'):
+            self.import_users('email\nnew@example.com\n')
@@ -0,0 +1,70 @@
+"""
+Username generation.
+
+Usernames are derived from the full name with slugify. When the slug is
+taken, the lowest free numeric suffix is appended ("jane-doe",
+"jane-doe-2", "jane-doe-3", ...), so the same names and existing users
+always produce the same usernames.
+"""
+
+import re
+
+from django.contrib.auth.models import User
+from django.db.models import Q
+from django.utils.text import slugify
+
+
+def base_username(fullname):
+    """
+    Return the unsuffixed username for a full name.
+
+    Args:
+        fullname (str): User's full name
+
+    Returns:
+        str: Slugified full name, or "user" if nothing is left of it
+    """
+    return slugify(fullname) or 'user'
+
+
+def taken_usernames(bases):
+    """
+    Return existing usernames that may collide with the given bases.
+
+    Args:
+        bases (iterable): Unsuffixed usernames
+
+    Returns:
+        set: Usernames starting with one of the bases
+    """
+    query = Q()
+    for base in set(bases):
+        query |= Q(username__startswith=base)
+    if not query:
+        return set()
+    return set(User.objects.filter(query).values_list('username', flat=True))
+
+
+def next_username(base, taken):
+    """
+    Return the first free username for a base.
+
+    Args:
+        base (str): Unsuffixed username
+        taken (set): Usernames already in use
+
+    Returns:
+        str: base itself or base with the lowest free suffix from 2 on
+    """
+    if base not in taken:
+        return base
+    pattern = re.compile(rf'{re.escape(base)}-(\d+)')
+    used = set()
+    for name in taken:
+        match = pattern.fullmatch(name)
+        if match:
+            used.add(int(match.group(1)))
+    suffix = 2
+    while suffix in used:
+        suffix += 1
+    return f'{base}-{suffix}'
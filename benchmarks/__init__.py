@@ -0,0 +1,19 @@
+"""
+Benchmarks of the API's hot paths.
+
+Every benchmark is a module run from the repository root, for example:
+
+    SECRET_KEY=dev python -m benchmarks.board_detail
+
+Like manage.py test, each run creates a throwaway test database, seeds it,
+prints its measurements and destroys the database again; the development
+database is never touched. Sizes are configurable on the command line
+(see --help of each module).
+"""
+
+import os
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+django.setup()
@@ -0,0 +1,79 @@
+"""
+Query count and latency of GET /api/boards/{id}/.
+
+Seeds boards of growing size (tasks with assignees, reviewers and
+comments, plus members) and fails unless every board detail request runs
+the same number of queries.
+
+Usage:
+    SECRET_KEY=dev python -m benchmarks.board_detail
+    SECRET_KEY=dev python -m benchmarks.board_detail --tasks 10 100 500
+"""
+
+from rest_framework.test import APIClient
+
+from boards_app.models import Board
+from tasks_app.models import Task, TaskComment
+
+from .utils import (benchmark_database, count_queries, create_users, fail,
+                    milliseconds, parser, timed, token_header)
+
+
+def seed_board(owner, members, task_count, comments_per_task):
+    """Create a board with members and tasks assigned among them."""
+    board = Board.objects.create(title=f'{task_count} tasks', owner=owner)
+    board.members.add(*members)
+    tasks = []
+    for index in range(task_count):
+        tasks.append(Task.objects.create(
+            board=board, title=f'Task {index}',
+            assignee=members[index % len(members)],
+            reviewer=members[(index + 1) % len(members)]))
+    TaskComment.objects.bulk_create([
+        TaskComment(task=task, author=owner, content='Comment')
+        for task in tasks for _ in range(comments_per_task)
+    ])
+    return board
+
+
+def main():
+    arguments = parser(__doc__.split('\n')[1])
+    arguments.add_argument('--tasks', type=int, nargs='+',
+                           default=[1, 50, 500],
+                           help="Task counts of the seeded boards.")
+    arguments.add_argument('--members', type=int, default=20,
+                           help="Members of every board.")
+    arguments.add_argument('--comments', type=int, default=2,
+                           help="Comments per task.")
+    arguments.add_argument('--repeat', type=int, default=20,
+                           help="Timed requests per board.")
+    options = arguments.parse_args()
+
+    with benchmark_database():
+        owner, *members = create_users(options.members + 1)
+        client = APIClient(**token_header(owner))
+        client.get('/api/boards/')
+
+        counts = {}
+        for task_count in options.tasks:
+            board = seed_board(owner, members, task_count, options.comments)
+            url = f'/api/boards/{board.pk}/'
+            response, first = count_queries(client.get, url)
+            if response.status_code != 200:
+                fail(f'{url} returned {response.status_code}')
+            if len(response.json()['tasks']) != task_count:
+                fail(f'{url} did not return {task_count} tasks')
+            _, warm = count_queries(client.get, url)
+            durations = [timed(client.get, url)[1]
+                         for _ in range(options.repeat)]
+            counts[task_count] = (first, warm)
+            print(f'{task_count:>6} tasks: {first} queries (first request), '
+                  f'{warm} queries (repeated), {milliseconds(durations)}')
+
+    if len(set(counts.values())) != 1:
+        fail(f'query count depends on the number of tasks: {counts}')
+    print('Query count is constant.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+"""
+Email lookups of the member picker at scale.
+
+Seeds users with profiles (1M by default) and times the exact and prefix
+lookups of auth_app.lookup against the ORM queries they replaced. Prints
+the query plans of both lookups and fails unless they search the
+LOWER(email) index.
+
+Usage:
+    SECRET_KEY=dev python -m benchmarks.email_lookup
+    SECRET_KEY=dev python -m benchmarks.email_lookup --users 100000
+"""
+
+import random
+
+from django.contrib.auth.models import User
+from django.db import connection
+
+from auth_app.lookup import find_user_by_email, find_users_by_email_prefix
+from auth_app.models import UserProfile
+
+from .utils import benchmark_database, fail, milliseconds, parser, timed
+
+INDEX_NAME = 'auth_user_email_lower_idx'
+
+NAMES = ['anna', 'ben', 'clara', 'david', 'emma', 'felix', 'greta', 'hannah',
+         'jonas', 'lena', 'max', 'mia', 'noah', 'paul', 'sophie', 'tom']
+
+
+def email(index):
+    """Return the email of the seeded user number index."""
+    return f'{NAMES[index % len(NAMES)]}.{index}@example.com'
+
+
+def seed_users(count, batch_size=10000):
+    """Create count users with profiles and unusable passwords."""
+    for start in range(0, count, batch_size):
+        batch = User.objects.bulk_create([
+            User(username=f'user{index}', email=email(index), password='!')
+            for index in range(start, min(start + batch_size, count))
+        ])
+        UserProfile.objects.bulk_create([
+            UserProfile(user=user, full_name=user.username.title())
+            for user in batch
+        ])
+
+
+def old_exact(address):
+    """Exact lookup as EmailCheck ran it before, profile loaded lazily."""
+    user = User.objects.get(email=address)
+    return user.userprofile
+
+
+def iexact(address):
+    """Case-insensitive ORM lookup, profile loaded lazily."""
+    user = User.objects.get(email__iexact=address)
+    return user.userprofile
+
+
+def istartswith(prefix):
+    """Case-insensitive ORM prefix search of ten users."""
+    return list(User.objects.select_related('userprofile')
+                .filter(email__istartswith=prefix).order_by('email')[:10])
+
+
+def query_plans(func, *args):
+    """Call func and return the query plans of the queries it ran."""
+    queries = []
+
+    def record(execute, sql, params, many, context):
+        queries.append((sql, params))
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(record):
+        func(*args)
+    plans = []
+    with connection.cursor() as cursor:
+        for sql, params in queries:
+            cursor.execute(
+                f'{connection.ops.explain_query_prefix()} {sql}', params)
+            plans.append('\n'.join(' '.join(map(str, row))
+                                   for row in cursor.fetchall()))
+    return plans
+
+
+def main():
+    arguments = parser(__doc__.split('\n')[1])
+    arguments.add_argument('--users', type=int, default=1_000_000,
+                           help="Seeded users.")
+    arguments.add_argument('--lookups', type=int, default=50,
+                           help="Timed lookups per variant.")
+    options = arguments.parse_args()
+    rng = random.Random(24)
+
+    with benchmark_database():
+        _, seconds = timed(seed_users, options.users)
+        print(f'Seeded {options.users} users in {seconds:.0f} s')
+
+        addresses = [email(rng.randrange(options.users))
+                     for _ in range(options.lookups)]
+        prefixes = [address[:rng.randint(3, 8)] for address in addresses]
+        variants = {
+            'exact, get() + lazy profile': (old_exact, addresses),
+            'iexact + lazy profile': (iexact, addresses),
+            'find_user_by_email': (
+                find_user_by_email,
+                [address.upper() for address in addresses]),
+            'istartswith, 10 results': (istartswith, prefixes),
+            'find_users_by_email_prefix (3-8 chars)': (
+                find_users_by_email_prefix, prefixes),
+        }
+        for name, (func, values) in variants.items():
+            durations = [timed(func, value)[1] for value in values]
+            print(f'{name:<40} {milliseconds(durations)}')
+
+        unindexed = []
+        for func, value in ((find_user_by_email, addresses[0]),
+                            (find_users_by_email_prefix, prefixes[0])):
+            plan, = query_plans(func, value)
+            print(f'{func.__name__} plan:\n{plan}')
+            if INDEX_NAME not in plan:
+                unindexed.append(func.__name__)
+
+    if unindexed:
+        fail(f'{", ".join(unindexed)} do not search {INDEX_NAME}')
+    print(f'Both lookups search {INDEX_NAME}.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+JSON rendering and parsing of board detail payloads.
+
+Takes the response data of GET /api/boards/{id}/ for boards of growing
+size and renders it with DRF's JSONRenderer and FastJSONRenderer, then
+parses the body with JSONParser and FastJSONParser. Fails if orjson is
+not installed, if the outputs differ or if the fast classes are slower.
+
+Usage:
+    SECRET_KEY=dev python -m benchmarks.json_rendering
+    SECRET_KEY=dev python -m benchmarks.json_rendering --tasks 100 1000
+"""
+
+import io
+import json
+
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from core import renderers
+from core.parsers import FastJSONParser
+from core.renderers import FastJSONRenderer
+
+from .board_detail import seed_board
+from .utils import benchmark_database, create_users, fail, parser, timed
+
+
+def best_time(func, repeat):
+    """Call func repeat times and return its result and the best time."""
+    best = None
+    for _ in range(repeat):
+        result, seconds = timed(func)
+        best = seconds if best is None else min(best, seconds)
+    return result, best
+
+
+def main():
+    arguments = parser(__doc__.split('\n')[1])
+    arguments.add_argument('--tasks', type=int, nargs='+',
+                           default=[50, 500, 2000],
+                           help="Task counts of the rendered boards.")
+    arguments.add_argument('--repeat', type=int, default=20,
+                           help="Renderings per variant; the fastest counts.")
+    options = arguments.parse_args()
+    if renderers.orjson is None:
+        fail('orjson is not installed; FastJSONRenderer falls back to '
+             'JSONRenderer')
+
+    slower = []
+    with benchmark_database():
+        owner, *members = create_users(11)
+        client = APIClient()
+        client.force_authenticate(owner)
+        for task_count in options.tasks:
+            board = seed_board(owner, members, task_count, 1)
+            data = client.get(f'/api/boards/{board.pk}/').data
+
+            body, drf_render = best_time(
+                lambda: JSONRenderer().render(data), options.repeat)
+            fast_body, fast_render = best_time(
+                lambda: FastJSONRenderer().render(data), options.repeat)
+            parsed, drf_parse = best_time(
+                lambda: JSONParser().parse(io.BytesIO(body)), options.repeat)
+            fast_parsed, fast_parse = best_time(
+                lambda: FastJSONParser().parse(io.BytesIO(body)),
+                options.repeat)
+
+            print(f'{task_count:>6} tasks, {len(body) / 1024:,.0f} KiB: '
+                  f'render {drf_render * 1000:.2f} -> '
+                  f'{fast_render * 1000:.2f} ms '
+                  f'({drf_render / fast_render:.1f}x), '
+                  f'parse {drf_parse * 1000:.2f} -> '
+                  f'{fast_parse * 1000:.2f} ms '
+                  f'({drf_parse / fast_parse:.1f}x)')
+            if (json.loads(fast_body) != json.loads(body)
+                    or fast_parsed != parsed):
+                fail(f'{task_count} tasks: fast output differs from DRF')
+            if fast_render >= drf_render or fast_parse >= drf_parse:
+                slower.append(task_count)
+
+    if slower:
+        fail(f'fast classes are slower for {slower} tasks')
+    print('FastJSONRenderer and FastJSONParser match DRF and are faster.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+Login storm: queries, throughput and timing of POST /api/login/.
+
+First sends a storm of logins over a set of users with MD5 hashing, so the
+database cost is not hidden behind the hasher, and reports queries per
+login and logins per second. Then times successful logins, wrong
+passwords and unknown emails with the configured hashers.
+
+Fails if a repeated login runs more than one query or if the median time
+of a failed login for an unknown email and for a wrong password differ by
+more than --tolerance.
+
+Usage:
+    SECRET_KEY=dev python -m benchmarks.login
+    SECRET_KEY=dev python -m benchmarks.login --logins 2000 --users 200
+"""
+
+import statistics
+
+from django.test.utils import override_settings
+from rest_framework.test import APIClient
+
+from .utils import (FAST_HASHERS, PASSWORD, benchmark_database,
+                    count_queries, create_users, fail, milliseconds, parser,
+                    timed)
+
+
+def login(client, email, password, expected_status):
+    """Log in once and return the query count of the request."""
+    response, queries = count_queries(
+        client.post, '/api/login/', {'email': email, 'password': password},
+        format='json')
+    if response.status_code != expected_status:
+        fail(f'login of {email} returned {response.status_code}')
+    return queries
+
+
+def storm(client, users, logins):
+    """
+    Log in users round-robin after one first login each.
+
+    Returns:
+        tuple: (queries of the repeated logins, seconds they took)
+    """
+    for user in users:
+        login(client, user.email, PASSWORD, 200)
+    return timed(lambda: sum(
+        login(client, users[index % len(users)].email, PASSWORD, 200)
+        for index in range(logins)))
+
+
+def main():
+    arguments = parser(__doc__.split('\n')[1])
+    arguments.add_argument('--logins', type=int, default=500,
+                           help="Logins of the storm.")
+    arguments.add_argument('--users', type=int, default=50,
+                           help="Users logging in during the storm.")
+    arguments.add_argument('--repeat', type=int, default=10,
+                           help="Timed logins per case with the configured "
+                                "hashers.")
+    arguments.add_argument('--tolerance', type=float, default=0.25,
+                           help="Allowed relative difference of the failed "
+                                "login medians.")
+    options = arguments.parse_args()
+
+    client = APIClient()
+    with benchmark_database(fast_hasher=False):
+        with override_settings(PASSWORD_HASHERS=FAST_HASHERS):
+            users = create_users(options.users, prefix='storm')
+            queries, seconds = storm(client, users, options.logins)
+        print(f'Storm (MD5): {options.logins} logins, {queries} queries '
+              f'({queries / options.logins:.2f} per login), '
+              f'{options.logins / seconds:.0f} logins/s')
+
+        user, = create_users(1, prefix='timed')
+        cases = {
+            'success': (user.email, PASSWORD, 200),
+            'wrong password': (user.email, 'wrong-password', 400),
+            'unknown email': ('nobody@example.com', PASSWORD, 400),
+        }
+        medians = {}
+        for case, credentials in cases.items():
+            durations = [timed(login, client, *credentials)[1]
+                         for _ in range(options.repeat)]
+            medians[case] = statistics.median(durations)
+            print(f'{case} (configured hashers): {milliseconds(durations)}')
+
+    if queries > options.logins:
+        fail(f'repeated logins ran {queries} queries '
+             f'for {options.logins} logins')
+    unknown, wrong = medians['unknown email'], medians['wrong password']
+    if abs(unknown - wrong) > options.tolerance * wrong:
+        fail('failed logins for unknown emails and wrong passwords '
+             'do not take the same time')
+    print('Repeated logins run one query; failed logins take the same time.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+"""
+Latency of other endpoints during a login burst.
+
+Measures GET /api/boards/ while idle, then sends a burst of concurrent
+logins (one thread per login, like request worker threads) while the main
+thread keeps requesting the board list. The burst runs twice: through the
+password hashing pool, and with the pool bypassed so every login hashes in
+its own thread. Reports the board list latency, the login statuses and
+the pool's stats().
+
+Fails if, with the pool, the 95th percentile of the board list latency
+during the burst exceeds --max-slowdown times the idle one. The hashing
+threads share the CPU with requests on machines with fewer cores than
+AUTH_HASH_WORKERS + 1, where the benchmark is expected to fail.
+
+Usage:
+    SECRET_KEY=dev python -m benchmarks.login_burst
+    SECRET_KEY=dev python -m benchmarks.login_burst --logins 100 --requests 50
+"""
+
+import collections
+import contextlib
+import threading
+from unittest import mock
+
+from django.db import connection
+from rest_framework.test import APIClient
+
+from auth_app.hashing import PasswordHashPool, get_hash_pool
+from boards_app.models import Board
+
+from .utils import (PASSWORD, benchmark_database, create_users, fail,
+                    milliseconds, p95, parser, timed, token_header)
+
+
+def bypass_pool():
+    """Run hashing jobs in the calling thread instead of the pool."""
+    return mock.patch.object(PasswordHashPool, 'run',
+                             lambda pool, func, *args: func(*args))
+
+
+def board_list_latency(client, count, running=None):
+    """
+    Time board list requests.
+
+    Args:
+        running (threading.Event): Stop early once it is cleared
+
+    Returns:
+        list[float]: Durations in seconds
+    """
+    durations = []
+    for _ in range(count):
+        if running is not None and not running.is_set():
+            break
+        response, seconds = timed(client.get, '/api/boards/')
+        if response.status_code != 200:
+            fail(f'GET /api/boards/ returned {response.status_code}')
+        durations.append(seconds)
+    return durations
+
+
+def burst(users, client, requests):
+    """
+    Log in every user concurrently while timing board list requests.
+
+    Returns:
+        tuple: (board list durations, Counter of login statuses)
+    """
+    statuses = collections.Counter()
+    lock = threading.Lock()
+    start = threading.Barrier(len(users) + 1)
+    running = threading.Event()
+
+    def log_in(user):
+        try:
+            start.wait()
+            response = APIClient().post(
+                '/api/login/', {'email': user.email, 'password': PASSWORD},
+                format='json')
+            with lock:
+                statuses[response.status_code] += 1
+        finally:
+            connection.close()
+
+    def wait_for_logins():
+        for thread in threads:
+            thread.join()
+        running.clear()
+
+    threads = [threading.Thread(target=log_in, args=(user,))
+               for user in users]
+    for thread in threads:
+        thread.start()
+    running.set()
+    start.wait()
+    watcher = threading.Thread(target=wait_for_logins)
+    watcher.start()
+    durations = board_list_latency(client, requests, running)
+    watcher.join()
+    return durations, statuses
+
+
+def main():
+    arguments = parser(__doc__.split('\n')[1])
+    arguments.add_argument('--logins', type=int, default=60,
+                           help="Concurrent logins of a burst.")
+    arguments.add_argument('--requests', type=int, default=20,
+                           help="Board list requests while idle and per "
+                                "burst.")
+    arguments.add_argument('--max-slowdown', type=float, default=3,
+                           help="Allowed ratio of burst to idle p95 latency.")
+    options = arguments.parse_args()
+
+    with benchmark_database(fast_hasher=False):
+        owner, = create_users(1, prefix='owner')
+        users = create_users(options.logins)
+        Board.objects.create(title='Board', owner=owner)
+        client = APIClient(**token_header(owner))
+        board_list_latency(client, 1)
+
+        idle = board_list_latency(client, options.requests)
+        print(f'Idle: GET /api/boards/ {milliseconds(idle)}')
+
+        slowest = {}
+        modes = {'pool': contextlib.nullcontext, 'no pool': bypass_pool}
+        for mode, configure in modes.items():
+            with configure():
+                durations, statuses = burst(users, client, options.requests)
+            slowest[mode] = p95(durations)
+            logins = ', '.join(f'{count} x {status}'
+                               for status, count in sorted(statuses.items()))
+            print(f'Burst, {mode}: GET /api/boards/ {milliseconds(durations)} '
+                  f'over {len(durations)} requests; logins: {logins}')
+            if mode == 'pool':
+                print(f'Pool stats: {get_hash_pool().stats()}')
+
+    limit = options.max_slowdown * p95(idle)
+    if slowest['pool'] > limit:
+        fail(f'board list p95 rose to {slowest["pool"] * 1000:.1f} ms '
+             f'during the burst (limit {limit * 1000:.1f} ms)')
+    print('Board list latency stays flat during the burst.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""
+Single task requests compared with POST /api/tasks/bulk/.
+
+Creates a number of tasks with one POST /api/tasks/ each, then creates,
+updates and deletes the same number with one bulk call per kind. Bulk
+queries grow with the database's batch size limits, not per operation;
+the benchmark fails unless every bulk call runs at most a tenth of the
+queries of the single creates.
+
+Usage:
+    SECRET_KEY=dev python -m benchmarks.task_bulk
+    SECRET_KEY=dev python -m benchmarks.task_bulk --size 200
+"""
+
+from rest_framework.test import APIClient
+
+from boards_app.models import Board
+
+from .utils import (benchmark_database, count_queries, create_users, fail,
+                    parser, timed, token_header)
+
+
+def create_operations(members, size):
+    """Return create operations assigning tasks among the members."""
+    return [{'op': 'create', 'title': f'Task {index}',
+             'assignee_id': members[index % len(members)].pk,
+             'reviewer_id': members[(index + 1) % len(members)].pk}
+            for index in range(size)]
+
+
+def create_singly(client, board, operations):
+    """Create one task per POST /api/tasks/ and return the total queries."""
+    total = 0
+    for operation in operations:
+        data = {key: value for key, value in operation.items() if key != 'op'}
+        response, queries = count_queries(
+            client.post, '/api/tasks/', {'board': board.pk, **data},
+            format='json')
+        if response.status_code != 201:
+            fail(f'POST /api/tasks/ returned {response.status_code}: '
+                 f'{response.content.decode()}')
+        total += queries
+    return total
+
+
+def bulk(client, board, operations):
+    """Send one bulk call and return its query count and duration."""
+    (response, queries), seconds = timed(
+        count_queries, client.post, '/api/tasks/bulk/',
+        {'board': board.pk, 'operations': operations}, format='json')
+    if response.status_code != 200:
+        fail(f'bulk call returned {response.status_code}')
+    return response.json(), queries, seconds
+
+
+def run_bulk(client, board, members, size):
+    """
+    Create, update and delete size tasks with one bulk call each.
+
+    Returns:
+        dict: Kind of operation -> (query count, seconds)
+    """
+    results, queries, seconds = bulk(
+        client, board, create_operations(members, size))
+    measured = {'create': (queries, seconds)}
+    ids = [result['data']['id'] for result in results['results']]
+
+    _, queries, seconds = bulk(client, board, [
+        {'op': 'update', 'id': pk, 'status': 'done', 'priority': 'high'}
+        for pk in ids])
+    measured['update'] = (queries, seconds)
+
+    _, queries, seconds = bulk(
+        client, board, [{'op': 'delete', 'id': pk} for pk in ids])
+    measured['delete'] = (queries, seconds)
+    return measured
+
+
+def main():
+    arguments = parser(__doc__.split('\n')[1])
+    arguments.add_argument('--size', type=int, default=1000,
+                           help="Tasks per run, from 10 to 1000 (the bulk "
+                                "endpoint's limit).")
+    options = arguments.parse_args()
+    if not 10 <= options.size <= 1000:
+        # Below 10 tasks the fixed queries of a bulk call are not amortized
+        arguments.error('--size must be between 10 and 1000')
+
+    with benchmark_database():
+        owner, *members = create_users(6)
+        board = Board.objects.create(title='Bulk', owner=owner)
+        board.members.add(*members)
+        client = APIClient(**token_header(owner))
+
+        single_queries, seconds = timed(
+            create_singly, client, board,
+            create_operations(members, options.size))
+        print(f'{options.size} x POST /api/tasks/: {seconds:.2f} s, '
+              f'{single_queries} queries')
+
+        measured = run_bulk(client, board, members, options.size)
+        for kind, (queries, seconds) in measured.items():
+            print(f'POST /api/tasks/bulk/ {kind} x {options.size}: '
+                  f'{seconds:.2f} s, {queries} queries')
+
+    slow = [kind for kind, (queries, _) in measured.items()
+            if queries * 10 > single_queries]
+    if slow:
+        fail(f'bulk calls run too many queries: {", ".join(slow)}')
+    print('Bulk calls run at most a tenth of the queries.')
+
+
+if __name__ == '__main__':
+    main()
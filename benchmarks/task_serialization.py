@@ -0,0 +1,103 @@
+"""
+Rows per second of TaskSerializer's read path.
+
+Loads tasks once and renders them with TaskSerializer and with the
+generic ModelSerializer.to_representation it replaced on the read path,
+for all fields and for a ?fields= subset. Fails if the outputs differ or
+the read path is not faster.
+
+Usage:
+    SECRET_KEY=dev python -m benchmarks.task_serialization
+    SECRET_KEY=dev python -m benchmarks.task_serialization --tasks 20000
+"""
+
+import contextlib
+import datetime
+from unittest import mock
+
+from rest_framework import serializers
+
+from boards_app.models import Board
+from tasks_app.api.serializers import TaskSerializer, UserSerializer
+from tasks_app.models import Task, choices_priority, choices_status
+
+from .utils import benchmark_database, create_users, fail, parser, timed
+
+SUBSET = ['id', 'title', 'status', 'assignee']
+
+
+def model_serializer():
+    """Render tasks and users with ModelSerializer.to_representation."""
+    stack = contextlib.ExitStack()
+    for serializer in (TaskSerializer, UserSerializer):
+        stack.enter_context(mock.patch.object(
+            serializer, 'to_representation',
+            serializers.ModelSerializer.to_representation))
+    return stack
+
+
+def seed_tasks(count):
+    """Create a board with count tasks assigned among its members."""
+    owner, *members = create_users(6)
+    board = Board.objects.create(title='Board', owner=owner)
+    board.members.add(*members)
+    statuses, priorities = choices_status(), choices_priority()
+    first_due = datetime.date(2026, 1, 1)
+    Task.objects.bulk_create([
+        Task(board=board, title=f'Task {index}', description='Details',
+             status=statuses[index % len(statuses)],
+             priority=priorities[index % len(priorities)],
+             assignee=members[index % len(members)],
+             reviewer=(members[(index + 1) % len(members)]
+                       if index % 3 else None),
+             due_date=first_due + datetime.timedelta(index % 90),
+             position=index)
+        for index in range(count)
+    ], batch_size=2000)
+
+
+def render(tasks, fields, repeat):
+    """Render tasks repeat times and return the data and the best time."""
+    context = {'fields': fields} if fields is not None else {}
+    best = None
+    for _ in range(repeat):
+        data, seconds = timed(
+            lambda: TaskSerializer(tasks, many=True, context=context).data)
+        best = seconds if best is None else min(best, seconds)
+    if fields is not None:
+        data = [{name: row[name] for name in fields} for row in data]
+    return data, best
+
+
+def main():
+    arguments = parser(__doc__.split('\n')[1])
+    arguments.add_argument('--tasks', type=int, default=5000,
+                           help="Serialized tasks.")
+    arguments.add_argument('--repeat', type=int, default=5,
+                           help="Renderings per variant; the fastest counts.")
+    options = arguments.parse_args()
+
+    slower = []
+    with benchmark_database():
+        seed_tasks(options.tasks)
+        tasks = list(Task.objects.for_serializer().order_by('pk'))
+        for label, fields in (('all fields', None),
+                              (f'fields={",".join(SUBSET)}', SUBSET)):
+            with model_serializer():
+                expected, before = render(tasks, fields, options.repeat)
+            data, after = render(tasks, fields, options.repeat)
+            print(f'{label}: ModelSerializer {options.tasks / before:,.0f} '
+                  f'rows/s, read path {options.tasks / after:,.0f} rows/s '
+                  f'({before / after:.1f}x)')
+            if data != expected:
+                fail(f'{label}: read path output differs from ModelSerializer')
+            if after >= before:
+                slower.append(label)
+
+    if slower:
+        fail(f'read path is not faster: {", ".join(slower)}')
+    print('The read path renders the same data faster.')
+
+
+if __name__ == '__main__':
+    main()
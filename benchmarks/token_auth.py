@@ -0,0 +1,98 @@
+"""
+Token lookups of authenticated requests with and without the token cache.
+
+Sends rounds of GET /api/boards/ requests, one per token and round, and
+counts the queries on the token table. The first round warms the cache,
+the remaining rounds are the steady state. Runs with DRF's uncached
+TokenAuthentication, with CachedTokenAuthentication's in-process cache and
+with the shared cache enabled, each with its own users. Fails unless the
+cached modes run no token query in the steady state.
+
+Local entries expire after AUTH_TOKEN_CACHE_LOCAL_TIMEOUT seconds without
+a shared cache, so keep a run shorter than that or raise the setting.
+
+Usage:
+    SECRET_KEY=dev python -m benchmarks.token_auth
+    SECRET_KEY=dev python -m benchmarks.token_auth --tokens 100 --rounds 10
+"""
+
+from unittest import mock
+
+from django.test.utils import override_settings
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.test import APIClient
+
+from auth_app.authentication import CachedTokenAuthentication
+from boards_app.models import Board
+
+from .utils import (benchmark_database, capture_queries, create_users, fail,
+                    milliseconds, parser, timed, token_header)
+
+MODES = {
+    'TokenAuthentication': lambda: mock.patch.object(
+        CachedTokenAuthentication, 'authenticate_credentials',
+        TokenAuthentication.authenticate_credentials),
+    'cached, in-process': lambda: override_settings(
+        AUTH_TOKEN_CACHE_SHARED=False),
+    'cached, shared': lambda: override_settings(
+        AUTH_TOKEN_CACHE_SHARED=True),
+}
+
+
+def token_queries(client, durations):
+    """Request the board list and return the queries on the token table."""
+    (response, queries), seconds = timed(
+        capture_queries, client.get, '/api/boards/')
+    if response.status_code != 200:
+        fail(f'GET /api/boards/ returned {response.status_code}')
+    durations.append(seconds)
+    return sum('"authtoken_token"' in sql for sql in queries)
+
+
+def run(clients, rounds):
+    """
+    Send the requests of all rounds.
+
+    Returns:
+        tuple: (token queries of the first round, of the other rounds,
+        durations in seconds)
+    """
+    durations = []
+    warm_up = sum(token_queries(client, durations) for client in clients)
+    steady = sum(token_queries(client, durations)
+                 for _ in range(rounds - 1) for client in clients)
+    return warm_up, steady, durations
+
+
+def main():
+    arguments = parser(__doc__.split('\n')[1])
+    arguments.add_argument('--tokens', type=int, default=20,
+                           help="Distinct tokens (users) per mode.")
+    arguments.add_argument('--rounds', type=int, default=20,
+                           help="Requests per token.")
+    options = arguments.parse_args()
+
+    results = {}
+    with benchmark_database():
+        for index, (mode, configure) in enumerate(MODES.items()):
+            users = create_users(options.tokens, prefix=f'mode{index}-')
+            clients = []
+            for user in users:
+                Board.objects.create(title='Board', owner=user)
+                clients.append(APIClient(**token_header(user)))
+            with configure():
+                warm_up, steady, durations = run(clients, options.rounds)
+            results[mode] = steady
+            print(f'{mode}: {warm_up} token queries in the first round, '
+                  f'{steady} in the remaining {len(durations) - len(clients)} '
+                  f'requests, {milliseconds(durations)}')
+
+    cached = {mode: steady for mode, steady in results.items()
+              if mode != 'TokenAuthentication' and steady}
+    if cached:
+        fail(f'token queries in the steady state: {cached}')
+    print('The cached modes run no token query in the steady state.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+"""
+Shared setup of the benchmarks.
+
+Benchmarks run inside benchmark_database() and seed it with the helpers
+below.
+"""
+
+import argparse
+import contextlib
+import logging
+import statistics
+import sys
+import time
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import (
+    override_settings, setup_test_environment, teardown_test_environment)
+from rest_framework.authtoken.models import Token
+
+from auth_app.models import UserProfile
+
+PASSWORD = 'benchmark-password'
+
+# Seeded users share one cheap hash; benchmarks of password hashing pass
+# fast_hasher=False to hash with the configured hashers instead
+FAST_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+
+def parser(description):
+    """Return an argument parser for a benchmark module."""
+    return argparse.ArgumentParser(description=description)
+
+
+@contextlib.contextmanager
+def benchmark_database(fast_hasher=True):
+    """
+    Run the enclosed block against a fresh test database.
+
+    Args:
+        fast_hasher (bool): Hash passwords with MD5 while the block runs,
+            so seeding and logins measure the database rather than PBKDF2
+    """
+    setup_test_environment()
+    # Benchmarks send rejected requests on purpose
+    logging.getLogger('django.request').setLevel(logging.ERROR)
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    cache.clear()
+    settings = override_settings(PASSWORD_HASHERS=FAST_HASHERS)
+    try:
+        if fast_hasher:
+            settings.enable()
+        yield
+    finally:
+        if fast_hasher:
+            settings.disable()
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def create_users(count, prefix='user', batch_size=5000):
+    """
+    Create users with profiles and tokens in bulk.
+
+    User n gets the username {prefix}{n}, the email
+    {prefix}{n}@example.com and PASSWORD as password.
+
+    Returns:
+        list[User]: Created users with their primary keys
+    """
+    password = make_password(PASSWORD)
+    users = []
+    for start in range(0, count, batch_size):
+        batch = User.objects.bulk_create([
+            User(username=f'{prefix}{index}',
+                 email=f'{prefix}{index}@example.com', password=password)
+            for index in range(start, min(start + batch_size, count))
+        ])
+        UserProfile.objects.bulk_create([
+            UserProfile(user=user, full_name=user.username.title())
+            for user in batch
+        ])
+        Token.objects.bulk_create([
+            Token(user=user, key=Token.generate_key()) for user in batch
+        ])
+        users.extend(batch)
+    return users
+
+
+def token_header(user):
+    """Return the Authorization header of a user as client keyword."""
+    return {'HTTP_AUTHORIZATION': f'Token {Token.objects.get(user=user).key}'}
+
+
+def capture_queries(func, *args, **kwargs):
+    """
+    Call func and record the SQL of the queries it runs.
+
+    Unlike CaptureQueriesContext, the record is not limited by the size of
+    the query log.
+
+    Returns:
+        tuple: (result of func, list of SQL strings)
+    """
+    queries = []
+
+    def record(execute, sql, params, many, context):
+        queries.append(sql)
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(record):
+        result = func(*args, **kwargs)
+    return result, queries
+
+
+def count_queries(func, *args, **kwargs):
+    """
+    Call func and count the queries it runs.
+
+    Returns:
+        tuple: (result of func, number of queries)
+    """
+    result, queries = capture_queries(func, *args, **kwargs)
+    return result, len(queries)
+
+
+def timed(func, *args, **kwargs):
+    """
+    Call func and measure its wall time.
+
+    Returns:
+        tuple: (result of func, elapsed seconds)
+    """
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def p95(durations):
+    """Return the 95th percentile of durations."""
+    durations = sorted(durations)
+    return durations[min(len(durations) - 1, int(len(durations) * 0.95))]
+
+
+def milliseconds(durations):
+    """Format the median and 95th percentile of durations in seconds."""
+    return (f'median {statistics.median(durations) * 1000:.2f} ms, '
+            f'p95 {p95(durations) * 1000:.2f} ms')
+
+
+def fail(message):
+    """Report a failed expectation and exit with status 1."""
+    print(f'FAILED: {message}', file=sys.stderr)
+    sys.exit(1)
@@ -21,7 +21,7 @@ class BoardAdmin(admin.ModelAdmin):
     search_fields = ['title', 'owner__username']
     list_filter = ['owner']
     filter_horizontal = ['members']  # Better UI for many-to-many fields
-    readonly_fields = ['id']
+    readonly_fields = ['id', 'version', 'changes_floor']
     
     def get_member_count(self, obj):
         """Display number of board members."""
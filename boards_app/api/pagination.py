@@ -0,0 +1,17 @@
+"""
+Board API pagination.
+
+This module defines cursor pagination classes for board endpoints.
+"""
+
+from core.pagination import OptionalCursorPagination
+
+
+class BoardCursorPagination(OptionalCursorPagination):
+    """
+    Cursor pagination for board lists.
+
+    Follows the Board Meta ordering (newest first).
+    """
+
+    ordering = '-id'
@@ -6,6 +6,8 @@ This module defines custom permission classes for board-level access control.
 
 from rest_framework.permissions import BasePermission
 
+from ..membership import has_board_access
+
 
 class IsBoardMemberOrOwner(BasePermission):
     """
@@ -32,7 +34,7 @@ class IsBoardMemberOrOwner(BasePermission):
         Returns:
             bool: True if user is owner or member, False otherwise
         """
-        return obj.owner == request.user or request.user in obj.members.all()
+        return has_board_access(obj, request.user, request)
 
     def has_permission(self, request, view):
         """
@@ -74,4 +76,4 @@ class IsBoardOwner(BasePermission):
         Returns:
             bool: True if user is owner, False otherwise
         """
-        return obj.owner == request.user
+        return obj.owner_id == request.user.pk
@@ -6,10 +6,16 @@ listing, updating, and detailed board views.
 """
 
 from django.contrib.auth.models import User
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Count
 from rest_framework import serializers
 from ..models import Board
-from tasks_app.api.serializers import TaskSerializer
-from tasks_app.models import Task
+from tasks_app.api.serializers import (
+    TaskCommentSerializer,
+    TaskSerializer,
+    user_representation
+)
+from tasks_app.models import choices_status
 
 
 class BoardListSerializer(serializers.ModelSerializer):
@@ -17,7 +23,9 @@ class BoardListSerializer(serializers.ModelSerializer):
     Serializer for board list view.
 
     Provides summary information for boards including member count,
-    task counts, and statistics for quick overview.
+    task counts, and statistics for quick overview. Counts are read from
+    the denormalized BoardStats row; load boards with
+    Board.objects.with_list_stats() to join it.
 
     Fields:
         id (int): Board unique identifier
@@ -29,32 +37,48 @@ class BoardListSerializer(serializers.ModelSerializer):
         owner_id (int): Board owner's user ID
     """
 
-    member_count = serializers.SerializerMethodField()
-    ticket_count = serializers.SerializerMethodField()
-    tasks_to_do_count = serializers.SerializerMethodField()
-    tasks_high_prio_count = serializers.SerializerMethodField()
-    owner_id = serializers.ReadOnlyField(source='owner.id')
+    member_count = serializers.IntegerField(
+        source='stats.member_count', read_only=True)
+    ticket_count = serializers.IntegerField(
+        source='stats.task_count', read_only=True)
+    tasks_to_do_count = serializers.IntegerField(
+        source='stats.to_do_count', read_only=True)
+    tasks_high_prio_count = serializers.IntegerField(
+        source='stats.high_priority_count', read_only=True)
+    owner_id = serializers.ReadOnlyField()
 
     class Meta:
         model = Board
         fields = ['id', 'title', 'member_count', 'ticket_count',
                   'tasks_to_do_count', 'tasks_high_prio_count', 'owner_id']
 
-    def get_member_count(self, obj):
-        """Return the number of board members."""
-        return obj.members.count()
+    def to_representation(self, instance):
+        """
+        Return the board summary as a plain dict.
 
-    def get_ticket_count(self, obj):
-        """Return the total number of tasks on this board."""
-        return Task.objects.filter(board=obj).count()
+        Builds the output directly from the joined stats row instead of
+        running every declared field, with the same keys and values.
 
-    def get_tasks_to_do_count(self, obj):
-        """Return the number of tasks in 'to-do' status."""
-        return Task.objects.filter(status='to-do').count()
+        Args:
+            instance (Board): Board loaded with with_list_stats()
 
-    def get_tasks_high_prio_count(self, obj):
-        """Return the number of high priority tasks on this board."""
-        return Task.objects.filter(board=obj, priority='high').count()
+        Returns:
+            dict: Serialized board summary
+        """
+        try:
+            stats = instance.stats
+        except ObjectDoesNotExist:
+            stats = None
+        return {
+            'id': instance.id,
+            'title': instance.title,
+            'member_count': stats.member_count if stats else None,
+            'ticket_count': stats.task_count if stats else None,
+            'tasks_to_do_count': stats.to_do_count if stats else None,
+            'tasks_high_prio_count': (
+                stats.high_priority_count if stats else None),
+            'owner_id': instance.owner_id,
+        }
 
 
 class BoardCreateSerializer(serializers.ModelSerializer):
@@ -121,6 +145,15 @@ class UserSerializer(serializers.ModelSerializer):
         """Retrieve full name from associated UserProfile."""
         return obj.userprofile.full_name
 
+    def to_representation(self, instance):
+        """
+        Return the user as a plain dict.
+
+        Read path shortcut: builds the output directly instead of running
+        every declared field, with the same keys and values.
+        """
+        return user_representation(instance)
+
 
 class BoardDetailSerializer(serializers.ModelSerializer):
     """
@@ -133,6 +166,7 @@ class BoardDetailSerializer(serializers.ModelSerializer):
         id (int): Board unique identifier
         title (str): Board name
         owner_id (int): Board owner's user ID
+        version (int): Board version to pass as since to the changes endpoint
         members (list): List of board members with full details
         tasks (list): All tasks associated with this board
     """
@@ -143,12 +177,78 @@ class BoardDetailSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Board
-        fields = ['id', 'title', 'owner_id', 'members', 'tasks']
+        fields = ['id', 'title', 'owner_id', 'version', 'members', 'tasks']
 
     def get_tasks(self, obj):
-        """Retrieve all tasks for this board with full details."""
-        tasks = Task.objects.filter(board=obj)
-        return TaskSerializer(tasks, many=True).data
+        """
+        Retrieve all tasks for this board with full details.
+
+        Uses the prefetched task_set when available (see
+        BoardViewSet.get_detail_queryset) to avoid per-board queries.
+        """
+        return TaskSerializer(obj.task_set.all(), many=True).data
+
+
+class BoardShellSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the board shell without tasks.
+
+    Used by GET /api/boards/{id}/?tasks=none so clients can render the board
+    frame immediately and load task columns lazily.
+
+    Fields:
+        id (int): Board unique identifier
+        title (str): Board name
+        owner_id (int): Board owner's user ID
+        version (int): Board version to pass as since to the changes endpoint
+        members (list): List of board members with full details
+    """
+
+    owner_id = serializers.ReadOnlyField(source='owner.id')
+    members = UserSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Board
+        fields = ['id', 'title', 'owner_id', 'version', 'members']
+
+
+class BoardSummarySerializer(BoardShellSerializer):
+    """
+    Serializer for the board shell with per-status task counts.
+
+    Used by GET /api/boards/{id}/?tasks=summary.
+
+    Fields:
+        task_counts (dict): Number of tasks per status, including empty columns
+    """
+
+    task_counts = serializers.SerializerMethodField()
+
+    class Meta(BoardShellSerializer.Meta):
+        fields = BoardShellSerializer.Meta.fields + ['task_counts']
+
+    def get_task_counts(self, obj):
+        """Return the number of tasks per status in a single GROUP BY query."""
+        counts = dict.fromkeys(choices_status(), 0)
+        rows = (obj.task_set.order_by().values('status')
+                .annotate(total=Count('pk')))
+        for row in rows:
+            counts[row['status']] = row['total']
+        return counts
+
+
+class ChangedCommentSerializer(TaskCommentSerializer):
+    """
+    Serializer for comments returned by the board changes endpoint.
+
+    Fields:
+        task_id (int): Task the comment belongs to
+    """
+
+    task_id = serializers.ReadOnlyField()
+
+    class Meta(TaskCommentSerializer.Meta):
+        fields = TaskCommentSerializer.Meta.fields + ['task_id']
 
 
 class BoardUpdateSerializer(serializers.ModelSerializer):
@@ -0,0 +1,254 @@
+"""
+Board event stream.
+
+This module contains the server-sent events endpoint that pushes board
+events to connected clients. It is an async view, so under an ASGI server
+an idle connection costs a coroutine and a queue instead of a worker
+thread.
+
+EventSource cannot send headers, so browsers authenticate with a stream
+ticket in the query string instead of their API token: a signed value
+naming one user and one board that expires after
+BOARD_EVENTS_TICKET_MAX_AGE seconds, so a URL that ends up in access logs
+or browser history grants nothing lasting.
+"""
+
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core import signing
+from django.http import JsonResponse, StreamingHttpResponse
+from rest_framework import exceptions
+
+from auth_app.authentication import CachedTokenAuthentication
+from ..broker import get_broker
+from ..changes import change_event
+from ..membership import has_board_access
+from ..models import Board, BoardChange
+
+
+def _format_event(name, data, event_id=None):
+    """
+    Encode one server-sent event.
+
+    Args:
+        name (str): Event name
+        data (dict): JSON payload
+        event_id (int): Event ID the client resumes from (optional)
+
+    Returns:
+        str: Event in text/event-stream format
+    """
+    lines = [] if event_id is None else [f'id: {event_id}']
+    lines += [f'event: {name}', f'data: {json.dumps(data)}']
+    return '\n'.join(lines) + '\n\n'
+
+
+def _format_change(event):
+    """Encode a board event as a server-sent event named kind.action."""
+    return _format_event(
+        f"{event['kind']}.{event['action']}", event, event['version'])
+
+
+_TICKET_SALT = 'boards_app.events.ticket'
+
+
+def _ticket_max_age():
+    """Return the lifetime of stream tickets in seconds."""
+    return getattr(settings, 'BOARD_EVENTS_TICKET_MAX_AGE', 60)
+
+
+def issue_ticket(user, board):
+    """
+    Return a stream ticket of a user for the event stream of a board.
+
+    Args:
+        user (User): Authenticated user with access to the board
+        board (Board): Board to stream
+
+    Returns:
+        dict: ticket and expires_in (seconds)
+    """
+    ticket = signing.dumps(
+        {'user': user.pk, 'board': board.pk}, salt=_TICKET_SALT)
+    return {'ticket': ticket, 'expires_in': _ticket_max_age()}
+
+
+def _get_ticket_user(ticket, pk):
+    """
+    Return the user of a stream ticket for a board.
+
+    Raises:
+        AuthenticationFailed: If the ticket is invalid, expired, issued
+        for another board or its user is inactive
+    """
+    try:
+        data = signing.loads(
+            ticket, salt=_TICKET_SALT, max_age=_ticket_max_age())
+    except signing.BadSignature:
+        raise exceptions.AuthenticationFailed('Invalid or expired ticket.')
+    if data.get('board') != pk:
+        raise exceptions.AuthenticationFailed('Invalid or expired ticket.')
+    user = User.objects.filter(pk=data.get('user'), is_active=True).first()
+    if user is None:
+        raise exceptions.AuthenticationFailed('User inactive or deleted.')
+    return user
+
+
+def _authenticate(request, pk):
+    """Return the user of a request's Authorization header or ticket."""
+    keyword, _, key = request.headers.get('Authorization', '').partition(' ')
+    if keyword == 'Token' and key:
+        user, _ = CachedTokenAuthentication().authenticate_credentials(key)
+        return user
+    ticket = request.GET.get('ticket')
+    if ticket:
+        return _get_ticket_user(ticket, pk)
+    raise exceptions.NotAuthenticated()
+
+
+def _get_last_event_id(request):
+    """Return the Last-Event-ID of a reconnecting client, if any."""
+    value = (request.headers.get('Last-Event-ID')
+             or request.GET.get('last_event_id', ''))
+    return int(value) if value.isdigit() else None
+
+
+@sync_to_async
+def _authorize(request, pk):
+    """
+    Authenticate the request and check access to the board.
+
+    Raises:
+        NotAuthenticated: If neither a token nor a ticket is given
+        AuthenticationFailed: If the token or ticket is invalid
+        NotFound: If the board does not exist
+        PermissionDenied: If the user is neither owner nor member
+    """
+    user = _authenticate(request, pk)
+    board = Board.objects.only('pk', 'owner_id').filter(pk=pk).first()
+    if board is None:
+        raise exceptions.NotFound()
+    if not has_board_access(board, user):
+        raise exceptions.PermissionDenied(
+            "You must be a member or owner of this board.")
+    return user
+
+
+@sync_to_async
+def _load_replay(pk, since):
+    """
+    Return the board version and the events a client missed.
+
+    Returns:
+        tuple: Current version (None if the board was deleted) and the
+        missed events (None if they can no longer be replayed)
+    """
+    board = (Board.objects.only('pk', 'version', 'changes_floor')
+             .filter(pk=pk).first())
+    if board is None:
+        return None, []
+    if since is None:
+        return board.version, []
+    if since < board.changes_floor or since > board.version:
+        return board.version, None
+    entries = (BoardChange.objects
+               .filter(board=board, version__gt=since,
+                       version__lte=board.version)
+               .order_by('version', 'pk'))
+    return board.version, [change_event(entry) for entry in entries]
+
+
+@sync_to_async
+def _still_visible(pk, user):
+    """Return whether the user can still see the board, bypassing caches."""
+    return Board.objects.visible_to(user).filter(pk=pk).exists()
+
+
+async def _stream(pk, user, last_event_id):
+    """
+    Yield the events of a board until access is lost or it is deleted.
+
+    The stream subscribes before reading the replay, so no event published
+    in between is lost; events already covered by the replay are skipped.
+    """
+    heartbeat = getattr(settings, 'BOARD_EVENTS_HEARTBEAT', 15)
+    async with get_broker().subscribe(pk) as subscription:
+        version, replay = await _load_replay(pk, last_event_id)
+        if version is None:
+            yield _format_event('board.deleted', {'board': pk, 'id': pk})
+            return
+        if replay is None:
+            yield _format_event('reset', {'version': version})
+        elif replay:
+            yield ''.join(_format_change(event) for event in replay)
+        yield _format_event('ready', {'version': version}, version)
+
+        while True:
+            events = await subscription.get(timeout=heartbeat)
+            if subscription.overflowed:
+                yield _format_event('reset', {'version': version})
+                return
+            if events is None:
+                yield ': keepalive\n\n'
+                continue
+
+            chunk = []
+            recheck = False
+            for event in events:
+                if event['version'] is None:
+                    yield ''.join(chunk) + _format_change(event)
+                    return
+                if event['version'] <= version:
+                    continue
+                chunk.append(_format_change(event))
+                version = event['version']
+                recheck = recheck or event['kind'] in ('board', 'member')
+            if chunk:
+                yield ''.join(chunk)
+            if recheck and not await _still_visible(pk, user):
+                return
+
+
+async def board_events(request, pk):
+    """
+    Stream the events of a board as server-sent events.
+
+    GET /api/boards/{id}/events/
+
+    Events are named kind.action (e.g. task.created, comment.deleted,
+    member.created) and carry board, version, kind, id and action; use the
+    changes endpoint to fetch the changed objects. Reconnecting clients
+    send Last-Event-ID and receive the events they missed, or a reset event
+    if those were compacted away. A ready event marks the end of the
+    replay; comment lines are sent as heartbeats.
+
+    Authentication:
+        Authorization: Token <key> header or ?ticket=<ticket> query
+        parameter, issued by POST /api/boards/{id}/events/ticket/
+
+    Args:
+        request: HTTP request
+        pk (int): Board ID
+
+    Returns:
+        StreamingHttpResponse: text/event-stream, or a JSON error response
+        (401, 403, 404)
+    """
+    if request.method != 'GET':
+        return JsonResponse(
+            {"detail": f'Method "{request.method}" not allowed.'}, status=405)
+    try:
+        user = await _authorize(request, pk)
+    except exceptions.APIException as exc:
+        return JsonResponse({"detail": str(exc.detail)},
+                            status=exc.status_code)
+
+    response = StreamingHttpResponse(
+        _stream(pk, user, _get_last_event_id(request)),
+        content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
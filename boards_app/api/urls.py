@@ -1,12 +1,14 @@
 """
 Board API URL configuration.
 
-Defines URL patterns for board management and email lookup endpoints.
+Defines URL patterns for board management, the board event stream and
+email lookup endpoints.
 Uses DRF Router for automatic ViewSet URL generation.
 """
 
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
+from .streams import board_events
 from .views import BoardViewSet, EmailCheck
 
 
@@ -17,6 +19,9 @@ router.register(r'boards', BoardViewSet, basename='board')
 urlpatterns = [
     # Email lookup endpoint for finding users to add as board members
     path('email-check/', EmailCheck.as_view(), name='email-check'),
+
+    # Server-sent event stream of one board (async view, serve via ASGI)
+    path('boards/<int:pk>/events/', board_events, name='board-events'),
     
     # Board endpoints (list, create, retrieve, update, delete)
     # /api/boards/ - GET (list), POST (create)
@@ -6,20 +6,45 @@ and utility endpoints like email checking for user lookup.
 """
 
 from django.contrib.auth.models import User
+from django.db.models import Prefetch
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.http import urlencode
 from rest_framework import viewsets, status, views
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-
+from rest_framework.throttling import ScopedRateThrottle
+
+from auth_app.lookup import (
+    MIN_PREFIX_LENGTH, find_user_by_email, find_users_by_email_prefix)
+from core.conditional import (
+    compute_etag, not_modified_response, set_validators)
+from core.streaming import StreamingJSONResponse, stream_rows, wants_stream
+from tasks_app.api.pagination import TaskColumnCursorPagination
+from tasks_app.api.serializers import TaskSerializer, user_representation
+from tasks_app.models import Task, TaskComment, choices_status
+from ..cache import get_board_peer_ids, get_visible_board_ids
+from ..changes import collect_changes
 from ..models import Board
+from .pagination import BoardCursorPagination
 from .permissions import IsBoardMemberOrOwner
+from .streams import issue_ticket
 from .serializers import (
     BoardListSerializer,
     BoardCreateSerializer,
     BoardDetailSerializer,
+    BoardShellSerializer,
+    BoardSummarySerializer,
     BoardUpdatedSerializer,
-    BoardUpdateSerializer
+    BoardUpdateSerializer,
+    ChangedCommentSerializer,
+    UserSerializer
 )
 
+TASK_MODES = ['full', 'summary', 'none', 'page']
+
 
 class BoardViewSet(viewsets.ModelViewSet):
     """
@@ -32,16 +57,39 @@ class BoardViewSet(viewsets.ModelViewSet):
         GET /api/boards/ - List user's boards (owned or member)
         POST /api/boards/ - Create new board
         GET /api/boards/{id}/ - Retrieve board details
+        GET /api/boards/{id}/tasks/ - Cursor-paginated tasks of one board
+        GET /api/boards/{id}/changes/?since=N - Changes after version N
+        POST /api/boards/{id}/events/ticket/ - Ticket for the event stream
         PUT/PATCH /api/boards/{id}/ - Update board
         DELETE /api/boards/{id}/ - Delete board (owner only)
 
+    Query Parameters (retrieve):
+        tasks (str): How tasks are embedded in the board detail
+            - full (default): All tasks with full details
+            - summary: Only per-status task counts
+            - none: No task data
+            - page: First page of every status column
+        stream (bool): With tasks=full, stream the tasks row by row
+            instead of rendering the whole document at once
+
     Permissions:
         - IsAuthenticated: User must be logged in
         - IsBoardMemberOrOwner: User must be owner or member for object-level access
+
+    Pagination:
+        List is cursor-paginated when page_size or cursor is given.
+
+    Conditional requests:
+        Retrieve and tasks responses carry ETag and Last-Modified headers
+        derived from board versions and answer If-None-Match /
+        If-Modified-Since with 304 before any serialization. List
+        responses only carry an ETag, since removing a board from the
+        list does not advance any timestamp.
     """
 
     queryset = Board.objects.all()
     permission_classes = [IsAuthenticated, IsBoardMemberOrOwner]
+    pagination_class = BoardCursorPagination
     lookup_field = 'pk'
 
     def get_serializer_class(self):
@@ -57,24 +105,354 @@ class BoardViewSet(viewsets.ModelViewSet):
             return BoardCreateSerializer
         elif self.action in ['update', 'partial_update']:
             return BoardUpdateSerializer
+        elif self.action == 'retrieve':
+            mode = self.get_tasks_mode()
+            if mode == 'summary':
+                return BoardSummarySerializer
+            if mode in ['none', 'page']:
+                return BoardShellSerializer
         return BoardDetailSerializer
 
+    def get_tasks_mode(self):
+        """
+        Return the requested task embedding mode for board detail.
+
+        Returns:
+            str: One of TASK_MODES
+
+        Raises:
+            ValidationError: If the tasks query parameter is invalid
+        """
+        mode = self.request.query_params.get('tasks', 'full')
+        if mode not in TASK_MODES:
+            raise ValidationError(
+                {"tasks": f"Must be one of: {', '.join(TASK_MODES)}."})
+        return mode
+
     def get_queryset(self):
         """
         Return boards based on action.
 
-        For list action: Return only boards where user is owner or member.
-        For detail actions (retrieve, update, delete): Return all boards,
-        permission check will handle access control.
+        For list action: Return only boards where user is owner or member,
+        resolved from the membership cache and joined with the statistics
+        rendered by BoardListSerializer.
+        For retrieve action: Return all boards with the prefetch plan used by
+        the board detail serializers; tasks are only prefetched in full mode.
+        For other detail actions (update, delete, tasks, changes,
+        events_ticket): Return all boards, permission check will handle
+        access control.
 
         Returns:
             QuerySet: Board queryset
         """
         user = self.request.user
-        if self.action in ['retrieve', 'update', 'partial_update', 'destroy']:
+        if self.action == 'retrieve':
+            return self.get_detail_queryset(
+                include_tasks=self.get_tasks_mode() == 'full')
+        if self.action in ['update', 'partial_update', 'destroy', 'tasks',
+                           'changes', 'events_ticket']:
             return Board.objects.all()
-        return (Board.objects.filter(owner=user) |
-                Board.objects.filter(members=user)).distinct()
+        board_ids = get_visible_board_ids(user.pk)
+        return Board.objects.filter(pk__in=board_ids).with_list_stats()
+
+    def get_detail_queryset(self, include_tasks=True):
+        """
+        Return boards prefetched for detailed serialization.
+
+        Loads the owner with a join, members with their profiles, and tasks
+        with assignee/reviewer profiles and an annotated comment count, so
+        a board is serialized with a fixed number of queries regardless of
+        how many tasks and members it has.
+
+        Args:
+            include_tasks (bool): Whether to prefetch the board's tasks
+
+        Returns:
+            QuerySet: Board queryset with related data prefetched
+        """
+        members = User.objects.select_related('userprofile')
+        queryset = Board.objects.select_related('owner').prefetch_related(
+            Prefetch('members', queryset=members))
+        if include_tasks:
+            queryset = queryset.prefetch_related(
+                Prefetch('task_set', queryset=self.get_task_queryset()))
+        return queryset
+
+    def get_task_queryset(self):
+        """
+        Return tasks prepared for TaskSerializer.
+
+        Returns:
+            QuerySet: Task queryset with assignee/reviewer profiles joined,
+            comments_count annotated and ordered by column position
+        """
+        return Task.objects.for_serializer().order_by('position', 'id')
+
+    def get_etag(self, board_versions):
+        """
+        Return the ETag of the current request's representation.
+
+        Args:
+            board_versions (list): (board ID, version) pairs the response
+                is built from
+
+        Returns:
+            str: Quoted ETag value
+        """
+        return compute_etag(
+            self.action,
+            self.request.user.pk,
+            board_versions,
+            sorted(self.request.query_params.lists()),
+        )
+
+    def list(self, request, *args, **kwargs):
+        """
+        List boards where user is owner or member.
+
+        Board versions are read in one query to answer conditional requests
+        before the list is serialized. No Last-Modified header is sent: a
+        board leaving the list (deleted, or the user removed as a member)
+        does not advance the timestamp of any remaining board.
+
+        Args:
+            request: HTTP request
+
+        Returns:
+            Response: Board list (200) or Not Modified (304)
+        """
+        rows = (Board.objects
+                .filter(pk__in=get_visible_board_ids(request.user.pk))
+                .order_by('pk')
+                .values_list('pk', 'version'))
+        etag = self.get_etag(list(rows))
+
+        response = not_modified_response(request, etag)
+        if response is None:
+            response = super().list(request, *args, **kwargs)
+        return set_validators(response, etag)
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Retrieve board details.
+
+        The board version is checked first so that conditional requests are
+        answered without loading members and tasks. In page mode the board
+        shell is returned with the first page of every status column; the
+        next links point to the tasks endpoint.
+
+        Args:
+            request: HTTP request
+
+        Returns:
+            Response: Board detail data (200) or Not Modified (304)
+        """
+        board = get_object_or_404(
+            Board.objects.only('pk', 'owner_id', 'version', 'updated_at'),
+            pk=kwargs[self.lookup_field])
+        self.check_object_permissions(request, board)
+
+        etag = self.get_etag([(board.pk, board.version)])
+        response = not_modified_response(request, etag, board.updated_at)
+        if response is not None:
+            return response
+
+        if self.get_tasks_mode() == 'full' and wants_stream(request):
+            response = self.stream_board(board)
+            return set_validators(response, etag, board.updated_at)
+
+        if self.get_tasks_mode() != 'page':
+            response = super().retrieve(request, *args, **kwargs)
+            return set_validators(response, etag, board.updated_at)
+
+        board = self.get_object()
+        data = self.get_serializer(board).data
+        data['tasks'] = {
+            task_status: self.get_task_column(board, task_status)
+            for task_status in choices_status()
+        }
+        return set_validators(Response(data), etag, board.updated_at)
+
+    def stream_board(self, board):
+        """
+        Return the board detail with its tasks streamed row by row.
+
+        Produces the same document as the full mode, but the tasks are read
+        in chunks and written out while they are serialized instead of
+        being collected in memory first.
+
+        Args:
+            board (Board): Board to render
+
+        Returns:
+            StreamingJSONResponse: Streamed board detail
+        """
+        board = self.get_detail_queryset(include_tasks=False).get(pk=board.pk)
+        data = BoardShellSerializer(
+            board, context=self.get_serializer_context()).data
+        tasks = self.get_task_queryset().filter(board=board)
+        data['tasks'] = stream_rows(tasks, TaskSerializer())
+        return StreamingJSONResponse(data)
+
+    def get_task_column(self, board, task_status):
+        """
+        Return the first page of one status column of a board.
+
+        Args:
+            board (Board): Board whose tasks are listed
+            task_status (str): Status column to return
+
+        Returns:
+            dict: Column page with next link and results
+        """
+        paginator = TaskColumnCursorPagination()
+        tasks = self.get_task_queryset().filter(
+            board=board, status=task_status)
+        page = paginator.paginate_queryset(tasks, self.request, view=self)
+        params = {'status': task_status}
+        page_size = self.request.query_params.get(
+            paginator.page_size_query_param)
+        if page_size:
+            params[paginator.page_size_query_param] = page_size
+        url = reverse('board-tasks', kwargs={'pk': board.pk})
+        paginator.base_url = self.request.build_absolute_uri(
+            f'{url}?{urlencode(params)}')
+        return {
+            'next': paginator.get_next_link(),
+            'results': TaskSerializer(page, many=True).data,
+        }
+
+    @action(detail=True, methods=['get'])
+    def tasks(self, request, pk=None):
+        """
+        List the tasks of a board, optionally restricted to one status.
+
+        GET /api/boards/{id}/tasks/?status=to-do
+
+        Args:
+            request: HTTP request with optional status, page_size and
+                cursor query parameters
+
+        Returns:
+            Response: Cursor-paginated task data (200), Not Modified (304)
+            or validation error (400)
+        """
+        board = self.get_object()
+        etag = self.get_etag([(board.pk, board.version)])
+        response = not_modified_response(request, etag, board.updated_at)
+        if response is not None:
+            return response
+
+        tasks = self.get_task_queryset().filter(board=board)
+
+        task_status = request.query_params.get('status')
+        if task_status is not None:
+            if task_status not in choices_status():
+                raise ValidationError({"status": (
+                    f"Must be one of: {', '.join(choices_status())}.")})
+            tasks = tasks.filter(status=task_status)
+
+        paginator = TaskColumnCursorPagination()
+        page = paginator.paginate_queryset(tasks, request, view=self)
+        serializer = TaskSerializer(page, many=True)
+        response = paginator.get_paginated_response(serializer.data)
+        return set_validators(response, etag, board.updated_at)
+
+    @action(detail=True, methods=['get'])
+    def changes(self, request, pk=None):
+        """
+        Return what changed on a board after a version.
+
+        GET /api/boards/{id}/changes/?since=42
+
+        Changed objects are returned in their current state; objects that
+        were deleted or left the board are listed as tombstones under
+        deleted. Comments of deleted tasks are not listed individually.
+        The returned version is the since value for the next request.
+
+        Args:
+            request: HTTP request with the since query parameter
+
+        Returns:
+            Response: Board changes (200), validation error (400) or
+            Gone (410) if the changes can no longer be replayed
+        """
+        board = self.get_object()
+        since = request.query_params.get('since', '')
+        if not since.isdigit():
+            raise ValidationError(
+                {"since": "A non-negative board version is required."})
+        since = int(since)
+        if since < board.changes_floor or since > board.version:
+            return Response(
+                {"detail": ("Changes are no longer available, "
+                            "reload the board."),
+                 "version": board.version},
+                status=status.HTTP_410_GONE
+            )
+
+        changed = collect_changes(board, since)
+        members = (board.members.filter(pk__in=changed['member'])
+                   .select_related('userprofile'))
+        users = (User.objects.filter(pk__in=changed['user'])
+                 .select_related('userprofile'))
+        tasks = self.get_task_queryset().filter(
+            board=board, pk__in=changed['task'])
+        comments = (TaskComment.objects
+                    .filter(task__board=board, pk__in=changed['comment'])
+                    .select_related('author__userprofile'))
+
+        data = {
+            'version': board.version,
+            'board': None,
+            'members': UserSerializer(members, many=True).data,
+            'users': UserSerializer(users, many=True).data,
+            'tasks': TaskSerializer(tasks, many=True).data,
+            'comments': ChangedCommentSerializer(comments, many=True).data,
+        }
+        if changed['board']:
+            data['board'] = {'id': board.pk, 'title': board.title,
+                             'owner_id': board.owner_id}
+        data['deleted'] = {
+            'members': self.get_tombstones(changed['member'], data['members']),
+            'tasks': self.get_tombstones(changed['task'], data['tasks']),
+            'comments': self.get_tombstones(
+                changed['comment'], data['comments']),
+        }
+        return Response(data)
+
+    @action(detail=True, methods=['post'], url_path='events/ticket')
+    def events_ticket(self, request, pk=None):
+        """
+        Issue a short-lived ticket for the event stream of a board.
+
+        POST /api/boards/{id}/events/ticket/
+
+        EventSource cannot send the Authorization header; the ticket is
+        passed as ?ticket= to /api/boards/{id}/events/ instead of the API
+        token and only opens that board's stream until it expires.
+
+        Args:
+            request: HTTP request
+
+        Returns:
+            Response: ticket and expires_in (seconds)
+        """
+        board = self.get_object()
+        return Response(issue_ticket(request.user, board))
+
+    def get_tombstones(self, changed_ids, items):
+        """
+        Return the changed IDs that are no longer part of the board.
+
+        Args:
+            changed_ids (set): IDs recorded in the change log
+            items (list): Serialized objects still on the board
+
+        Returns:
+            list: Sorted IDs of deleted objects
+        """
+        return sorted(changed_ids - {item['id'] for item in items})
 
     def create(self, request, *args, **kwargs):
         """
@@ -90,6 +468,7 @@ class BoardViewSet(viewsets.ModelViewSet):
             data=request.data, context={'request': request})
         serializer.is_valid(raise_exception=True)
         board = serializer.save()
+        board = Board.objects.with_list_stats().get(pk=board.pk)
         return Response(
             BoardListSerializer(board).data,
             status=status.HTTP_201_CREATED
@@ -163,52 +542,87 @@ class EmailCheck(views.APIView):
     API endpoint for user lookup by email.
 
     GET /api/email-check/?email=user@example.com
+    GET /api/email-check/?prefix=use
 
     Allows authenticated users to search for other users by email address
-    to add them as board members.
+    to add them as board members. Emails are matched ignoring case through
+    an index. The prefix mode autocompletes the member picker while the
+    user types; it only lists users who already share a board with the
+    requesting user, so it cannot be used to enumerate the emails of all
+    accounts. Requests are rate limited per user with the 'email-check'
+    throttle scope.
 
     Permissions:
         - IsAuthenticated: User must be logged in
 
     Query Parameters:
         email (str): Email address to search for
+        prefix (str): Start of the email addresses to list, at least
+            MIN_PREFIX_LENGTH characters; used when email is not given
 
     Returns:
-        200: User found with id, email, and fullname
-        400: Email parameter missing
+        200: User found with id, email, and fullname, or a list of up to
+            PREFIX_LIMIT such users sharing a board with the requesting
+            user, ordered by email, in prefix mode
+        400: Email parameter missing or prefix too short
         404: No user found with given email
+        429: Too many lookups
     """
 
     permission_classes = [IsAuthenticated]
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = 'email-check'
 
     def get(self, request):
         """
-        Search for user by email address.
+        Search for user by email address or list users by email prefix.
+
+        Both lookups take one query with the profile joined; the prefix
+        mode reads the boards of the user from the membership cache.
 
         Args:
-            request: HTTP request with email query parameter
+            request: HTTP request with email or prefix query parameter
 
         Returns:
-            Response: User data or error message
+            Response: User data, list of user data or error message
         """
         email = request.query_params.get('email')
+        prefix = request.query_params.get('prefix')
+        if not email and prefix is not None:
+            return self.autocomplete(request, prefix)
         if not email:
             return Response(
                 {"Error": "Email Paramater is missing"},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        try:
-            user = User.objects.get(email=email)
-            fullname = user.userprofile.full_name
-
-            return Response({
-                "id": user.id,
-                "email": user.email,
-                "fullname": fullname
-            })
-        except User.DoesNotExist:
+        user = find_user_by_email(email)
+        if user is None:
             return Response(
                 {"Error": "No Profile with this email found !"},
                 status=status.HTTP_404_NOT_FOUND
             )
+        return Response(user_representation(user))
+
+    def autocomplete(self, request, prefix):
+        """
+        List the users on the requesting user's boards whose email starts
+        with a prefix.
+
+        Args:
+            request: HTTP request
+            prefix (str): Start of the email addresses
+
+        Returns:
+            Response: List of user data or error message (400)
+        """
+        prefix = prefix.strip()
+        if len(prefix) < MIN_PREFIX_LENGTH:
+            return Response(
+                {"Error": (f"Prefix needs at least {MIN_PREFIX_LENGTH} "
+                           "characters")},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        users = find_users_by_email_prefix(
+            prefix, user_ids=get_board_peer_ids(request.user.pk))
+        return Response([user_representation(user) for user in users])
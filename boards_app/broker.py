@@ -0,0 +1,205 @@
+"""
+Board event broker.
+
+Delivers board events published by the write paths (see
+boards_app.changes) to the server-sent event streams of connected
+clients. The in-process broker works for a single server process; set
+REDIS_URL (or BOARD_EVENTS_BROKER) to fan events out between processes
+through Redis or any Redis-compatible server.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """
+    Event queue of one connected stream.
+
+    Events are handed over from writer threads to the stream's event loop.
+    A subscriber that falls too far behind is marked as overflowed instead
+    of buffering without bound; its stream tells the client to resync.
+    """
+
+    def __init__(self, loop, maxsize=1000):
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=maxsize)
+        self.overflowed = False
+
+    def put(self, events):
+        """Schedule a batch of events for delivery; safe from any thread."""
+        try:
+            self.loop.call_soon_threadsafe(self._put, events)
+        except RuntimeError:
+            # The stream's event loop is already closed.
+            pass
+
+    def _put(self, events):
+        try:
+            self.queue.put_nowait(events)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    async def get(self, timeout=None):
+        """
+        Wait for the next batch of events.
+
+        Args:
+            timeout (float): Seconds to wait (optional)
+
+        Returns:
+            list | None: Events, or None if the timeout expired
+        """
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class InProcessBroker:
+    """
+    Publish/subscribe broker for streams served by the current process.
+    """
+
+    def __init__(self):
+        self._subscriptions = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def publish(self, board_id, events):
+        """
+        Deliver events to every subscriber of a board.
+
+        Args:
+            board_id (int): Board the events belong to
+            events (list): Event dicts
+        """
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(board_id, ()))
+        for subscription in subscriptions:
+            subscription.put(events)
+
+    @asynccontextmanager
+    async def subscribe(self, board_id):
+        """
+        Subscribe to the events of a board for the duration of the block.
+
+        Args:
+            board_id (int): Board to subscribe to
+
+        Yields:
+            Subscription: Queue receiving event batches
+        """
+        subscription = Subscription(asyncio.get_running_loop())
+        with self._lock:
+            self._subscriptions[board_id].add(subscription)
+        try:
+            yield subscription
+        finally:
+            with self._lock:
+                subscriptions = self._subscriptions[board_id]
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[board_id]
+
+
+class RedisBroker(InProcessBroker):
+    """
+    Broker relaying events through Redis pub/sub.
+
+    Events are published to one channel per board. Each process keeps a
+    single pattern subscription and fans received events out to its local
+    subscribers, so the number of Redis connections does not grow with the
+    number of connected clients. Requires the redis package.
+    """
+
+    channel_prefix = 'kanmind:board:'
+
+    def __init__(self, url=None):
+        try:
+            import redis
+        except ImportError:
+            raise ImproperlyConfigured(
+                "RedisBroker requires the redis package (pip install redis).")
+
+        super().__init__()
+        self._url = url or settings.REDIS_URL
+        self._client = redis.Redis.from_url(self._url)
+        self._listener = None
+
+    def publish(self, board_id, events):
+        """Publish events to the board's Redis channel."""
+        self._client.publish(
+            f'{self.channel_prefix}{board_id}', json.dumps(events))
+
+    @asynccontextmanager
+    async def subscribe(self, board_id):
+        """Subscribe locally, starting the Redis listener if needed."""
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+        async with super().subscribe(board_id) as subscription:
+            yield subscription
+
+    async def _listen(self):
+        """Forward events received from Redis to local subscribers."""
+        from redis import asyncio as aioredis
+
+        while True:
+            client = aioredis.Redis.from_url(self._url)
+            try:
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                await pubsub.psubscribe(f'{self.channel_prefix}*')
+                async for message in pubsub.listen():
+                    if message['type'] != 'pmessage':
+                        continue
+                    board_id = int(message['channel'].rsplit(b':', 1)[1])
+                    super().publish(board_id, json.loads(message['data']))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Board event listener failed, reconnecting.")
+                await asyncio.sleep(1)
+            finally:
+                await client.aclose()
+
+
+@lru_cache(maxsize=None)
+def get_broker():
+    """Return the broker configured by BOARD_EVENTS_BROKER."""
+    path = getattr(settings, 'BOARD_EVENTS_BROKER',
+                   'boards_app.broker.InProcessBroker')
+    return import_string(path)()
+
+
+def publish_events(events):
+    """
+    Publish board events once the current transaction commits.
+
+    Args:
+        events (list): Event dicts with a board key
+    """
+    by_board = defaultdict(list)
+    for event in events:
+        by_board[event['board']].append(event)
+
+    def publish():
+        broker = get_broker()
+        for board_id, board_events in by_board.items():
+            try:
+                broker.publish(board_id, board_events)
+            except Exception:
+                logger.exception("Publishing board events failed.")
+
+    if by_board:
+        transaction.on_commit(publish)
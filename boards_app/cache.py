@@ -0,0 +1,150 @@
+"""
+Cross-request board membership cache.
+
+This module stores "members of board Y" and "boards visible to user X" in
+Django's cache framework, so read-heavy endpoints can resolve access
+without touching the database.
+
+Entries are keyed by a per-board or per-user version. Writers bump the
+version after their transaction commits instead of deleting entries, so a
+reader that loaded stale rows while a membership edit was in flight can
+only store them under a version nobody reads anymore.
+"""
+
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import Board
+
+
+def _timeout():
+    """Return the lifetime of cached membership entries in seconds."""
+    return getattr(settings, 'BOARD_CACHE_TIMEOUT', 300)
+
+
+def _get_version(key):
+    """
+    Return the current version stored under key, initializing it if needed.
+
+    New versions start from the current time in nanoseconds, so a version
+    key that was evicted never restarts at a value used before.
+    """
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def _bump_version(key):
+    """Move the version stored under key forward."""
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+def _board_version_key(board_id):
+    return f'boards:board:{board_id}:version'
+
+
+def _user_version_key(user_id):
+    return f'boards:user:{user_id}:version'
+
+
+def get_board_members(board_id):
+    """
+    Return the owner and member IDs of a board.
+
+    Args:
+        board_id (int): Board ID
+
+    Returns:
+        dict | None: {'owner_id': int, 'member_ids': frozenset}, or None if
+        the board does not exist
+    """
+    version = _get_version(_board_version_key(board_id))
+    key = f'boards:board:{board_id}:members:{version}'
+    data = cache.get(key)
+    if data is not None:
+        return data or None
+
+    owner_id = (Board.objects.filter(pk=board_id)
+                .values_list('owner_id', flat=True).first())
+    if owner_id is None:
+        data = {}
+    else:
+        member_ids = Board.members.through.objects.filter(
+            board_id=board_id).values_list('user_id', flat=True)
+        data = {'owner_id': owner_id, 'member_ids': frozenset(member_ids)}
+    cache.set(key, data, _timeout())
+    return data or None
+
+
+def get_visible_board_ids(user_id):
+    """
+    Return the IDs of boards a user owns or is a member of.
+
+    Args:
+        user_id (int): User ID
+
+    Returns:
+        frozenset: Board IDs visible to the user
+    """
+    version = _get_version(_user_version_key(user_id))
+    key = f'boards:user:{user_id}:boards:{version}'
+    board_ids = cache.get(key)
+    if board_ids is not None:
+        return board_ids
+
+    board_ids = frozenset(
+        Board.objects.visible_to(user_id).values_list('pk', flat=True))
+    cache.set(key, board_ids, _timeout())
+    return board_ids
+
+
+def get_board_peer_ids(user_id):
+    """
+    Return the IDs of the other users on the boards of a user.
+
+    Args:
+        user_id (int): User ID
+
+    Returns:
+        frozenset: Owners and members of the boards the user owns or is a
+        member of, without the user
+    """
+    peer_ids = set()
+    for board_id in get_visible_board_ids(user_id):
+        members = get_board_members(board_id)
+        if members is not None:
+            peer_ids.add(members['owner_id'])
+            peer_ids.update(members['member_ids'])
+    peer_ids.discard(user_id)
+    return frozenset(peer_ids)
+
+
+def invalidate_boards(board_ids):
+    """
+    Invalidate cached members of the given boards once the transaction commits.
+
+    Args:
+        board_ids (iterable): IDs of boards whose membership changed
+    """
+    keys = [_board_version_key(pk) for pk in set(board_ids) if pk is not None]
+    transaction.on_commit(lambda: [_bump_version(key) for key in keys])
+
+
+def invalidate_users(user_ids):
+    """
+    Invalidate cached visible boards of the given users once the
+    transaction commits.
+
+    Args:
+        user_ids (iterable): IDs of users whose visible boards changed
+    """
+    keys = [_user_version_key(pk) for pk in set(user_ids) if pk is not None]
+    transaction.on_commit(lambda: [_bump_version(key) for key in keys])
@@ -0,0 +1,129 @@
+"""
+Board change log.
+
+Records which board, member, user, task and comment objects changed and at
+which board version, publishes them as board events, resolves the changes
+a client has not seen yet and compacts entries that are no longer needed.
+"""
+
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Exists, Max, OuterRef
+
+from .broker import publish_events
+from .models import Board, BoardChange
+from .versioning import bump_board_version
+
+
+def record_changes(changes):
+    """
+    Bump the version of the affected boards and log the changed objects.
+
+    Each entry is stored with the version its board was bumped to, so a
+    client that synced up to version N needs exactly the entries above N.
+    The entries are published as board events after the transaction
+    commits.
+
+    Args:
+        changes (iterable): (board ID, kind, object ID, action) tuples;
+            entries without a board ID are ignored
+    """
+    changes = {change for change in changes
+               if change[0] is not None and change[2] is not None}
+    if not changes:
+        return
+    board_ids = {change[0] for change in changes}
+    bump_board_version(*board_ids)
+    versions = dict(Board.objects.filter(pk__in=board_ids)
+                    .values_list('pk', 'version'))
+    entries = BoardChange.objects.bulk_create([
+        BoardChange(board_id=board_id, version=versions[board_id],
+                    kind=kind, object_id=object_id, action=action)
+        for board_id, kind, object_id, action in changes
+        if board_id in versions
+    ])
+    publish_events([change_event(entry) for entry in entries])
+
+
+def change_event(entry):
+    """
+    Return the board event describing a change log entry.
+
+    Args:
+        entry (BoardChange): Change log entry
+
+    Returns:
+        dict: Event with board, version, kind, id and action
+    """
+    return {
+        'board': entry.board_id,
+        'version': entry.version,
+        'kind': entry.kind,
+        'id': entry.object_id,
+        'action': entry.action,
+    }
+
+
+def collect_changes(board, since):
+    """
+    Return the objects of a board changed after a version.
+
+    Args:
+        board (Board): Board whose changes are requested
+        since (int): Last version the client has seen
+
+    Returns:
+        dict: Sets of changed object IDs keyed by kind
+    """
+    changed = defaultdict(set)
+    entries = (BoardChange.objects
+               .filter(board=board, version__gt=since,
+                       version__lte=board.version)
+               .values_list('kind', 'object_id'))
+    for kind, object_id in entries:
+        changed[kind].add(object_id)
+    return changed
+
+
+def compact_changes(before=None, board_ids=None):
+    """
+    Remove change log entries that are no longer needed.
+
+    An entry is superseded when a later entry exists for the same object;
+    dropping it never changes what a client receives. Entries recorded
+    before the given time are removed as well, and the changes_floor of
+    their boards is raised so clients behind it are told to reload.
+
+    Args:
+        before (datetime): Remove entries recorded before this time
+            (optional)
+        board_ids (list): Restrict compaction to these boards (optional)
+
+    Returns:
+        tuple: Number of superseded and of expired entries removed
+    """
+    entries = BoardChange.objects.all()
+    if board_ids:
+        entries = entries.filter(board_id__in=board_ids)
+
+    newer = BoardChange.objects.filter(
+        board=OuterRef('board'),
+        kind=OuterRef('kind'),
+        object_id=OuterRef('object_id'),
+        version__gt=OuterRef('version'),
+    )
+    superseded, _ = entries.filter(Exists(newer)).delete()
+
+    expired = 0
+    if before is not None:
+        old = entries.filter(created_at__lt=before)
+        with transaction.atomic():
+            floors = (old.order_by().values('board_id')
+                      .annotate(floor=Max('version')))
+            for row in floors:
+                Board.objects.filter(
+                    pk=row['board_id'], changes_floor__lt=row['floor']
+                ).update(changes_floor=row['floor'])
+            expired, _ = old.delete()
+    return superseded, expired
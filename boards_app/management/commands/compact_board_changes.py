@@ -0,0 +1,51 @@
+"""
+Management command to compact the board change log.
+
+Usage:
+    python manage.py compact_board_changes
+    python manage.py compact_board_changes --days 7
+    python manage.py compact_board_changes --board 1 --board 2
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from boards_app.changes import compact_changes
+
+
+class Command(BaseCommand):
+    """
+    Remove superseded and expired BoardChange entries.
+
+    Superseded entries are always removed. Entries older than the retention
+    period are removed as well; clients that last synced before them get
+    410 Gone from the changes endpoint and reload the board.
+    """
+
+    help = "Compact the board change log."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=settings.BOARD_CHANGE_RETENTION_DAYS,
+            help="Remove entries older than this many days (0 keeps all)."
+        )
+        parser.add_argument(
+            '--board',
+            action='append',
+            type=int,
+            dest='boards',
+            help="Restrict to this board ID (can be repeated)."
+        )
+
+    def handle(self, *args, **options):
+        before = None
+        if options['days'] > 0:
+            before = timezone.now() - timedelta(days=options['days'])
+        superseded, expired = compact_changes(before, options['boards'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Removed {superseded} superseded and {expired} expired changes."))
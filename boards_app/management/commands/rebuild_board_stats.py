@@ -0,0 +1,81 @@
+"""
+Management command to rebuild or verify denormalized board statistics.
+
+Usage:
+    python manage.py rebuild_board_stats
+    python manage.py rebuild_board_stats --verify
+    python manage.py rebuild_board_stats --board 1 --board 2
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from boards_app.models import Board
+from boards_app.stats import find_mismatches, rebuild_stats
+
+
+class Command(BaseCommand):
+    """
+    Recompute BoardStats counters from the task and membership tables.
+
+    Boards are processed in batches. With --verify nothing is written and
+    the command fails if any counter differs from the recomputed value.
+    """
+
+    help = "Rebuild or verify the denormalized board statistics."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verify',
+            action='store_true',
+            help="Only report mismatching counters and exit with an error "
+                 "if any."
+        )
+        parser.add_argument(
+            '--board',
+            action='append',
+            type=int,
+            dest='boards',
+            help="Restrict to this board ID (can be repeated)."
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help="Number of boards processed per batch."
+        )
+
+    def handle(self, *args, **options):
+        board_ids = Board.objects.order_by('pk').values_list('pk', flat=True)
+        if options['boards']:
+            board_ids = board_ids.filter(pk__in=options['boards'])
+        board_ids = list(board_ids)
+
+        batch_size = options['batch_size']
+        mismatches = {}
+        for start in range(0, len(board_ids), batch_size):
+            batch = board_ids[start:start + batch_size]
+            if options['verify']:
+                mismatches.update(find_mismatches(batch))
+            else:
+                with transaction.atomic():
+                    mismatches.update(rebuild_stats(batch))
+
+        for board_id, fields in mismatches.items():
+            details = ', '.join(
+                f"{field}: {stored} -> {expected}"
+                for field, (stored, expected) in fields.items()
+            )
+            self.stdout.write(f"Board {board_id}: {details}")
+
+        if options['verify']:
+            if mismatches:
+                raise CommandError(
+                    f"{len(mismatches)} of {len(board_ids)} boards have "
+                    "stale statistics.")
+            self.stdout.write(self.style.SUCCESS(
+                f"Statistics of {len(board_ids)} boards are consistent."))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f"Rebuilt statistics of {len(mismatches)} of "
+                f"{len(board_ids)} boards."))
@@ -0,0 +1,90 @@
+"""
+Board membership resolution.
+
+This module answers "is this user the owner or a member of this board?"
+for permission classes, serializers and views. Member lists come from the
+cross-request cache in boards_app.cache, and each (board, user) answer is
+memoized on the current request, so repeated checks cost no queries no
+matter how many members a board has.
+"""
+
+from .cache import get_board_members
+
+
+def _request_cache(request):
+    """
+    Return the membership memo stored on the request.
+
+    The memo lives on the underlying Django HttpRequest so DRF Request
+    wrappers and plain requests share it.
+
+    Args:
+        request: DRF Request, Django HttpRequest or None
+
+    Returns:
+        dict | None: Mapping of (board_id, user_id) to membership, or None
+        when no request is available
+    """
+    if request is None:
+        return None
+    request = getattr(request, '_request', request)
+    cache = getattr(request, '_board_membership', None)
+    if cache is None:
+        cache = request._board_membership = {}
+    return cache
+
+
+def is_board_member(board, user, request=None):
+    """
+    Check whether a user is listed as member of a board.
+
+    Uses the board's prefetched members when available, otherwise the
+    cached member list of the board.
+
+    Args:
+        board (Board | int): Board instance or board ID
+        user (User | int): User instance or user ID
+        request: Current request used to memoize the result (optional)
+
+    Returns:
+        bool: True if the user is a member of the board
+    """
+    board_id = getattr(board, 'pk', board)
+    user_id = getattr(user, 'pk', user)
+    if board_id is None or user_id is None:
+        return False
+
+    cache = _request_cache(request)
+    key = (board_id, user_id)
+    if cache is not None and key in cache:
+        return cache[key]
+
+    prefetched = getattr(board, '_prefetched_objects_cache', {})
+    if 'members' in prefetched:
+        result = any(member.pk == user_id for member in prefetched['members'])
+    else:
+        members = get_board_members(board_id)
+        result = members is not None and user_id in members['member_ids']
+
+    if cache is not None:
+        cache[key] = result
+    return result
+
+
+def has_board_access(board, user, request=None):
+    """
+    Check whether a user is the owner or a member of a board.
+
+    The owner check compares IDs and never loads the owner.
+
+    Args:
+        board (Board): Board instance
+        user (User): User to check
+        request: Current request used to memoize the result (optional)
+
+    Returns:
+        bool: True if the user is owner or member of the board
+    """
+    if user is None or not user.is_authenticated:
+        return False
+    return board.owner_id == user.pk or is_board_member(board, user, request)
@@ -0,0 +1,102 @@
+# Generated by Django 5.2.7 on 2026-10-18 13:37
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+STATUS_FIELDS = {
+    'to-do': 'to_do_count',
+    'in-progress': 'in_progress_count',
+    'review': 'review_count',
+    'done': 'done_count',
+}
+
+PRIORITY_FIELDS = {
+    'low': 'low_priority_count',
+    'medium': 'medium_priority_count',
+    'high': 'high_priority_count',
+}
+
+
+def populate_board_stats(apps, schema_editor):
+    """Create statistics rows for boards that existed before this migration."""
+    Board = apps.get_model('boards_app', 'Board')
+    BoardStats = apps.get_model('boards_app', 'BoardStats')
+    Task = apps.get_model('tasks_app', 'Task')
+
+    stats = {pk: BoardStats(board_id=pk)
+             for pk in Board.objects.values_list('pk', flat=True)}
+
+    rows = (Task.objects.order_by().values('board_id', 'status', 'priority')
+            .annotate(total=Count('pk')))
+    for row in rows:
+        board_stats = stats[row['board_id']]
+        board_stats.task_count += row['total']
+        status_field = STATUS_FIELDS.get(row['status'])
+        if status_field:
+            setattr(board_stats, status_field,
+                    getattr(board_stats, status_field) + row['total'])
+        priority_field = PRIORITY_FIELDS.get(row['priority'])
+        if priority_field:
+            setattr(board_stats, priority_field,
+                    getattr(board_stats, priority_field) + row['total'])
+
+    rows = (Board.members.through.objects.order_by().values('board_id')
+            .annotate(total=Count('pk')))
+    for row in rows:
+        stats[row['board_id']].member_count = row['total']
+
+    BoardStats.objects.bulk_create(stats.values(), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0002_rename_member_board_members'),
+        ('tasks_app', '0002_alter_task_priority_alter_task_status_taskcomment'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoardStats',
+            fields=[
+                ('board', models.OneToOneField(help_text='Board these statistics belong to', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='boards_app.board')),
+                ('member_count', models.PositiveIntegerField(default=0)),
+                ('task_count', models.PositiveIntegerField(default=0)),
+                ('to_do_count', models.PositiveIntegerField(default=0)),
+                ('in_progress_count', models.PositiveIntegerField(default=0)),
+                ('review_count', models.PositiveIntegerField(default=0)),
+                ('done_count', models.PositiveIntegerField(default=0)),
+                ('low_priority_count', models.PositiveIntegerField(default=0)),
+                ('medium_priority_count', models.PositiveIntegerField(default=0)),
+                ('high_priority_count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Board Statistics',
+                'verbose_name_plural': 'Board Statistics',
+            },
+        ),
+        migrations.AlterModelOptions(
+            name='board',
+            options={'ordering': ['-id'], 'verbose_name': 'Board', 'verbose_name_plural': 'Boards'},
+        ),
+        migrations.AlterField(
+            model_name='board',
+            name='members',
+            field=models.ManyToManyField(blank=True, help_text='Users who can collaborate on this board', related_name='member_boards', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='board',
+            name='owner',
+            field=models.ForeignKey(help_text='Board owner/creator', on_delete=django.db.models.deletion.CASCADE, related_name='boards', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='board',
+            name='title',
+            field=models.CharField(help_text='Board title/name', max_length=200),
+        ),
+        migrations.RunPython(populate_board_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-18 13:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0003_boardstats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='board',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, help_text='Timestamp of the last change to the board or its content'),
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='version',
+            field=models.PositiveBigIntegerField(default=0, help_text='Incremented whenever the board or any of its content changes'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.7 on 2026-10-18 13:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0004_board_version_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='board',
+            name='changes_floor',
+            field=models.PositiveBigIntegerField(default=0, help_text='Oldest version from which changes can be replayed'),
+        ),
+        migrations.CreateModel(
+            name='BoardChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveBigIntegerField(help_text='Board version produced by the change')),
+                ('kind', models.CharField(choices=[('board', 'board'), ('member', 'member'), ('user', 'user'), ('task', 'task'), ('comment', 'comment')], help_text='Kind of the changed object', max_length=20)),
+                ('object_id', models.PositiveBigIntegerField(help_text='Primary key of the changed object')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='Time the change was recorded')),
+                ('board', models.ForeignKey(help_text='Board the change belongs to', on_delete=django.db.models.deletion.CASCADE, related_name='changes', to='boards_app.board')),
+            ],
+            options={
+                'verbose_name': 'Board Change',
+                'verbose_name_plural': 'Board Changes',
+                'indexes': [models.Index(fields=['board', 'version'], name='boardchange_board_version_idx'), models.Index(fields=['created_at'], name='boardchange_created_idx')],
+            },
+        ),
+    ]
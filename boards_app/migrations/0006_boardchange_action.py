@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-18 14:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0005_board_changes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='boardchange',
+            name='action',
+            field=models.CharField(choices=[('created', 'created'), ('updated', 'updated'), ('deleted', 'deleted')], default='updated', help_text='What happened to the changed object', max_length=20),
+        ),
+    ]
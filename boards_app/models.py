@@ -1,11 +1,53 @@
 """
 Board app models.
 
-This module defines the Board model for Kanban board management.
+This module defines the Board model for Kanban board management, the
+BoardStats model holding its denormalized counters and the BoardChange
+log used for delta synchronization.
 """
 
 from django.contrib.auth.models import User
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Q
+
+
+class BoardQuerySet(models.QuerySet):
+    """
+    Custom queryset for boards.
+
+    Bundles the filters and aggregates used by the board API so that views
+    can build list and detail querysets without N+1 lookups.
+    """
+
+    def visible_to(self, user):
+        """
+        Restrict the queryset to boards the user owns or is a member of.
+
+        Membership is resolved through a subquery on the m2m table instead of
+        a join, so no duplicate rows are produced and no DISTINCT is needed.
+
+        Args:
+            user (User | int): User or user ID whose boards should be returned
+
+        Returns:
+            BoardQuerySet: Filtered board queryset
+        """
+        member_of = Board.members.through.objects.filter(
+            user=user).values('board_id')
+        return self.filter(Q(owner=user) | Q(pk__in=member_of))
+
+    def with_list_stats(self):
+        """
+        Join the denormalized statistics used by the board list.
+
+        Counts are maintained incrementally in BoardStats (see
+        boards_app.stats), so reading them is a single join per board
+        instead of aggregating the task table.
+
+        Returns:
+            BoardQuerySet: Queryset with stats loaded via select_related
+        """
+        return self.select_related('stats')
 
 
 class Board(models.Model):
@@ -19,6 +61,11 @@ class Board(models.Model):
         title (str): The board's title/name (max 200 characters)
         owner (User): The user who created and owns the board
         members (ManyToMany): Users who have access to collaborate on the board
+        version (int): Counter bumped by every change to the board, its
+            members, tasks or comments; used for conditional requests
+        updated_at (datetime): Timestamp of the last version bump
+        changes_floor (int): Oldest version the change log can still be
+            replayed from; raised when old log entries are compacted
         
     Related Names:
         boards: Reverse relation from User to owned boards
@@ -41,12 +88,176 @@ class Board(models.Model):
         blank=True,
         help_text="Users who can collaborate on this board"
     )
+    version = models.PositiveBigIntegerField(
+        default=0,
+        help_text="Incremented whenever the board or any of its content "
+                  "changes"
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text="Timestamp of the last change to the board or its content"
+    )
+    changes_floor = models.PositiveBigIntegerField(
+        default=0,
+        help_text="Oldest version from which changes can be replayed"
+    )
+
+    objects = BoardQuerySet.as_manager()
 
     def __str__(self):
         """Return string representation of the board."""
         return f'{self.title}'
+
+    def save(self, *args, **kwargs):
+        """
+        Save the board and its statistics row in one transaction.
+
+        The version counters are only changed by F() updates (see
+        boards_app.changes), so updates of an existing board leave them out
+        instead of writing back possibly stale in-memory values.
+        """
+        if (not self._state.adding and not kwargs.get('force_insert')
+                and kwargs.get('update_fields') is None):
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in ('version', 'changes_floor')
+            ]
+        with transaction.atomic():
+            super().save(*args, **kwargs)
     
     class Meta:
         verbose_name = "Board"
         verbose_name_plural = "Boards"
         ordering = ['-id']
+
+
+class BoardStats(models.Model):
+    """
+    Denormalized task and member counters for a board.
+
+    Maintained incrementally by signal handlers in the same transaction as
+    the task or membership write that changes them, so list views can read
+    board statistics in O(1) per board. Use the rebuild_board_stats
+    management command to recompute or verify the counters.
+
+    Attributes:
+        board (Board): The board these counters belong to
+        member_count (int): Number of board members
+        task_count (int): Total number of tasks on the board
+        to_do_count, in_progress_count, review_count, done_count (int):
+            Number of tasks per status
+        low_priority_count, medium_priority_count, high_priority_count (int):
+            Number of tasks per priority
+    """
+
+    board = models.OneToOneField(
+        Board,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stats',
+        help_text="Board these statistics belong to"
+    )
+    member_count = models.PositiveIntegerField(default=0)
+    task_count = models.PositiveIntegerField(default=0)
+    to_do_count = models.PositiveIntegerField(default=0)
+    in_progress_count = models.PositiveIntegerField(default=0)
+    review_count = models.PositiveIntegerField(default=0)
+    done_count = models.PositiveIntegerField(default=0)
+    low_priority_count = models.PositiveIntegerField(default=0)
+    medium_priority_count = models.PositiveIntegerField(default=0)
+    high_priority_count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        """Return string representation of the board statistics."""
+        return f'Stats for {self.board_id}'
+
+    class Meta:
+        verbose_name = "Board Statistics"
+        verbose_name_plural = "Board Statistics"
+
+
+def choices_change_kind():
+    """
+    Return the kinds of objects recorded in the board change log.
+
+    Returns:
+        list: Change kinds
+    """
+    kinds = ["board", "member", "user", "task", "comment"]
+    return kinds
+
+
+def choices_change_action():
+    """
+    Return the actions recorded in the board change log.
+
+    Returns:
+        list: Change actions
+    """
+    actions = ["created", "updated", "deleted"]
+    return actions
+
+
+class BoardChange(models.Model):
+    """
+    Change log entry of a board.
+
+    Every write to a board, its membership, tasks or comments records which
+    object changed and the board version it produced. Entries only identify
+    the object; the delta endpoint serializes its current state or a
+    tombstone if it no longer belongs to the board. Superseded and old
+    entries are removed by the compact_board_changes management command.
+
+    Attributes:
+        board (Board): Board the change belongs to
+        version (int): Board version produced by the change
+        kind (str): Kind of the changed object (see choices_change_kind)
+        object_id (int): Primary key of the changed object
+        action (str): What happened to the object (see
+            choices_change_action)
+        created_at (datetime): Time the change was recorded
+    """
+
+    board = models.ForeignKey(
+        Board,
+        on_delete=models.CASCADE,
+        related_name='changes',
+        help_text="Board the change belongs to"
+    )
+    version = models.PositiveBigIntegerField(
+        help_text="Board version produced by the change"
+    )
+    kind = models.CharField(
+        max_length=20,
+        choices=[(kind, kind) for kind in choices_change_kind()],
+        help_text="Kind of the changed object"
+    )
+    object_id = models.PositiveBigIntegerField(
+        help_text="Primary key of the changed object"
+    )
+    action = models.CharField(
+        max_length=20,
+        choices=[(action, action) for action in choices_change_action()],
+        default="updated",
+        help_text="What happened to the changed object"
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        help_text="Time the change was recorded"
+    )
+
+    def __str__(self):
+        """Return string representation of the change."""
+        return (f'{self.kind} {self.object_id} {self.action} '
+                f'@ {self.board_id}v{self.version}')
+
+    class Meta:
+        verbose_name = "Board Change"
+        verbose_name_plural = "Board Changes"
+        indexes = [
+            models.Index(fields=['board', 'version'],
+                         name='boardchange_board_version_idx'),
+            models.Index(fields=['created_at'],
+                         name='boardchange_created_idx'),
+        ]
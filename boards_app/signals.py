@@ -0,0 +1,138 @@
+"""
+Board app signal handlers.
+
+Keeps the denormalized BoardStats counters, the cross-request membership
+cache and the board version and change log in sync with board creation,
+ownership, deletion and membership changes.
+"""
+
+from django.contrib.auth.models import User
+from django.db.models import F, Q
+from django.db.models.signals import (
+    m2m_changed, post_delete, post_init, post_save, pre_delete
+)
+from django.dispatch import receiver
+
+from auth_app.models import UserProfile
+from .broker import publish_events
+from .cache import invalidate_boards, invalidate_users
+from .changes import record_changes
+from .models import Board, BoardStats
+from .stats import refresh_member_count
+
+
+@receiver(post_save, sender=Board)
+def create_board_stats(sender, instance, created, raw=False, **kwargs):
+    """Create the statistics row for a newly created board."""
+    if created and not raw:
+        BoardStats.objects.create(board=instance)
+
+
+@receiver(post_init, sender=Board)
+def remember_owner(sender, instance, **kwargs):
+    """Remember the owner a board was loaded or constructed with."""
+    instance._cached_owner_id = instance.__dict__.get('owner_id')
+
+
+@receiver(post_save, sender=Board)
+def invalidate_board_on_save(sender, instance, created, raw=False, **kwargs):
+    """Invalidate cached access data when a board is created or re-owned."""
+    if raw:
+        return
+    if not created:
+        record_changes([(instance.pk, 'board', instance.pk, 'updated')])
+    old_owner_id = instance._cached_owner_id
+    if created or old_owner_id != instance.owner_id:
+        invalidate_boards([instance.pk])
+        invalidate_users([old_owner_id, instance.owner_id])
+    instance._cached_owner_id = instance.owner_id
+
+
+@receiver(pre_delete, sender=Board)
+def remember_board_users(sender, instance, **kwargs):
+    """Capture the users of a board before its membership rows are deleted."""
+    instance._deleted_user_ids = [instance.owner_id] + list(
+        instance.members.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=Board)
+def invalidate_board_on_delete(sender, instance, **kwargs):
+    """
+    Invalidate cached access data of a deleted board and its users.
+
+    The deletion is published as a board event so open streams close; it
+    has no version since the board's change log is deleted with it.
+    """
+    invalidate_boards([instance.pk])
+    invalidate_users(instance.__dict__.pop('_deleted_user_ids', []))
+    publish_events([{'board': instance.pk, 'version': None, 'kind': 'board',
+                     'id': instance.pk, 'action': 'deleted'}])
+
+
+@receiver(m2m_changed, sender=Board.members.through)
+def update_membership(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Propagate a membership change to counters and the membership cache.
+
+    Handles both directions of the relation: board.members.add(user) and
+    user.member_boards.add(board). For a clear the affected objects are
+    captured before the rows are deleted.
+    """
+    if action == 'pre_clear':
+        related = instance.member_boards if reverse else instance.members
+        instance._cleared_pks = list(related.values_list('pk', flat=True))
+        return
+
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if action == 'post_clear':
+        pk_set = instance.__dict__.pop('_cleared_pks', [])
+    pk_set = pk_set or []
+
+    if reverse:
+        board_ids, user_ids = pk_set, [instance.pk]
+    else:
+        board_ids, user_ids = [instance.pk], pk_set
+
+    refresh_member_count(board_ids)
+    change = 'created' if action == 'post_add' else 'deleted'
+    record_changes((board_id, 'member', user_id, change)
+                   for board_id in board_ids for user_id in user_ids)
+    invalidate_boards(board_ids)
+    invalidate_users(user_ids)
+
+
+@receiver(pre_delete, sender=User)
+def release_memberships(sender, instance, **kwargs):
+    """
+    Update boards of a user being deleted.
+
+    Membership rows are removed by cascade without m2m_changed signals, so
+    member counts are decremented and cached members invalidated here.
+    """
+    board_ids = list(instance.member_boards.values_list('pk', flat=True))
+    BoardStats.objects.filter(board_id__in=board_ids).update(
+        member_count=F('member_count') - 1)
+    record_changes((board_id, 'member', instance.pk, 'deleted')
+                   for board_id in board_ids)
+    invalidate_boards(board_ids)
+
+
+@receiver(post_save, sender=UserProfile)
+def bump_boards_on_profile_change(sender, instance, created, raw=False,
+                                  **kwargs):
+    """
+    Bump boards that render a user's profile when the profile changes.
+
+    Board details show full names of members, assignees and reviewers.
+    """
+    if created or raw:
+        return
+    user_id = instance.user_id
+    board_ids = Board.objects.filter(
+        Q(owner_id=user_id) | Q(members=user_id)
+        | Q(task__assignee_id=user_id) | Q(task__reviewer_id=user_id)
+    ).values_list('pk', flat=True).distinct()
+    record_changes((board_id, 'user', user_id, 'updated')
+                   for board_id in board_ids)
@@ -0,0 +1,239 @@
+"""
+Board statistics maintenance.
+
+This module keeps the denormalized BoardStats counters in sync with tasks
+and board membership, and recomputes them from the source tables for the
+rebuild_board_stats management command.
+"""
+
+from collections import Counter, defaultdict
+
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from .models import Board, BoardStats
+
+
+STATUS_FIELDS = {
+    'to-do': 'to_do_count',
+    'in-progress': 'in_progress_count',
+    'review': 'review_count',
+    'done': 'done_count',
+}
+
+PRIORITY_FIELDS = {
+    'low': 'low_priority_count',
+    'medium': 'medium_priority_count',
+    'high': 'high_priority_count',
+}
+
+COUNTER_FIELDS = (
+    ['member_count', 'task_count']
+    + list(STATUS_FIELDS.values())
+    + list(PRIORITY_FIELDS.values())
+)
+
+
+def _task_deltas(state, weight, deltas):
+    """
+    Add the counter changes for tasks in one state to deltas.
+
+    Args:
+        state (tuple): (board_id, status, priority) of the tasks
+        weight (int): Number of tasks entering (positive) or leaving
+            (negative) this state
+        deltas (Counter): Accumulated (board_id, field) changes
+    """
+    board_id, status, priority = state
+    deltas[(board_id, 'task_count')] += weight
+    if status in STATUS_FIELDS:
+        deltas[(board_id, STATUS_FIELDS[status])] += weight
+    if priority in PRIORITY_FIELDS:
+        deltas[(board_id, PRIORITY_FIELDS[priority])] += weight
+
+
+def apply_task_change(old=None, new=None):
+    """
+    Update board counters for a created, changed or deleted task.
+
+    Issues at most one UPDATE per affected board using F() expressions, so
+    concurrent writers never lose increments. Must run inside the
+    transaction of the task write.
+
+    Args:
+        old (tuple): (board_id, status, priority) before the write, or None
+            for a newly created task
+        new (tuple): (board_id, status, priority) after the write, or None
+            for a deleted task
+    """
+    apply_task_changes([(old, new)])
+
+
+def apply_task_changes(changes):
+    """
+    Update board counters for a batch of task writes.
+
+    The changes of all tasks are summed up first, so a batch costs one
+    UPDATE per affected board no matter how many tasks it touches.
+
+    Args:
+        changes (iterable): (old, new) state pairs as taken by
+            apply_task_change
+    """
+    deltas = Counter()
+    for old, new in changes:
+        if old == new:
+            continue
+        if old is not None:
+            _task_deltas(old, -1, deltas)
+        if new is not None:
+            _task_deltas(new, 1, deltas)
+
+    updates = defaultdict(dict)
+    for (board_id, field), delta in deltas.items():
+        if delta:
+            updates[board_id][field] = F(field) + delta
+
+    for board_id, fields in updates.items():
+        BoardStats.objects.filter(board_id=board_id).update(**fields)
+
+
+def refresh_member_count(board_ids):
+    """
+    Recount the members of the given boards.
+
+    Args:
+        board_ids (iterable): IDs of boards whose membership changed
+    """
+    member_count = (
+        Board.members.through.objects
+        .filter(board_id=OuterRef('board_id'))
+        .order_by()
+        .values('board_id')
+        .annotate(total=Count('pk'))
+        .values('total')
+    )
+    BoardStats.objects.filter(board_id__in=list(board_ids)).update(
+        member_count=Coalesce(Subquery(member_count), 0))
+
+
+def compute_stats(board_ids=None):
+    """
+    Compute board counters from the source tables.
+
+    Uses one grouped query over tasks and one over memberships, regardless
+    of the number of boards.
+
+    Args:
+        board_ids (iterable): Restrict to these boards, or None for all
+
+    Returns:
+        dict: Mapping of board ID to a dict of counter values
+    """
+    boards = Board.objects.all()
+    if board_ids is not None:
+        boards = boards.filter(pk__in=list(board_ids))
+
+    stats = {
+        board_id: dict.fromkeys(COUNTER_FIELDS, 0)
+        for board_id in boards.values_list('pk', flat=True)
+    }
+
+    task_rows = (
+        boards.order_by()
+        .filter(task__isnull=False)
+        .values('pk', 'task__status', 'task__priority')
+        .annotate(total=Count('task'))
+    )
+    deltas = Counter()
+    for row in task_rows:
+        state = (row['pk'], row['task__status'], row['task__priority'])
+        _task_deltas(state, row['total'], deltas)
+    for (board_id, field), value in deltas.items():
+        stats[board_id][field] = value
+
+    member_rows = (
+        Board.members.through.objects
+        .filter(board_id__in=list(stats))
+        .order_by()
+        .values('board_id')
+        .annotate(total=Count('pk'))
+    )
+    for row in member_rows:
+        stats[row['board_id']]['member_count'] = row['total']
+
+    return stats
+
+
+def _diff(expected):
+    """
+    Compare stored counters with the expected values.
+
+    Args:
+        expected (dict): Output of compute_stats()
+
+    Returns:
+        dict: Mapping of board ID to {field: (stored, expected)}
+    """
+    stored = {
+        row['board_id']: row
+        for row in BoardStats.objects.filter(
+            board_id__in=list(expected)).values('board_id', *COUNTER_FIELDS)
+    }
+
+    mismatches = {}
+    for board_id, values in expected.items():
+        current = stored.get(board_id, {})
+        diff = {
+            field: (current.get(field), value)
+            for field, value in values.items()
+            if current.get(field) != value
+        }
+        if diff:
+            mismatches[board_id] = diff
+    return mismatches
+
+
+def find_mismatches(board_ids=None):
+    """
+    Compare stored counters with freshly computed ones.
+
+    Args:
+        board_ids (iterable): Restrict to these boards, or None for all
+
+    Returns:
+        dict: Mapping of board ID to {field: (stored, expected)} for every
+        board whose counters differ or whose stats row is missing
+    """
+    return _diff(compute_stats(board_ids))
+
+
+def rebuild_stats(board_ids=None):
+    """
+    Recompute counters and store them for every board that differs.
+
+    Args:
+        board_ids (iterable): Restrict to these boards, or None for all
+
+    Returns:
+        dict: Mismatches that were corrected, as returned by find_mismatches
+    """
+    expected = compute_stats(board_ids)
+    mismatches = _diff(expected)
+    existing = set(
+        BoardStats.objects.filter(board_id__in=list(mismatches))
+        .values_list('board_id', flat=True)
+    )
+
+    to_create = []
+    to_update = []
+    for board_id in mismatches:
+        stats = BoardStats(board_id=board_id, **expected[board_id])
+        if board_id in existing:
+            to_update.append(stats)
+        else:
+            to_create.append(stats)
+
+    BoardStats.objects.bulk_create(to_create)
+    BoardStats.objects.bulk_update(to_update, COUNTER_FIELDS)
+    return mismatches
@@ -0,0 +1,789 @@
+"""
+Board app tests.
+
+Covers the query count of the board list, the denormalized board
+statistics, the invalidation of the membership cache, conditional requests,
+the delta sync of the changes endpoint and the board event stream.
+"""
+
+import asyncio
+import datetime
+import io
+import random
+import sys
+import time
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase
+from django.utils import timezone
+from django.utils.http import http_date
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from auth_app.models import UserProfile
+from tasks_app.bulk import apply_bulk_operations, move_tasks
+from tasks_app.models import (
+    Task, TaskComment, choices_priority, choices_status)
+from .api.streams import issue_ticket
+from .broker import RedisBroker
+from .cache import get_board_members, get_visible_board_ids
+from .membership import has_board_access
+from .models import Board, BoardChange
+from .stats import find_mismatches
+
+
+def create_user(username):
+    """Create a user with a profile, as registration does."""
+    user = User.objects.create_user(
+        username, f'{username}@example.com', 'password')
+    UserProfile.objects.create(user=user, full_name=username.title())
+    return user
+
+
+class BoardListQueryCountTests(APITestCase):
+    """GET /api/boards/ runs a fixed number of queries."""
+
+    # Visible board IDs, board versions for the ETag, boards with stats
+    LIST_QUERIES = 3
+
+    def setUp(self):
+        self.owner = create_user('owner')
+        self.member = create_user('member')
+        self.client.force_authenticate(self.owner)
+
+    def create_boards(self, count):
+        """Create boards with a member and tasks in several states."""
+        for index in range(count):
+            board = Board.objects.create(title=f'Board {index}',
+                                         owner=self.owner)
+            board.members.add(self.member)
+            Task.objects.create(board=board, title='Open', priority='high')
+            Task.objects.create(board=board, title='Done', status='done')
+
+    def list_boards(self):
+        """Request the board list with a cold membership cache."""
+        cache.clear()
+        return self.client.get('/api/boards/')
+
+    def test_query_count_does_not_grow_with_boards(self):
+        self.create_boards(1)
+        with self.assertNumQueries(self.LIST_QUERIES):
+            response = self.list_boards()
+        self.assertEqual(len(response.json()), 1)
+
+        self.create_boards(24)
+        with self.assertNumQueries(self.LIST_QUERIES):
+            response = self.list_boards()
+        self.assertEqual(len(response.json()), 25)
+
+    def test_counts_are_rendered(self):
+        self.create_boards(2)
+        for board in self.list_boards().json():
+            self.assertEqual(board['member_count'], 1)
+            self.assertEqual(board['ticket_count'], 2)
+            self.assertEqual(board['tasks_to_do_count'], 1)
+            self.assertEqual(board['tasks_high_prio_count'], 1)
+            self.assertEqual(board['owner_id'], self.owner.pk)
+
+
+class BoardStatsFuzzTests(TestCase):
+    """
+    Random task and membership writes keep BoardStats exact.
+
+    Every step is checked against counters recomputed from the source
+    tables. The bulk and move paths bypass the per-task signals and
+    reconcile the counters themselves, so they are mixed in too.
+    """
+
+    STEPS = 150
+
+    def setUp(self):
+        self.rng = random.Random(5)
+        self.owner = create_user('owner')
+        self.users = [create_user(f'user{index}') for index in range(4)]
+        self.boards = [Board.objects.create(title=f'Board {index}',
+                                            owner=self.owner)
+                       for index in range(3)]
+
+    def random_values(self):
+        """Return random status and priority values of a task."""
+        return {'status': self.rng.choice(choices_status()),
+                'priority': self.rng.choice(choices_priority())}
+
+    def random_tasks(self, board=None, limit=3):
+        """Return up to limit random tasks, optionally of one board."""
+        tasks = Task.objects.all()
+        if board is not None:
+            tasks = tasks.filter(board=board)
+        tasks = list(tasks)
+        return self.rng.sample(tasks, min(limit, len(tasks)))
+
+    def create_task(self):
+        Task.objects.create(board=self.rng.choice(self.boards), title='Task',
+                            **self.random_values())
+
+    def update_task(self):
+        for task in self.random_tasks(limit=1):
+            for field, value in self.random_values().items():
+                if self.rng.random() < 0.7:
+                    setattr(task, field, value)
+            if self.rng.random() < 0.2:
+                task.board = self.rng.choice(self.boards)
+            task.save()
+
+    def delete_task(self):
+        for task in self.random_tasks(limit=1):
+            task.delete()
+
+    def delete_tasks_queryset(self):
+        board = self.rng.choice(self.boards)
+        Task.objects.filter(board=board,
+                            status=self.rng.choice(choices_status())).delete()
+
+    def bulk_write(self):
+        board = self.rng.choice(self.boards)
+        tasks = self.random_tasks(board, limit=4)
+        split = self.rng.randint(0, len(tasks))
+        creates = [dict(title='Bulk', **self.random_values())
+                   for _ in range(self.rng.randint(0, 3))]
+        updates = [(task, self.random_values()) for task in tasks[:split]]
+        apply_bulk_operations(board, creates, updates, tasks[split:])
+
+    def move(self):
+        board = self.rng.choice(self.boards)
+        moves = [{'id': task.pk, 'status': self.rng.choice(choices_status()),
+                  'after': None}
+                 for task in self.random_tasks(board, limit=3)]
+        if moves:
+            move_tasks(board, moves)
+
+    def change_members(self):
+        board = self.rng.choice(self.boards)
+        user = self.rng.choice(self.users)
+        if self.rng.random() < 0.5:
+            board.members.add(user)
+        else:
+            board.members.remove(user)
+
+    def test_counters_match_recomputed_values(self):
+        operations = [
+            self.create_task, self.create_task, self.update_task,
+            self.delete_task, self.delete_tasks_queryset, self.bulk_write,
+            self.move, self.change_members,
+        ]
+        for step in range(self.STEPS):
+            operation = self.rng.choice(operations)
+            operation()
+            self.assertEqual(find_mismatches(), {},
+                             f'step {step}: {operation.__name__}')
+
+        member = self.users[0]
+        for board in self.boards:
+            board.members.add(member)
+        member.delete()
+        self.assertEqual(find_mismatches(), {})
+
+
+class MembershipCacheTests(TestCase):
+    """
+    Cached membership follows committed membership edits.
+
+    Invalidation bumps versions in on_commit callbacks, which TestCase
+    only runs inside captureOnCommitCallbacks(execute=True).
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = create_user('owner')
+        self.member = create_user('member')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.board = Board.objects.create(title='Board', owner=self.owner)
+
+    def test_edit_is_visible_once_committed(self):
+        self.assertEqual(get_board_members(self.board.pk)['member_ids'],
+                         frozenset())
+        with self.captureOnCommitCallbacks(execute=True):
+            self.board.members.add(self.member)
+            # Not committed yet: readers keep the previous entry
+            with self.assertNumQueries(0):
+                members = get_board_members(self.board.pk)
+            self.assertEqual(members['member_ids'], frozenset())
+
+        self.assertEqual(get_board_members(self.board.pk)['member_ids'],
+                         frozenset([self.member.pk]))
+        self.assertEqual(get_visible_board_ids(self.member.pk),
+                         frozenset([self.board.pk]))
+
+    def test_rollback_leaves_cache_untouched(self):
+        get_board_members(self.board.pk)
+        get_visible_board_ids(self.member.pk)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            with self.assertRaises(RuntimeError):
+                with transaction.atomic():
+                    self.board.members.add(self.member)
+                    raise RuntimeError
+        self.assertEqual(callbacks, [])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_board_members(self.board.pk)['member_ids'],
+                             frozenset())
+            self.assertEqual(get_visible_board_ids(self.member.pk),
+                             frozenset())
+
+    def test_removed_member_loses_access(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.board.members.add(self.member)
+        self.assertTrue(has_board_access(self.board, self.member))
+        self.assertIn(self.board.pk, get_visible_board_ids(self.member.pk))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.board.members.remove(self.member)
+
+        self.assertFalse(has_board_access(self.board, self.member))
+        self.assertNotIn(self.board.pk, get_visible_board_ids(self.member.pk))
+
+    def test_stale_read_during_removal_is_not_served(self):
+        """
+        A reader that loaded the members before a removal committed stores
+        them under the old version, which later reads no longer use.
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            self.board.members.add(self.member)
+        store = cache.set
+        removed = []
+
+        def remove_then_store(key, value, timeout=None):
+            if not removed:
+                removed.append(True)
+                with self.captureOnCommitCallbacks(execute=True):
+                    self.board.members.remove(self.member)
+            store(key, value, timeout)
+
+        with mock.patch.object(cache, 'set', side_effect=remove_then_store):
+            stale = get_board_members(self.board.pk)
+        self.assertEqual(removed, [True])
+        self.assertEqual(stale['member_ids'], frozenset([self.member.pk]))
+
+        self.assertEqual(get_board_members(self.board.pk)['member_ids'],
+                         frozenset())
+        self.assertFalse(has_board_access(self.board, self.member))
+
+
+class BoardChangesTests(APITestCase):
+    """GET /api/boards/{id}/changes/ replays the changes after a version."""
+
+    def setUp(self):
+        cache.clear()
+        self.owner = create_user('owner')
+        self.member = create_user('member')
+        self.board = Board.objects.create(title='Board', owner=self.owner)
+        self.board.members.add(self.member)
+        self.client.force_authenticate(self.owner)
+
+    def version(self):
+        """Return the current version of the board."""
+        self.board.refresh_from_db()
+        return self.board.version
+
+    def changes(self, since):
+        """Request the changes after a version."""
+        return self.client.get(
+            f'/api/boards/{self.board.pk}/changes/', {'since': since})
+
+    def test_version_is_the_next_cursor(self):
+        start = self.version()
+        first = Task.objects.create(board=self.board, title='First')
+
+        data = self.changes(start).json()
+        self.assertEqual(data['version'], self.version())
+        self.assertEqual([task['id'] for task in data['tasks']], [first.pk])
+
+        second = Task.objects.create(board=self.board, title='Second')
+        data = self.changes(data['version']).json()
+        self.assertEqual([task['id'] for task in data['tasks']], [second.pk])
+        self.assertIsNone(data['board'])
+
+        data = self.changes(data['version']).json()
+        self.assertEqual(data['tasks'], [])
+        self.assertEqual(data['deleted'],
+                         {'members': [], 'tasks': [], 'comments': []})
+
+    def test_changed_objects_are_returned_in_their_current_state(self):
+        start = self.version()
+        task = Task.objects.create(board=self.board, title='Draft')
+        comment = TaskComment.objects.create(
+            task=task, author=self.member, content='Looks good')
+        task.title = 'Final'
+        task.save()
+        self.board.title = 'Renamed'
+        self.board.save()
+
+        data = self.changes(start).json()
+        self.assertEqual(data['board'], {'id': self.board.pk,
+                                         'title': 'Renamed',
+                                         'owner_id': self.owner.pk})
+        self.assertEqual([(item['id'], item['title'])
+                          for item in data['tasks']],
+                         [(task.pk, 'Final')])
+        self.assertEqual([(item['id'], item['task_id'])
+                          for item in data['comments']],
+                         [(comment.pk, task.pk)])
+
+    def test_deleted_objects_are_tombstones(self):
+        kept = Task.objects.create(board=self.board, title='Kept')
+        removed = Task.objects.create(board=self.board, title='Removed')
+        comment = TaskComment.objects.create(
+            task=kept, author=self.member, content='Obsolete')
+        start = self.version()
+        deleted = {'members': [self.member.pk], 'tasks': [removed.pk],
+                   'comments': [comment.pk]}
+
+        comment.delete()
+        removed.delete()
+        self.board.members.remove(self.member)
+
+        data = self.changes(start).json()
+        self.assertEqual(data['deleted'], deleted)
+        self.assertEqual(data['members'], [])
+        self.assertEqual(data['tasks'], [])
+        self.assertEqual(data['comments'], [])
+
+    def test_comments_of_deleted_tasks_are_not_listed(self):
+        task = Task.objects.create(board=self.board, title='Task')
+        TaskComment.objects.create(task=task, author=self.owner, content='Hi')
+        start = self.version()
+        deleted = {'members': [], 'tasks': [task.pk], 'comments': []}
+
+        task.delete()
+
+        self.assertEqual(self.changes(start).json()['deleted'], deleted)
+
+    def test_since_is_validated(self):
+        for since in ('', 'abc', '-1'):
+            response = self.changes(since)
+            self.assertEqual(response.status_code, 400)
+            self.assertIn('since', response.json())
+
+        response = self.changes(self.version() + 1)
+        self.assertEqual(response.status_code, 410)
+
+    def test_versions_below_the_floor_are_gone(self):
+        start = self.version()
+        Task.objects.create(board=self.board, title='Task')
+        Board.objects.filter(pk=self.board.pk).update(
+            changes_floor=self.version())
+
+        response = self.changes(start)
+        self.assertEqual(response.status_code, 410)
+        self.assertEqual(response.json()['version'], self.version())
+        self.assertEqual(self.changes(self.version()).status_code, 200)
+
+
+class CompactBoardChangesTests(APITestCase):
+    """compact_board_changes keeps what clients receive, or sends them 410."""
+
+    def setUp(self):
+        cache.clear()
+        self.owner = create_user('owner')
+        self.board = Board.objects.create(title='Board', owner=self.owner)
+        self.client.force_authenticate(self.owner)
+        self.board.refresh_from_db()
+        self.start = self.board.version
+        self.task = Task.objects.create(board=self.board, title='Task')
+        for title in ('Renamed', 'Renamed again'):
+            self.task.title = title
+            self.task.save()
+
+    def compact(self, *args):
+        """Run the command and return its output."""
+        out = io.StringIO()
+        call_command('compact_board_changes', *args, stdout=out)
+        return out.getvalue()
+
+    def changes(self):
+        """Request the changes after the version before the task existed."""
+        return self.client.get(
+            f'/api/boards/{self.board.pk}/changes/', {'since': self.start})
+
+    def task_entries(self):
+        """Return the change log entries of the task."""
+        return BoardChange.objects.filter(kind='task', object_id=self.task.pk)
+
+    def test_superseded_changes_are_removed(self):
+        before = self.changes().json()
+        self.assertEqual(self.task_entries().count(), 3)
+
+        output = self.compact('--days', '0')
+
+        self.assertIn('Removed 2 superseded and 0 expired changes.', output)
+        self.assertEqual(self.task_entries().count(), 1)
+        self.assertEqual(self.changes().json(), before)
+
+    def test_expired_changes_raise_the_floor(self):
+        BoardChange.objects.filter(board=self.board).update(
+            created_at=datetime.datetime(2000, 1, 1,
+                                         tzinfo=datetime.timezone.utc))
+        self.board.refresh_from_db()
+
+        output = self.compact('--days', '30')
+
+        self.assertIn('Removed 2 superseded and 1 expired changes.', output)
+        self.assertFalse(BoardChange.objects.filter(board=self.board).exists())
+        floor = Board.objects.get(pk=self.board.pk).changes_floor
+        self.assertEqual(floor, self.board.version)
+        self.assertEqual(self.changes().status_code, 410)
+
+    def test_other_boards_are_left_alone(self):
+        other = Board.objects.create(title='Other', owner=self.owner)
+        task = Task.objects.create(board=other, title='Other task')
+        task.save()
+
+        self.compact('--days', '0', '--board', str(other.pk))
+
+        self.assertEqual(self.task_entries().count(), 3)
+        self.assertEqual(BoardChange.objects.filter(
+            kind='task', object_id=task.pk).count(), 1)
+
+
+class ConditionalRequestTests(APITestCase):
+    """Board endpoints answer If-None-Match and If-Modified-Since with 304."""
+
+    CHANGED_AT = datetime.datetime(2026, 1, 1, 12, 0, 0, 500000,
+                                   tzinfo=datetime.timezone.utc)
+
+    def setUp(self):
+        cache.clear()
+        self.owner = create_user('owner')
+        self.board = Board.objects.create(title='Board', owner=self.owner)
+        Task.objects.create(board=self.board, title='Task')
+        self.set_changed_at(self.CHANGED_AT)
+        self.client.force_authenticate(self.owner)
+        self.url = f'/api/boards/{self.board.pk}/'
+
+    def set_changed_at(self, moment):
+        """Set the time of the board's last change."""
+        Board.objects.filter(pk=self.board.pk).update(updated_at=moment)
+
+    def test_detail_answers_if_none_match(self):
+        response = self.client.get(self.url)
+        etag = response['ETag']
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+        Task.objects.create(board=self.board, title='Another task')
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_detail_answers_if_modified_since(self):
+        response = self.client.get(self.url)
+        last_modified = response['Last-Modified']
+        self.assertEqual(last_modified, http_date(self.CHANGED_AT.timestamp()))
+
+        response = self.client.get(self.url,
+                                   HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['Last-Modified'], last_modified)
+
+        Task.objects.create(board=self.board, title='Another task')
+        self.set_changed_at(self.CHANGED_AT + datetime.timedelta(seconds=5))
+        response = self.client.get(self.url,
+                                   HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 200)
+
+    def test_change_in_the_current_second_is_not_a_validator(self):
+        """
+        A second change within the second of the first one leaves the
+        timestamp's second unchanged; only the ETag tells them apart.
+        """
+        now = self.CHANGED_AT + datetime.timedelta(milliseconds=300)
+        with mock.patch.object(timezone, 'now', return_value=now):
+            response = self.client.get(self.url)
+            self.assertNotIn('Last-Modified', response)
+            etag = response['ETag']
+
+            Task.objects.create(board=self.board, title='Another task')
+            response = self.client.get(
+                self.url,
+                HTTP_IF_MODIFIED_SINCE=http_date(self.CHANGED_AT.timestamp()))
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn('Last-Modified', response)
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 200)
+
+    def test_tasks_answer_both_validators(self):
+        url = f'{self.url}tasks/'
+        response = self.client.get(url, {'status': 'to-do'})
+        self.assertEqual(len(response.json()['results']), 1)
+
+        for header, value in (('HTTP_IF_NONE_MATCH', response['ETag']),
+                              ('HTTP_IF_MODIFIED_SINCE',
+                               response['Last-Modified'])):
+            response = self.client.get(url, {'status': 'to-do'},
+                                       **{header: value})
+            self.assertEqual(response.status_code, 304)
+
+        # The ETag depends on the query string
+        response = self.client.get(url, {'status': 'done'},
+                                   HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 200)
+
+    def test_list_answers_if_none_match_only(self):
+        response = self.client.get('/api/boards/')
+        self.assertNotIn('Last-Modified', response)
+        etag = response['ETag']
+
+        response = self.client.get('/api/boards/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.board.delete()
+        response = self.client.get('/api/boards/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [])
+
+
+class BoardEventStreamTests(TestCase):
+    """
+    GET /api/boards/{id}/events/ authenticates tickets and relays events.
+
+    Events are published in on_commit callbacks, which TestCase only runs
+    inside captureOnCommitCallbacks(execute=True).
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = create_user('owner')
+        self.member = create_user('member')
+        self.outsider = create_user('outsider')
+        self.board = Board.objects.create(title='Board', owner=self.owner)
+        self.board.members.add(self.member)
+        self.url = f'/api/boards/{self.board.pk}/events/'
+
+    def ticket(self, user, board=None):
+        """Return a stream ticket of a user."""
+        return issue_ticket(user, board or self.board)['ticket']
+
+    async def open_stream(self, **params):
+        """Open the event stream and return the response."""
+        return await self.async_client.get(self.url, params)
+
+    async def next_chunk(self, stream):
+        """Return the next chunk of a stream as text."""
+        return (await asyncio.wait_for(anext(stream), timeout=5)).decode()
+
+    async def remaining_chunks(self, stream):
+        """Return the chunks of a stream until it ends, as text."""
+        chunks = []
+        while True:
+            try:
+                chunks.append(await self.next_chunk(stream))
+            except StopAsyncIteration:
+                return chunks
+
+    @sync_to_async
+    def create_task(self):
+        """Create a task and publish its event."""
+        with self.captureOnCommitCallbacks(execute=True):
+            return Task.objects.create(board=self.board, title='Task')
+
+    @sync_to_async
+    def delete_board(self):
+        """Delete the board, which ends its streams."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.board.delete()
+
+    def request_ticket(self, user):
+        """Request a stream ticket with the user's API token."""
+        token, _ = Token.objects.get_or_create(user=user)
+        return self.client.post(
+            f'/api/boards/{self.board.pk}/events/ticket/',
+            HTTP_AUTHORIZATION=f'Token {token.key}')
+
+    def test_ticket_is_issued_to_members_only(self):
+        response = self.request_ticket(self.member)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['expires_in'], 60)
+
+        self.assertEqual(self.request_ticket(self.outsider).status_code, 403)
+
+    async def test_invalid_tickets_are_rejected(self):
+        other = await Board.objects.acreate(title='Other', owner=self.member)
+        ticket = await sync_to_async(self.ticket)(self.member)
+        with mock.patch('django.core.signing.time.time',
+                        return_value=time.time() - 61):
+            expired = await sync_to_async(self.ticket)(self.member)
+        foreign = await sync_to_async(self.ticket)(self.member, other)
+
+        for value in (ticket[:-1] + ('A' if ticket[-1] != 'A' else 'B'),
+                      expired, foreign):
+            response = await self.open_stream(ticket=value)
+            self.assertEqual(response.status_code, 401)
+            self.assertEqual(response.json(),
+                             {'detail': 'Invalid or expired ticket.'})
+
+        response = await self.open_stream()
+        self.assertEqual(response.status_code, 401)
+
+    async def test_non_member_is_refused(self):
+        ticket = await sync_to_async(self.ticket)(self.outsider)
+        response = await self.open_stream(ticket=ticket)
+        self.assertEqual(response.status_code, 403)
+
+    async def test_published_event_reaches_the_subscriber(self):
+        ticket = await sync_to_async(self.ticket)(self.member)
+        response = await self.open_stream(ticket=ticket)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        stream = response.streaming_content
+        self.assertIn('event: ready', await self.next_chunk(stream))
+
+        task = await self.create_task()
+        await self.board.arefresh_from_db()
+        chunk = await self.next_chunk(stream)
+        self.assertTrue(chunk.startswith(
+            f'id: {self.board.version}\nevent: task.created\n'))
+        self.assertIn(f'"id": {task.pk}', chunk)
+
+        await self.delete_board()
+        rest = await self.remaining_chunks(stream)
+        self.assertEqual(len(rest), 1)
+        self.assertTrue(rest[0].startswith('event: board.deleted\n'))
+
+    async def test_missed_events_are_replayed(self):
+        await self.board.arefresh_from_db()
+        since = self.board.version
+        task = await self.create_task()
+        ticket = await sync_to_async(self.ticket)(self.member)
+
+        response = await self.open_stream(ticket=ticket, last_event_id=since)
+        stream = response.streaming_content
+        replay = await self.next_chunk(stream)
+        ready = await self.next_chunk(stream)
+        self.assertIn('event: task.created', replay)
+        self.assertIn(f'"id": {task.pk}', replay)
+        self.assertIn('event: ready', ready)
+
+        await self.delete_board()
+        self.assertEqual(len(await self.remaining_chunks(stream)), 1)
+
+
+class RedisBrokerTests(TestCase):
+    """RedisBroker explains a missing redis package."""
+
+    def test_missing_redis_package(self):
+        with mock.patch.dict(sys.modules, {'redis': None}):
+            with self.assertRaisesMessage(ImproperlyConfigured,
+                                          'pip install redis'):
+                RedisBroker('redis://localhost:6379/0')
+
+
+class BoardStreamTests(APITestCase):
+    """The board detail with ?stream=1 returns the buffered bytes."""
+
+    def test_stream_matches_buffered_response(self):
+        cache.clear()
+        owner = create_user('owner')
+        member = create_user('member')
+        board = Board.objects.create(title='Bäord \u2028', owner=owner)
+        board.members.add(member)
+        for index in range(12):
+            task = Task.objects.create(
+                board=board, title=f'Task "{index}" \U0001f600',
+                status=choices_status()[index % 4], assignee=member,
+                due_date=datetime.date(2026, 1, 1) if index % 2 else None)
+            TaskComment.objects.create(task=task, author=owner,
+                                       content='Comment')
+        self.client.force_authenticate(owner)
+
+        url = f'/api/boards/{board.pk}/'
+        buffered = self.client.get(url)
+        streamed = self.client.get(url, {'stream': 1})
+        self.assertTrue(streamed.streaming)
+        self.assertEqual(b''.join(streamed.streaming_content),
+                         buffered.content)
+        self.assertEqual(len(buffered.json()['tasks']), 12)
+
+
+class EmailCheckTests(APITestCase):
+    """
+    GET /api/email-check/ finds a user by email, or lists the users sharing
+    a board with the requesting user by email prefix.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = create_user('owner')
+        self.member = create_user('member')
+        self.outsider = create_user('memo')
+        self.board = Board.objects.create(title='Board', owner=self.owner)
+        self.board.members.add(self.member)
+        self.client.force_authenticate(self.owner)
+
+    def check(self, **params):
+        return self.client.get('/api/email-check/', params)
+
+    def emails(self, prefix):
+        response = self.check(prefix=prefix)
+        self.assertEqual(response.status_code, 200)
+        return [user['email'] for user in response.json()]
+
+    def test_exact_match_ignores_case(self):
+        response = self.check(email='MEMBER@Example.COM')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            'id': self.member.pk, 'email': 'member@example.com',
+            'fullname': 'Member'})
+        # Any user can be found by the full address
+        self.assertEqual(self.check(email='Memo@example.com').json()['id'],
+                         self.outsider.pk)
+
+    def test_exact_case_is_preferred(self):
+        upper = User.objects.create_user('upper', 'Member@example.com')
+        UserProfile.objects.create(user=upper, full_name='Upper')
+
+        self.assertEqual(self.check(email='Member@example.com').json()['id'],
+                         upper.pk)
+        self.assertEqual(self.check(email='member@example.com').json()['id'],
+                         self.member.pk)
+        self.assertEqual(self.check(email='MEMBER@example.com').json()['id'],
+                         self.member.pk)
+
+    def test_errors(self):
+        response = self.check(email='nobody@example.com')
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json(),
+                         {'Error': 'No Profile with this email found !'})
+        self.assertEqual(self.check().status_code, 400)
+        self.assertEqual(self.check(prefix=' me ').status_code, 400)
+
+    def test_prefix_lists_only_users_sharing_a_board(self):
+        self.assertEqual(self.emails('MEM'), ['member@example.com'])
+        self.assertEqual(self.emails('own'), [])
+
+        self.client.force_authenticate(self.member)
+        self.assertEqual(self.emails('own'), ['owner@example.com'])
+        self.assertEqual(self.emails('mem'), [])
+
+        self.client.force_authenticate(self.outsider)
+        self.assertEqual(self.emails('mem'), [])
+        self.assertEqual(self.emails('own'), [])
+
+    def test_prefix_follows_membership(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.board.members.add(self.outsider)
+        self.assertEqual(self.emails('mem'),
+                         ['member@example.com', 'memo@example.com'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.board.members.remove(self.member)
+        self.assertEqual(self.emails('mem'), ['memo@example.com'])
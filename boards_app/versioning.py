@@ -0,0 +1,27 @@
+"""
+Board versioning.
+
+Every change to a board, its members, tasks or comments bumps the board's
+version counter and updated_at timestamp. The version is the basis for the
+ETag and Last-Modified validators of the board and task endpoints.
+"""
+
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Board
+
+
+def bump_board_version(*board_ids):
+    """
+    Increment the version of the given boards.
+
+    Uses an F() expression so concurrent writers never reuse a version.
+
+    Args:
+        *board_ids (int): IDs of the boards that changed
+    """
+    board_ids = {pk for pk in board_ids if pk is not None}
+    if board_ids:
+        Board.objects.filter(pk__in=board_ids).update(
+            version=F('version') + 1, updated_at=timezone.now())
@@ -0,0 +1,103 @@
+"""
+Conditional request helpers.
+
+This module computes ETag/Last-Modified validators and answers conditional
+GET requests with 304 Not Modified before any serialization work is done.
+
+Last-Modified has a resolution of one second, while a board can change
+several times within a second. A timestamp is therefore only used as a
+validator once its second has passed; until then clients revalidate with
+the ETag, which follows every version.
+"""
+
+import hashlib
+
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+def compute_etag(*parts):
+    """
+    Build a strong ETag from the given parts.
+
+    Args:
+        *parts: Values identifying the representation (IDs, versions,
+            query strings)
+
+    Returns:
+        str: Quoted ETag value
+    """
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def stable_last_modified(last_modified):
+    """
+    Return the time of the last change if it can serve as a validator.
+
+    A change in the current second may be followed by another one within
+    the same second, which an If-Modified-Since of that second would not
+    detect.
+
+    Args:
+        last_modified (datetime): Time of the last change (optional)
+
+    Returns:
+        datetime | None: last_modified, or None if its second has not
+        passed yet
+    """
+    if last_modified is None:
+        return None
+    if int(last_modified.timestamp()) >= int(timezone.now().timestamp()):
+        return None
+    return last_modified
+
+
+def not_modified_response(request, etag, last_modified=None):
+    """
+    Return a 304 response if the client's cached representation is current.
+
+    Evaluates If-None-Match and If-Modified-Since like Django's
+    condition decorator. If-Modified-Since is ignored while the last
+    change is in the current second (see stable_last_modified).
+
+    Args:
+        request: DRF Request or Django HttpRequest
+        etag (str): Current ETag of the representation
+        last_modified (datetime): Time of the last change (optional)
+
+    Returns:
+        HttpResponse | None: 304 response, or None if the full response
+        must be built
+    """
+    request = getattr(request, '_request', request)
+    last_modified = stable_last_modified(last_modified)
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(
+        request, etag=etag, last_modified=timestamp)
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+
+def set_validators(response, etag, last_modified=None):
+    """
+    Add ETag and Last-Modified headers to a response.
+
+    Last-Modified is left out while the last change is in the current
+    second (see stable_last_modified).
+
+    Args:
+        response: Response to update
+        etag (str): ETag of the representation
+        last_modified (datetime): Time of the last change (optional)
+
+    Returns:
+        Response: The updated response
+    """
+    response['ETag'] = etag
+    last_modified = stable_last_modified(last_modified)
+    if last_modified:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    return response
@@ -0,0 +1,47 @@
+"""
+Shared API pagination.
+
+This module defines the keyset (cursor) pagination base class used by the
+list endpoints of all apps.
+"""
+
+from rest_framework.pagination import CursorPagination
+
+
+class OptionalCursorPagination(CursorPagination):
+    """
+    Opt-in keyset pagination.
+
+    Pages are addressed by an opaque cursor encoding the position in the
+    queryset ordering, so fetching a page costs a single indexed range scan
+    no matter how deep the client has paged, and cursors stay stable while
+    rows are inserted or deleted.
+
+    Pagination is only applied when the client sends a ``page_size`` or
+    ``cursor`` query parameter. Requests without them keep receiving the
+    plain list response existing clients rely on.
+
+    Query Parameters:
+        page_size (int): Number of results per page (max 200)
+        cursor (str): Opaque cursor taken from a previous next/previous link
+    """
+
+    page_size = 50
+    max_page_size = 200
+    page_size_query_param = 'page_size'
+
+    def get_page_size(self, request):
+        """
+        Return the page size, or None when pagination was not requested.
+
+        Args:
+            request: HTTP request
+
+        Returns:
+            int | None: Page size or None to disable pagination
+        """
+        params = request.query_params
+        if (self.cursor_query_param not in params
+                and self.page_size_query_param not in params):
+            return None
+        return super().get_page_size(request)
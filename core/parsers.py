@@ -0,0 +1,53 @@
+"""
+Shared API parsers.
+
+This module provides a JSON parser backed by orjson when it is installed.
+Bodies orjson rejects (NaN/Infinity constants, invalid documents) and non
+UTF-8 bodies are handed to DRF's JSONParser, so accepted input and error
+messages stay the same as before. Older orjson releases read integers
+beyond 64 bits as floats, which integer fields then reject as invalid.
+"""
+
+import io
+
+from django.conf import settings
+from rest_framework.parsers import JSONParser
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class FastJSONParser(JSONParser):
+    """
+    JSON parser using orjson when available.
+
+    Enable it through REST_FRAMEWORK['DEFAULT_PARSER_CLASSES'].
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Parse the incoming bytestream as JSON.
+
+        Args:
+            stream: Request body stream
+            media_type (str): Content type of the body (optional)
+            parser_context (dict): View, request and encoding (optional)
+
+        Returns:
+            Parsed data
+
+        Raises:
+            ParseError: If the body is not valid JSON
+        """
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        if orjson is None or encoding.lower().replace('_', '-') != 'utf-8':
+            return super().parse(stream, media_type, parser_context)
+
+        body = stream.read()
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            return super().parse(io.BytesIO(body), media_type, parser_context)
@@ -0,0 +1,66 @@
+"""
+Shared API renderers.
+
+This module provides a JSON renderer backed by orjson when it is
+installed. Its output matches DRF's JSONRenderer: dates, datetimes,
+Decimals and other special values are converted by DRF's JSON encoder,
+and U+2028/U+2029 are escaped. Without orjson, or for output orjson cannot
+produce (indentation, non-default JSON settings, integers beyond 64 bits),
+rendering falls back to JSONRenderer.
+
+One difference remains: orjson writes NaN and infinite floats as null,
+where JSONRenderer with STRICT_JSON raises ValueError. The only floats the
+API renders are search scores, which are always finite; detecting others
+would mean walking every payload, which costs what orjson saves.
+"""
+
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSON renderer using orjson when available.
+
+    Enable it through REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'].
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render data into JSON, returning a bytestring.
+
+        Args:
+            data: Data to render
+            accepted_media_type (str): Negotiated media type (optional)
+            renderer_context (dict): View, request and response (optional)
+
+        Returns:
+            bytes: Rendered JSON
+        """
+        if orjson is None or not self._is_default_format():
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=(orjson.OPT_PASSTHROUGH_DATETIME
+                        | orjson.OPT_PASSTHROUGH_DATACLASS
+                        | orjson.OPT_NON_STR_KEYS),
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(
+            b'\xe2\x80\xa9', b'\\u2029')
+
+    def _is_default_format(self):
+        """Return whether the JSON settings match orjson's output."""
+        return self.compact and not self.ensure_ascii and self.strict
@@ -9,6 +9,7 @@ https://docs.djangoproject.com/en/5.2/topics/settings/
 For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
+import importlib.util
 import os
 from pathlib import Path
 from dotenv import load_dotenv
@@ -49,6 +50,7 @@ INSTALLED_APPS = [
     "auth_app",
     "boards_app",
     "tasks_app",
+    "search_app",
 ]
 
 MIDDLEWARE = [
@@ -93,6 +95,64 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# In-process cache by default; set REDIS_URL to share it between workers.
+
+REDIS_URL = os.getenv("REDIS_URL")
+
+if REDIS_URL:
+    if importlib.util.find_spec('redis') is None:
+        raise ValueError(
+            "REDIS_URL is set, but the redis package is not installed "
+            "(pip install redis).")
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+    BOARD_EVENTS_BROKER = 'boards_app.broker.RedisBroker'
+    AUTH_TOKEN_CACHE_SHARED = True
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+    BOARD_EVENTS_BROKER = 'boards_app.broker.InProcessBroker'
+    AUTH_TOKEN_CACHE_SHARED = False
+
+# Lifetime in seconds of cached board membership entries
+BOARD_CACHE_TIMEOUT = 300
+
+# Lifetime in seconds and per-process capacity of cached token lookups
+AUTH_TOKEN_CACHE_TIMEOUT = 300
+AUTH_TOKEN_CACHE_SIZE = 10000
+
+# Lifetime in seconds of cached token lookups without a shared cache; other
+# workers accept a revoked token for at most this long
+AUTH_TOKEN_CACHE_LOCAL_TIMEOUT = 5
+
+# Threads hashing passwords, hashing jobs that may wait for one and seconds
+# a request waits for its hash before sign-in requests are rejected with 429
+# (see auth_app.hashing). Every admitted job holds a request thread, so
+# keep AUTH_HASH_WORKERS + AUTH_HASH_QUEUE_SIZE well below the server's
+# threads per process.
+AUTH_HASH_WORKERS = 2
+AUTH_HASH_QUEUE_SIZE = 4
+AUTH_HASH_TIMEOUT = 2
+
+# Days board change log entries are kept (see compact_board_changes)
+BOARD_CHANGE_RETENTION_DAYS = 30
+
+# Seconds between heartbeats on idle board event streams
+BOARD_EVENTS_HEARTBEAT = 15
+
+# Seconds a board event stream ticket can be used to connect
+BOARD_EVENTS_TICKET_MAX_AGE = 60
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -145,6 +205,20 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'auth_app.authentication.CachedTokenAuthentication',
+    ],
+    # Use orjson when installed; both fall back to the stdlib json module.
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
     ],
+    'DEFAULT_PARSER_CLASSES': [
+        'core.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+    # Per-user rates of views with a throttle_scope
+    'DEFAULT_THROTTLE_RATES': {
+        'email-check': '120/min',
+    },
 }
@@ -0,0 +1,145 @@
+"""
+Streaming JSON responses.
+
+This module renders large list responses incrementally. Rows are read from
+the database in chunks, serialized one at a time and written out in
+buffered pieces, so the memory a response needs stays flat no matter how
+many rows it contains.
+"""
+
+from collections.abc import Iterator
+
+from django.http import StreamingHttpResponse
+from rest_framework.renderers import JSONRenderer
+
+STREAM_CHUNK_SIZE = 500
+STREAM_BUFFER_SIZE = 64 * 1024
+
+
+def wants_stream(request):
+    """
+    Return whether the client asked for a streamed response.
+
+    Args:
+        request: DRF Request
+
+    Returns:
+        bool: True if the stream query parameter is set to 1 or true
+    """
+    return request.query_params.get('stream', '').lower() in ('1', 'true')
+
+
+def stream_rows(queryset, serializer, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Yield the serialized rows of a queryset without loading it at once.
+
+    The serializer instance is reused for every row, so its fields are
+    only built once.
+
+    Args:
+        queryset (QuerySet): Rows to serialize; prefetches are applied per
+            chunk
+        serializer (Serializer): Serializer whose to_representation is
+            called for each row
+        chunk_size (int): Rows fetched from the database at a time
+
+    Yields:
+        dict: Serialized row
+    """
+    for instance in queryset.iterator(chunk_size=chunk_size):
+        yield serializer.to_representation(instance)
+
+
+class StreamingJSONRenderer(JSONRenderer):
+    """
+    JSON renderer producing its output piece by piece.
+
+    Iterators (such as stream_rows) placed in the rendered data or directly
+    inside one of its dicts or lists are rendered as JSON arrays while they
+    are consumed; everything else is encoded like JSONRenderer does,
+    including the escaping of U+2028 and U+2029.
+    """
+
+    def iter_render(self, data, buffer_size=STREAM_BUFFER_SIZE):
+        """
+        Render data as a sequence of UTF-8 chunks.
+
+        Args:
+            data: Data to render
+            buffer_size (int): Approximate size of the yielded chunks
+
+        Yields:
+            bytes: Rendered JSON
+        """
+        encoder = self.encoder_class(
+            ensure_ascii=self.ensure_ascii,
+            allow_nan=not self.strict,
+            separators=(',', ':') if self.compact else (', ', ': '),
+        )
+        buffer = []
+        size = 0
+        for piece in self._iter_json(data, encoder.encode):
+            buffer.append(piece)
+            size += len(piece)
+            if size >= buffer_size:
+                yield self._join(buffer)
+                buffer, size = [], 0
+        if buffer:
+            yield self._join(buffer)
+
+    def _join(self, pieces):
+        """Join rendered pieces into one encoded chunk."""
+        text = ''.join(pieces)
+        text = text.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029')
+        return text.encode()
+
+    def _iter_json(self, data, encode):
+        """Yield the JSON text of data, streaming iterators it contains."""
+        if isinstance(data, Iterator):
+            yield '['
+            for index, item in enumerate(data):
+                if index:
+                    yield ','
+                yield encode(item)
+            yield ']'
+        elif isinstance(data, dict) and _has_iterator(data.values()):
+            yield '{'
+            for index, (key, value) in enumerate(data.items()):
+                if index:
+                    yield ','
+                yield encode(str(key)) + ':'
+                yield from self._iter_json(value, encode)
+            yield '}'
+        elif isinstance(data, (list, tuple)) and _has_iterator(data):
+            yield '['
+            for index, item in enumerate(data):
+                if index:
+                    yield ','
+                yield from self._iter_json(item, encode)
+            yield ']'
+        else:
+            yield encode(data)
+
+
+def _has_iterator(values):
+    """Return whether any of the values is an iterator."""
+    return any(isinstance(value, Iterator) for value in values)
+
+
+class StreamingJSONResponse(StreamingHttpResponse):
+    """
+    Streamed application/json response.
+
+    Args:
+        data: Data to render; iterators are streamed as JSON arrays
+        status (int): HTTP status code (default 200)
+    """
+
+    def __init__(self, data, status=200, **kwargs):
+        renderer = StreamingJSONRenderer()
+        super().__init__(
+            renderer.iter_render(data),
+            status=status,
+            content_type='application/json',
+            **kwargs,
+        )
@@ -0,0 +1,184 @@
+"""
+Core tests.
+
+Covers the orjson-backed JSON renderer and parser, which must produce and
+accept the same data as DRF's JSON renderer and parser, and the streaming
+renderer, which must produce the same bytes as DRF's JSON renderer.
+"""
+
+import datetime
+import decimal
+import io
+import json
+import unittest
+import uuid
+from unittest import mock
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from . import parsers, renderers
+from .streaming import StreamingJSONRenderer
+
+PAYLOADS = {
+    'decimal': {'amount': decimal.Decimal('12.50'),
+                'tiny': decimal.Decimal('0.1')},
+    'datetime': {
+        'aware': datetime.datetime(2026, 10, 18, 12, 30, 5, 123456,
+                                   tzinfo=datetime.timezone.utc),
+        'naive': datetime.datetime(2026, 10, 18, 12, 30),
+        'date': datetime.date(2026, 10, 18),
+        'time': datetime.time(8, 15, 30),
+        'duration': datetime.timedelta(days=1, seconds=5),
+    },
+    'uuid': {'id': uuid.UUID('12345678-1234-5678-1234-567812345678')},
+    'lazy': {'detail': gettext_lazy('This field is required.')},
+    'nested': {
+        'board': {
+            'id': 1,
+            'members': [{'id': 2, 'fullname': 'Jane Doe'}, None],
+            'tasks': ({'id': 3, 'due_date': datetime.date(2026, 1, 2),
+                       'comments_count': 0, 'done': False},),
+            'stats': {1: 'int key', 'ratio': 0.25},
+        },
+    },
+    'text': {'title': 'line\u2028paragraph\u2029 \u00fcml\u00e4ut \U0001f600'},
+    'big_int': {'value': 2 ** 70},
+    'list': [1, 'two', 3.5, None, True],
+}
+
+BODIES = {
+    'object': b'{"title": "Task", "members": [1, 2], "due_date": null}',
+    'unicode': '{"fullname": "Jürgen \U0001f600"}'.encode(),
+    'escaped': b'{"text": "\\u00fc\\n"}',
+    'big_int': b'{"value": 1180591620717411303424}',
+    'float': b'{"value": 1.5e3}',
+    'list': b'[1, "two", {"three": 3}]',
+}
+
+INVALID_BODIES = {
+    'truncated': b'{"title": ',
+    'trailing_comma': b'[1, 2,]',
+    'empty': b'',
+}
+
+
+class JSONEquivalenceMixin:
+    """
+    Compare the fast renderer and parser with DRF's.
+
+    Subclasses set orjson to the module used, or None to run the stdlib
+    fallback.
+    """
+
+    orjson = None
+
+    def setUp(self):
+        for module in (renderers, parsers):
+            patcher = mock.patch.object(module, 'orjson', self.orjson)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_rendered_payloads_match_json_renderer(self):
+        for name, payload in PAYLOADS.items():
+            with self.subTest(payload=name):
+                fast = renderers.FastJSONRenderer().render(payload)
+                expected = JSONRenderer().render(payload)
+                self.assertEqual(json.loads(fast), json.loads(expected))
+                self.assertNotIn('\u2028'.encode(), fast)
+
+    def test_non_strict_output_matches_json_renderer(self):
+        payload = {'value': float('nan'), 'limit': float('inf')}
+        for renderer in (renderers.FastJSONRenderer, JSONRenderer):
+            with self.subTest(renderer=renderer.__name__):
+                with mock.patch.object(renderer, 'strict', False):
+                    self.assertEqual(renderer().render(payload),
+                                     b'{"value":NaN,"limit":Infinity}')
+
+    def test_none_renders_empty_body(self):
+        self.assertEqual(renderers.FastJSONRenderer().render(None), b'')
+
+    def test_indented_output_matches_json_renderer(self):
+        payload = PAYLOADS['nested']
+        media_type = 'application/json; indent=2'
+        self.assertEqual(
+            renderers.FastJSONRenderer().render(payload, media_type),
+            JSONRenderer().render(payload, media_type))
+
+    def test_parsed_bodies_match_json_parser(self):
+        for name, body in BODIES.items():
+            with self.subTest(body=name):
+                self.assertEqual(
+                    parsers.FastJSONParser().parse(io.BytesIO(body)),
+                    JSONParser().parse(io.BytesIO(body)))
+
+    def test_invalid_bodies_raise_parse_error(self):
+        for name, body in INVALID_BODIES.items():
+            with self.subTest(body=name):
+                with self.assertRaises(ParseError) as expected:
+                    JSONParser().parse(io.BytesIO(body))
+                with self.assertRaises(ParseError) as fast:
+                    parsers.FastJSONParser().parse(io.BytesIO(body))
+                self.assertEqual(str(fast.exception.detail),
+                                 str(expected.exception.detail))
+
+
+class StdlibJSONEquivalenceTests(JSONEquivalenceMixin, SimpleTestCase):
+    """Without orjson, rendering and parsing fall back to DRF's classes."""
+
+    orjson = None
+
+
+@unittest.skipIf(renderers.orjson is None, 'orjson is not installed')
+class OrjsonEquivalenceTests(JSONEquivalenceMixin, SimpleTestCase):
+    """With orjson, output and parsed data match DRF's classes."""
+
+    orjson = renderers.orjson
+
+    def test_non_finite_floats_render_as_null(self):
+        """The documented difference: JSONRenderer raises ValueError."""
+        payload = {'value': float('nan'), 'limit': float('-inf')}
+        self.assertEqual(renderers.FastJSONRenderer().render(payload),
+                         b'{"value":null,"limit":null}')
+        with self.assertRaises(ValueError):
+            JSONRenderer().render(payload)
+
+
+class StreamingJSONRendererTests(SimpleTestCase):
+    """Streamed output is byte for byte what JSONRenderer renders."""
+
+    def render(self, data, buffer_size=1):
+        """Render data with StreamingJSONRenderer and join the chunks."""
+        chunks = list(StreamingJSONRenderer().iter_render(data, buffer_size))
+        return b''.join(chunks)
+
+    def test_payloads_match_json_renderer(self):
+        for name, payload in PAYLOADS.items():
+            with self.subTest(payload=name):
+                self.assertEqual(self.render(payload),
+                                 JSONRenderer().render(payload))
+
+    def test_iterators_render_as_arrays(self):
+        rows = [PAYLOADS[name] for name in ('datetime', 'text', 'nested')]
+        cases = {
+            'iterator': (iter(rows), rows),
+            'empty': (iter([]), []),
+            'dict': ({'count': 3, 'results': iter(rows), 'next': None},
+                     {'count': 3, 'results': rows, 'next': None}),
+            'list': ([iter(rows), {'id': 1}, iter([])],
+                     [rows, {'id': 1}, []]),
+        }
+        for name, (streamed, buffered) in cases.items():
+            with self.subTest(case=name):
+                self.assertEqual(self.render(streamed),
+                                 JSONRenderer().render(buffered))
+
+    def test_chunks_are_buffered(self):
+        rows = ({'id': index, 'title': 'Task \u2028'} for index in range(1000))
+        chunks = list(StreamingJSONRenderer().iter_render(rows, 4096))
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(chunk) >= 4096 for chunk in chunks[:-1]))
+        self.assertNotIn('\u2028'.encode(), b''.join(chunks))
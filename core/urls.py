@@ -23,4 +23,8 @@ urlpatterns = [
     # Task and comment API endpoints
     # /api/tasks/, /api/tasks/{id}/comments/
     path('api/', include('tasks_app.api.urls')),
+
+    # Search API endpoint
+    # /api/search/
+    path('api/', include('search_app.api.urls')),
 ]
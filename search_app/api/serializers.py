@@ -0,0 +1,84 @@
+"""
+Search API serializers.
+
+This module contains serializers for the search query parameters and the
+search results.
+"""
+
+from rest_framework import serializers
+
+from ..index import RANK_CANDIDATES
+
+
+class SearchQuerySerializer(serializers.Serializer):
+    """
+    Serializer for the query parameters of a search request.
+
+    Fields:
+        q (str): Words to search for
+        board (int): Restrict the search to this board (optional)
+        page (int): Page number, starting at 1
+        page_size (int): Results per page
+    """
+
+    max_page_size = 100
+    max_results = RANK_CANDIDATES
+
+    q = serializers.CharField(
+        max_length=200,
+        help_text="Words to search for"
+    )
+    board = serializers.IntegerField(
+        required=False,
+        help_text="Board ID to restrict the search to"
+    )
+    page = serializers.IntegerField(
+        min_value=1,
+        default=1,
+        help_text="Page number, starting at 1"
+    )
+    page_size = serializers.IntegerField(
+        min_value=1,
+        max_value=max_page_size,
+        default=20,
+        help_text="Results per page"
+    )
+
+    def validate(self, data):
+        """
+        Limit how deep clients can page.
+
+        Only the newest RANK_CANDIDATES matches are ranked, so pages past
+        them would always be empty.
+
+        Raises:
+            ValidationError: If the page starts after max_results
+        """
+        if (data['page'] - 1) * data['page_size'] >= self.max_results:
+            raise serializers.ValidationError({"page": (
+                f"Only the first {self.max_results} results can be paged "
+                "through.")})
+        return data
+
+
+class SearchResultSerializer(serializers.Serializer):
+    """
+    Serializer for one search result.
+
+    Fields:
+        type (str): "task" or "comment"
+        id (int): ID of the task or comment
+        board (int): Board of the task
+        task (int): Task itself or the task the comment belongs to
+        title (str): Task title
+        text (str): Task description or comment content
+        score (float): Relevance, higher is better (null without an index)
+    """
+
+    type = serializers.CharField(source='kind')
+    id = serializers.IntegerField(source='object_id')
+    board = serializers.IntegerField(source='board_id')
+    task = serializers.IntegerField(source='task_id')
+    title = serializers.CharField()
+    text = serializers.CharField(source='body')
+    score = serializers.FloatField(allow_null=True)
@@ -0,0 +1,15 @@
+"""
+Search API URL configuration.
+
+Defines the URL pattern of the search endpoint.
+"""
+
+from django.urls import path
+from .views import SearchView
+
+
+urlpatterns = [
+    # Full-text search over tasks and comments
+    # GET /api/search/?q=...&board=...
+    path('search/', SearchView.as_view(), name='search'),
+]
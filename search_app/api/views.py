@@ -0,0 +1,91 @@
+"""
+Search API views.
+
+This module contains the full-text search endpoint over tasks and comments.
+"""
+
+from rest_framework import views
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from boards_app.cache import get_visible_board_ids
+from ..index import search, search_terms
+from .serializers import SearchQuerySerializer, SearchResultSerializer
+
+
+class SearchView(views.APIView):
+    """
+    API endpoint for searching tasks and comments.
+
+    GET /api/search/?q=words&board=1&page=1&page_size=20
+
+    Searches task titles, task descriptions and comment contents on the
+    boards the user owns or is a member of. Results are ranked by relevance
+    with title matches first and paginated by page number; the last word
+    also matches as a prefix.
+
+    Only the newest RANK_CANDIDATES (1000) matches are ranked. A query
+    matching more documents than that never returns the older ones, even
+    when they match better; narrowing the query or the board brings them
+    back into range.
+
+    Permissions:
+        - IsAuthenticated: User must be logged in
+
+    Query Parameters:
+        q (str): Words to search for (all must match)
+        board (int): Restrict the search to this board (optional)
+        page (int): Page number (default 1)
+        page_size (int): Results per page (default 20, max 100)
+
+    Returns:
+        200: next and previous page links and the results of the page
+        400: Missing query or invalid parameters
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """
+        Search the boards visible to the user.
+
+        Args:
+            request: HTTP request with the search query parameters
+
+        Returns:
+            Response: Page of ranked results
+        """
+        params = SearchQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        page = params.validated_data['page']
+        page_size = params.validated_data['page_size']
+
+        board_ids = get_visible_board_ids(request.user.pk)
+        if 'board' in params.validated_data:
+            board_ids = board_ids & {params.validated_data['board']}
+
+        # One extra row tells whether there is a next page without counting
+        # all matches.
+        rows = search(search_terms(params.validated_data['q']), board_ids,
+                      limit=page_size + 1, offset=(page - 1) * page_size)
+        has_next = (len(rows) > page_size
+                    and page * page_size < params.max_results)
+
+        url = request.build_absolute_uri()
+        next_link = (replace_query_param(url, 'page', page + 1)
+                     if has_next else None)
+        results = SearchResultSerializer(rows[:page_size], many=True).data
+        return Response({
+            'next': next_link,
+            'previous': self.get_previous_link(url, page),
+            'results': results,
+        })
+
+    def get_previous_link(self, url, page):
+        """Return the link to the previous page, or None on the first."""
+        if page == 1:
+            return None
+        if page == 2:
+            return remove_query_param(url, 'page')
+        return replace_query_param(url, 'page', page - 1)
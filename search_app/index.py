@@ -0,0 +1,232 @@
+"""
+Full-text index of tasks and comments.
+
+Task and comment texts are copied into SearchDocument rows, which the
+database indexes itself:
+
+- SQLite: an FTS5 table with external content, kept in sync with the
+  document table by triggers and ranked with bm25.
+- PostgreSQL: a generated tsvector column with a GIN index, ranked with
+  ts_rank_cd.
+
+Both are created by the search_app migrations. Other backends fall back to
+unindexed substring matching.
+
+Queries are split into words. All words must match and the last one also
+matches as a prefix, so results keep up while the user types. The newest
+RANK_CANDIDATES matches are ranked, title matches weighing more than
+description and comment matches.
+"""
+
+import re
+
+from django.db import connection
+from django.db.models import Q
+
+from tasks_app.models import Task, TaskComment
+from .models import SearchDocument
+
+FTS_TABLE = 'search_app_searchdocument_fts'
+
+# Words of a query that are searched for; the rest is ignored
+MAX_TERMS = 16
+
+# Boards up to which the SQLite board filter is part of the FTS5 match, so
+# the index intersects boards and words instead of filtering rows after
+MATCH_BOARD_LIMIT = 200
+
+# Matches that are ranked, newest first. Ranking has to score every ranked
+# match, so this bounds the cost of words that occur in most documents;
+# rarer words are ranked over all their matches.
+RANK_CANDIDATES = 1000
+
+# bm25 weights of the FTS5 columns title, body and board_id
+TITLE_WEIGHT = 4.0
+BODY_WEIGHT = 1.0
+
+DOCUMENT_FIELDS = ['board', 'task', 'title', 'body']
+
+# Task fields whose changes have to be indexed
+INDEXED_TASK_FIELDS = {'board', 'title', 'description'}
+
+
+def search_terms(query):
+    """
+    Split a search query into lowercase words.
+
+    Args:
+        query (str): Query entered by the user
+
+    Returns:
+        list: Up to MAX_TERMS words
+    """
+    return re.findall(r'\w+', query.lower())[:MAX_TERMS]
+
+
+def task_document(task):
+    """Return the unsaved search document of a task."""
+    return SearchDocument(
+        kind='task', object_id=task.pk, board_id=task.board_id,
+        task_id=task.pk, title=task.title, body=task.description or '')
+
+
+def comment_document(comment, board_id):
+    """Return the unsaved search document of a comment on a board."""
+    return SearchDocument(
+        kind='comment', object_id=comment.pk, board_id=board_id,
+        task_id=comment.task_id, title='', body=comment.content)
+
+
+def save_documents(documents, batch_size=500):
+    """
+    Insert or replace search documents.
+
+    Args:
+        documents (list): Unsaved SearchDocument instances
+        batch_size (int): Documents written per query
+    """
+    SearchDocument.objects.bulk_create(
+        documents,
+        batch_size=batch_size,
+        update_conflicts=True,
+        unique_fields=['kind', 'object_id'],
+        update_fields=DOCUMENT_FIELDS,
+    )
+
+
+def index_tasks(tasks):
+    """
+    Index tasks with one upsert per batch.
+
+    Args:
+        tasks (iterable): Saved tasks with title and description loaded
+    """
+    save_documents([task_document(task) for task in tasks])
+
+
+def index_comments(comments):
+    """
+    Index comments with one upsert per batch.
+
+    Board IDs are taken from loaded tasks; the others are fetched with one
+    query.
+
+    Args:
+        comments (iterable): Saved comments
+    """
+    comments = list(comments)
+    board_ids = {
+        comment.task_id: comment.task.board_id for comment in comments
+        if TaskComment.task.is_cached(comment)
+    }
+    missing = {comment.task_id for comment in comments} - set(board_ids)
+    if missing:
+        board_ids.update(Task.objects.filter(pk__in=missing)
+                         .values_list('pk', 'board_id'))
+    save_documents([comment_document(comment, board_ids[comment.task_id])
+                    for comment in comments if comment.task_id in board_ids])
+
+
+def search(terms, board_ids, limit, offset=0):
+    """
+    Return the best matching documents on the given boards.
+
+    Args:
+        terms (list): Words from search_terms()
+        board_ids (iterable): Boards to search
+        limit (int): Maximum number of results
+        offset (int): Number of better results to skip
+
+    Returns:
+        list: Dicts with kind, object_id, board_id, task_id, title (of
+        the task), body and score (higher is better; None without an
+        index), best match first
+    """
+    board_ids = sorted(board_ids)
+    if not terms or not board_ids:
+        return []
+    if connection.vendor == 'sqlite':
+        return _search_sqlite(terms, board_ids, limit, offset)
+    if connection.vendor == 'postgresql':
+        return _search_postgresql(terms, board_ids, limit, offset)
+    return _search_fallback(terms, board_ids, limit, offset)
+
+
+def _fetch(sql, params):
+    """Run a search query and return its rows as dicts."""
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        columns = [column[0] for column in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def _search_sqlite(terms, board_ids, limit, offset):
+    """Rank the newest RANK_CANDIDATES matches of the FTS5 table."""
+    words = ' '.join(f'"{term}"' for term in terms) + '*'
+    match = f'{{title body}} : ({words})'
+    params = []
+    board_filter = ''
+    if len(board_ids) <= MATCH_BOARD_LIMIT:
+        boards = ' OR '.join(f'"{board_id}"' for board_id in board_ids)
+        match = f'board_id : ({boards}) AND {match}'
+    else:
+        placeholders = ', '.join(['%s'] * len(board_ids))
+        board_filter = f"AND d.board_id IN ({placeholders})"
+        params = board_ids
+    return _fetch(f"""
+        SELECT d.kind, d.object_id, d.board_id, d.task_id, t.title, d.body,
+               candidates.score
+        FROM (
+            SELECT {FTS_TABLE}.rowid AS id,
+                   -bm25({FTS_TABLE}, %s, %s, 0.0) AS score
+            FROM {FTS_TABLE}
+            JOIN {SearchDocument._meta.db_table} d ON d.id = {FTS_TABLE}.rowid
+            WHERE {FTS_TABLE} MATCH %s {board_filter}
+            ORDER BY {FTS_TABLE}.rowid DESC
+            LIMIT %s
+        ) candidates
+        JOIN {SearchDocument._meta.db_table} d ON d.id = candidates.id
+        JOIN {Task._meta.db_table} t ON t.id = d.task_id
+        ORDER BY candidates.score DESC, d.id DESC
+        LIMIT %s OFFSET %s
+    """, [TITLE_WEIGHT, BODY_WEIGHT, match, *params, RANK_CANDIDATES,
+          limit, offset])
+
+
+def _search_postgresql(terms, board_ids, limit, offset):
+    """Rank the newest RANK_CANDIDATES matches of the tsvector column."""
+    query = ' & '.join(terms) + ':*'
+    return _fetch(f"""
+        SELECT d.kind, d.object_id, d.board_id, d.task_id, t.title, d.body,
+               ts_rank_cd(d.search_vector, q) AS score
+        FROM (
+            SELECT id
+            FROM {SearchDocument._meta.db_table}
+            WHERE search_vector @@ to_tsquery('simple', %s)
+                  AND board_id = ANY(%s)
+            ORDER BY id DESC
+            LIMIT %s
+        ) candidates
+        JOIN {SearchDocument._meta.db_table} d ON d.id = candidates.id
+        JOIN {Task._meta.db_table} t ON t.id = d.task_id,
+             to_tsquery('simple', %s) q
+        ORDER BY score DESC, d.id DESC
+        LIMIT %s OFFSET %s
+    """, [query, board_ids, RANK_CANDIDATES, query, limit, offset])
+
+
+def _search_fallback(terms, board_ids, limit, offset):
+    """Match words as substrings on backends without a full-text index."""
+    documents = SearchDocument.objects.filter(board_id__in=board_ids)
+    for term in terms:
+        documents = documents.filter(
+            Q(title__icontains=term) | Q(body__icontains=term))
+    rows = documents.order_by('-pk').values(
+        'kind', 'object_id', 'board_id', 'task_id', 'task__title', 'body'
+    )[offset:offset + limit]
+    results = []
+    for row in rows:
+        row['title'] = row.pop('task__title')
+        row['score'] = None
+        results.append(row)
+    return results
@@ -0,0 +1,89 @@
+"""
+Management command to rebuild the search index.
+
+Usage:
+    python manage.py rebuild_search_index
+    python manage.py rebuild_search_index --batch-size 1000
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from search_app.index import FTS_TABLE, index_comments, index_tasks
+from search_app.models import SearchDocument
+from tasks_app.models import Task, TaskComment
+
+
+class Command(BaseCommand):
+    """
+    Rewrite the search documents of all tasks and comments.
+
+    Documents are upserted in batches and documents of comments that no
+    longer exist are removed afterwards, so search keeps working while the
+    command runs. On SQLite the FTS5 table is then rebuilt from the
+    documents and optimized. Use it after loading fixtures, after writes
+    that bypassed the signal handlers, or to repair the index.
+    """
+
+    help = "Rebuild the full-text search index of tasks and comments."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help="Number of documents written per transaction."
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+
+        tasks = Task.objects.only('pk', 'board_id', 'title', 'description')
+        task_count = self.index_in_batches(tasks, index_tasks, batch_size)
+
+        comments = (TaskComment.objects.select_related('task')
+                    .only('pk', 'task_id', 'content', 'task__board_id'))
+        comment_count = self.index_in_batches(
+            comments, index_comments, batch_size)
+
+        removed, _ = (SearchDocument.objects.filter(kind='comment')
+                      .exclude(object_id__in=TaskComment.objects.values('pk'))
+                      .delete())
+
+        if connection.vendor == 'sqlite':
+            with connection.cursor() as cursor:
+                for command in ('rebuild', 'optimize'):
+                    cursor.execute(
+                        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) "
+                        f"VALUES ('{command}')")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Indexed {task_count} tasks and {comment_count} comments, "
+            f"removed {removed} stale documents."))
+
+    def index_in_batches(self, queryset, index, batch_size):
+        """
+        Index the objects of a queryset in batches.
+
+        Args:
+            queryset (QuerySet): Objects to index
+            index (callable): index_tasks or index_comments
+            batch_size (int): Objects indexed per transaction
+
+        Returns:
+            int: Number of indexed objects
+        """
+        count = 0
+        batch = []
+        for obj in queryset.order_by('pk').iterator(chunk_size=batch_size):
+            batch.append(obj)
+            if len(batch) >= batch_size:
+                with transaction.atomic():
+                    index(batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            with transaction.atomic():
+                index(batch)
+            count += len(batch)
+        return count
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.7 on 2026-10-18 14:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('boards_app', '0006_boardchange_action'),
+        ('tasks_app', '0005_task_position'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('task', 'task'), ('comment', 'comment')], help_text='Kind of the indexed object', max_length=20)),
+                ('object_id', models.PositiveBigIntegerField(help_text='Primary key of the indexed task or comment')),
+                ('title', models.TextField(blank=True, help_text='Task title (empty for comments)')),
+                ('body', models.TextField(blank=True, help_text='Task description or comment content')),
+                ('board', models.ForeignKey(help_text='Board of the task', on_delete=django.db.models.deletion.CASCADE, related_name='+', to='boards_app.board')),
+                ('task', models.ForeignKey(help_text='Task itself or the task the comment belongs to', on_delete=django.db.models.deletion.CASCADE, related_name='+', to='tasks_app.task')),
+            ],
+            options={
+                'verbose_name': 'Search Document',
+                'verbose_name_plural': 'Search Documents',
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id'), name='search_document_object_unique')],
+            },
+        ),
+    ]
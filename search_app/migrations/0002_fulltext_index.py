@@ -0,0 +1,125 @@
+# SQLite rebuilds tables on most ALTERs and drops their triggers; a later
+# migration changing search_app_searchdocument has to recreate them and run
+# rebuild_search_index.
+
+from django.db import migrations
+
+SQLITE_CREATE = [
+    """
+    CREATE VIRTUAL TABLE search_app_searchdocument_fts USING fts5(
+        title, body, board_id,
+        content='search_app_searchdocument', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER search_app_searchdocument_ai
+    AFTER INSERT ON search_app_searchdocument BEGIN
+        INSERT INTO search_app_searchdocument_fts(rowid, title, body, board_id)
+        VALUES (new.id, new.title, new.body, new.board_id);
+    END
+    """,
+    """
+    CREATE TRIGGER search_app_searchdocument_ad
+    AFTER DELETE ON search_app_searchdocument BEGIN
+        INSERT INTO search_app_searchdocument_fts(
+            search_app_searchdocument_fts, rowid, title, body, board_id)
+        VALUES ('delete', old.id, old.title, old.body, old.board_id);
+    END
+    """,
+    """
+    CREATE TRIGGER search_app_searchdocument_au
+    AFTER UPDATE ON search_app_searchdocument BEGIN
+        INSERT INTO search_app_searchdocument_fts(
+            search_app_searchdocument_fts, rowid, title, body, board_id)
+        VALUES ('delete', old.id, old.title, old.body, old.board_id);
+        INSERT INTO search_app_searchdocument_fts(rowid, title, body, board_id)
+        VALUES (new.id, new.title, new.body, new.board_id);
+    END
+    """,
+]
+
+SQLITE_DROP = [
+    "DROP TRIGGER IF EXISTS search_app_searchdocument_au",
+    "DROP TRIGGER IF EXISTS search_app_searchdocument_ad",
+    "DROP TRIGGER IF EXISTS search_app_searchdocument_ai",
+    "DROP TABLE IF EXISTS search_app_searchdocument_fts",
+]
+
+POSTGRESQL_CREATE = [
+    """
+    ALTER TABLE search_app_searchdocument ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', title), 'A')
+        || setweight(to_tsvector('simple', body), 'B')
+    ) STORED
+    """,
+    """
+    CREATE INDEX search_app_searchdocument_vector_idx
+    ON search_app_searchdocument USING GIN (search_vector)
+    """,
+]
+
+POSTGRESQL_DROP = [
+    "DROP INDEX IF EXISTS search_app_searchdocument_vector_idx",
+    "ALTER TABLE search_app_searchdocument DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def create_fulltext_index(apps, schema_editor):
+    """Create the inverted index of the backend in use, if it has one."""
+    statements = {
+        'sqlite': SQLITE_CREATE,
+        'postgresql': POSTGRESQL_CREATE,
+    }.get(schema_editor.connection.vendor, [])
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def drop_fulltext_index(apps, schema_editor):
+    statements = {
+        'sqlite': SQLITE_DROP,
+        'postgresql': POSTGRESQL_DROP,
+    }.get(schema_editor.connection.vendor, [])
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def index_existing(apps, schema_editor):
+    """Create the documents of existing tasks and comments."""
+    Task = apps.get_model('tasks_app', 'Task')
+    TaskComment = apps.get_model('tasks_app', 'TaskComment')
+    SearchDocument = apps.get_model('search_app', 'SearchDocument')
+
+    tasks = Task.objects.values_list('pk', 'board_id', 'title', 'description')
+    batch = []
+    for pk, board_id, title, description in tasks.iterator(chunk_size=2000):
+        batch.append(SearchDocument(
+            kind='task', object_id=pk, board_id=board_id, task_id=pk,
+            title=title, body=description or ''))
+        if len(batch) >= 2000:
+            SearchDocument.objects.bulk_create(batch)
+            batch = []
+
+    comments = TaskComment.objects.values_list(
+        'pk', 'task__board_id', 'task_id', 'content')
+    for pk, board_id, task_id, content in comments.iterator(chunk_size=2000):
+        batch.append(SearchDocument(
+            kind='comment', object_id=pk, board_id=board_id, task_id=task_id,
+            title='', body=content))
+        if len(batch) >= 2000:
+            SearchDocument.objects.bulk_create(batch)
+            batch = []
+    SearchDocument.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fulltext_index, drop_fulltext_index),
+        migrations.RunPython(index_existing, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,83 @@
+"""
+Search app models.
+
+This module defines the SearchDocument model, the searchable copy of task
+and comment texts that the full-text index is built on.
+"""
+
+from django.db import models
+
+from boards_app.models import Board
+from tasks_app.models import Task
+
+
+def choices_document_kind():
+    """
+    Return the kinds of indexed objects.
+
+    Returns:
+        list: Document kinds
+    """
+    kinds = ["task", "comment"]
+    return kinds
+
+
+class SearchDocument(models.Model):
+    """
+    Searchable text of a task or comment.
+
+    Documents are written by the signal handlers in search_app.signals and
+    by the bulk task writers, and rebuilt by the rebuild_search_index
+    management command. The inverted index on title and body is created by
+    the migrations for the database backend in use (see search_app.index).
+    Documents disappear with their task or board through the foreign keys.
+
+    Attributes:
+        kind (str): Kind of the indexed object (see choices_document_kind)
+        object_id (int): Primary key of the indexed task or comment
+        board (Board): Board of the task
+        task (Task): Task itself or the task the comment belongs to
+        title (str): Task title (empty for comments)
+        body (str): Task description or comment content
+    """
+
+    kind = models.CharField(
+        max_length=20,
+        choices=[(kind, kind) for kind in choices_document_kind()],
+        help_text="Kind of the indexed object"
+    )
+    object_id = models.PositiveBigIntegerField(
+        help_text="Primary key of the indexed task or comment"
+    )
+    board = models.ForeignKey(
+        Board,
+        on_delete=models.CASCADE,
+        related_name='+',
+        help_text="Board of the task"
+    )
+    task = models.ForeignKey(
+        Task,
+        on_delete=models.CASCADE,
+        related_name='+',
+        help_text="Task itself or the task the comment belongs to"
+    )
+    title = models.TextField(
+        blank=True,
+        help_text="Task title (empty for comments)"
+    )
+    body = models.TextField(
+        blank=True,
+        help_text="Task description or comment content"
+    )
+
+    def __str__(self):
+        """Return string representation of the document."""
+        return f"{self.kind} {self.object_id}"
+
+    class Meta:
+        verbose_name = "Search Document"
+        verbose_name_plural = "Search Documents"
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'object_id'],
+                                    name='search_document_object_unique'),
+        ]
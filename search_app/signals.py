@@ -0,0 +1,78 @@
+"""
+Search app signal handlers.
+
+Keeps the search documents in sync with task and comment writes. Task
+documents and comment documents of deleted tasks and boards go away with
+their foreign keys; only a comment deleted on its own needs a handler.
+Bulk task writers suppress these handlers with suppress_task_signals()
+and index the tasks themselves (see tasks_app.bulk).
+"""
+
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from boards_app.models import Board
+from tasks_app.models import Task, TaskComment
+from tasks_app.signals import task_signals_suppressed
+from .index import INDEXED_TASK_FIELDS, index_comments, index_tasks
+from .models import SearchDocument
+
+
+def _indexed_state(task):
+    """Return the loaded values of the indexed fields of a task."""
+    return tuple(task.__dict__.get(field)
+                 for field in ('board_id', 'title', 'description'))
+
+
+@receiver(post_init, sender=Task)
+def remember_indexed_state(sender, instance, **kwargs):
+    """Remember the indexed values a task was loaded with."""
+    instance._search_state = _indexed_state(instance)
+
+
+@receiver(post_save, sender=Task)
+def index_task(sender, instance, created, raw=False, update_fields=None,
+               **kwargs):
+    """
+    Index a created or updated task.
+
+    Skipped when no indexed field changed, e.g. when a task only moves
+    between columns. Moves the documents of the task's comments along when
+    the task changed boards.
+    """
+    if raw or task_signals_suppressed():
+        return
+    if update_fields is not None and not INDEXED_TASK_FIELDS & update_fields:
+        return
+    old, new = instance._search_state, _indexed_state(instance)
+    if not created and old == new:
+        return
+    index_tasks([instance])
+    if not created and old[0] != new[0]:
+        SearchDocument.objects.filter(
+            kind='comment', task=instance
+        ).update(board_id=instance.board_id)
+    instance._search_state = new
+
+
+@receiver(post_save, sender=TaskComment)
+def index_comment(sender, instance, raw=False, update_fields=None,
+                  **kwargs):
+    """Index a created or updated comment unless its content was not saved."""
+    if raw or (update_fields is not None and 'content' not in update_fields):
+        return
+    index_comments([instance])
+
+
+@receiver(post_delete, sender=TaskComment)
+def remove_comment(sender, instance, origin=None, **kwargs):
+    """
+    Remove the document of a deleted comment.
+
+    Skipped when the comment is deleted along with its task or board,
+    whose deletion removes the documents already.
+    """
+    if getattr(origin, 'model', type(origin)) in (Task, Board):
+        return
+    SearchDocument.objects.filter(
+        kind='comment', object_id=instance.pk).delete()
@@ -0,0 +1,185 @@
+"""
+Search app tests.
+
+Covers the search endpoint on the database's full-text index and on the
+substring fallback, including which boards are searched.
+"""
+
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from rest_framework.test import APITestCase
+
+from auth_app.models import UserProfile
+from boards_app.models import Board
+from tasks_app.models import Task, TaskComment
+
+
+def create_user(username):
+    """Create a user with a profile, as registration does."""
+    user = User.objects.create_user(
+        username, f'{username}@example.com', 'password')
+    UserProfile.objects.create(user=user, full_name=username.title())
+    return user
+
+
+class SearchTestCase(APITestCase):
+    """Two boards, one of them visible to the requesting member."""
+
+    def setUp(self):
+        cache.clear()
+        self.owner = create_user('owner')
+        self.member = create_user('member')
+        self.outsider = create_user('outsider')
+        self.board = Board.objects.create(title='Board', owner=self.owner)
+        self.board.members.add(self.member)
+        self.other_board = Board.objects.create(title='Other',
+                                                owner=self.outsider)
+        self.client.force_authenticate(self.member)
+
+    def create_task(self, title, description='', board=None):
+        """Create a task, on the member's board by default."""
+        return Task.objects.create(board=board or self.board, title=title,
+                                   description=description)
+
+    def search(self, q, **params):
+        """Search and return the (type, id) pairs of the results."""
+        response = self.client.get('/api/search/', {'q': q, **params})
+        self.assertEqual(response.status_code, 200)
+        return [(result['type'], result['id'])
+                for result in response.json()['results']]
+
+
+class SearchTests(SearchTestCase):
+    """GET /api/search/ ranks matches on the boards the user can see."""
+
+    def test_all_words_match_and_the_last_as_prefix(self):
+        pipeline = self.create_task('Deploy pipeline')
+        self.create_task('Deploy docs')
+        self.create_task('Pipeline review')
+
+        self.assertEqual(self.search('deploy pipe'), [('task', pipeline.pk)])
+        self.assertEqual(self.search('DEPLOY Pipeline!'),
+                         [('task', pipeline.pk)])
+        self.assertEqual(self.search('depl pipeline'), [])
+
+    def test_title_matches_rank_first(self):
+        titled = self.create_task('Login fails')
+        described = self.create_task('Bug', 'The login page is blank')
+        comment = TaskComment.objects.create(
+            task=described, author=self.owner, content='Login works for me')
+
+        results = self.search('login')
+        self.assertEqual(results[0], ('task', titled.pk))
+        self.assertCountEqual(results[1:], [('task', described.pk),
+                                            ('comment', comment.pk)])
+
+        data = self.client.get('/api/search/', {'q': 'works'}).json()
+        self.assertEqual(data['results'][0]['task'], described.pk)
+        self.assertEqual(data['results'][0]['title'], 'Bug')
+
+    def test_only_visible_boards_are_searched(self):
+        visible = self.create_task('Deploy backend')
+        hidden = self.create_task('Deploy secrets', board=self.other_board)
+
+        self.assertEqual(self.search('deploy'), [('task', visible.pk)])
+        self.assertEqual(self.search('deploy', board=self.other_board.pk), [])
+
+        self.client.force_authenticate(self.outsider)
+        self.assertEqual(self.search('deploy'), [('task', hidden.pk)])
+
+    def test_many_boards_are_filtered_after_the_match(self):
+        visible = self.create_task('Deploy backend')
+        self.create_task('Deploy secrets', board=self.other_board)
+
+        with mock.patch('search_app.index.MATCH_BOARD_LIMIT', 0):
+            self.assertEqual(self.search('deploy'), [('task', visible.pk)])
+
+    def test_index_follows_edits(self):
+        task = self.create_task('Draft')
+        comment = TaskComment.objects.create(
+            task=task, author=self.owner, content='Ship it')
+        task.title = 'Release notes'
+        task.save()
+        comment.delete()
+
+        self.assertEqual(self.search('draft'), [])
+        self.assertEqual(self.search('release'), [('task', task.pk)])
+        self.assertEqual(self.search('ship'), [])
+
+    def test_only_the_newest_candidates_are_ranked(self):
+        """
+        A title match older than the newest RANK_CANDIDATES matches is not
+        returned, although it would rank first.
+        """
+        oldest = self.create_task('Deploy')
+        newer = [self.create_task('Task', f'Deploy step {index}')
+                 for index in range(3)]
+
+        with mock.patch('search_app.index.RANK_CANDIDATES', 3):
+            self.assertCountEqual(self.search('deploy'),
+                                  [('task', task.pk) for task in newer])
+        with mock.patch('search_app.index.RANK_CANDIDATES', 4):
+            self.assertEqual(self.search('deploy')[0], ('task', oldest.pk))
+
+    def test_pages(self):
+        for index in range(3):
+            self.create_task(f'Deploy {index}')
+
+        response = self.client.get('/api/search/',
+                                   {'q': 'deploy', 'page_size': 2})
+        data = response.json()
+        self.assertEqual(len(data['results']), 2)
+        self.assertIsNone(data['previous'])
+        data = self.client.get(data['next']).json()
+        self.assertEqual(len(data['results']), 1)
+        self.assertIsNone(data['next'])
+        self.assertIsNotNone(data['previous'])
+
+        response = self.client.get('/api/search/', {'q': ''})
+        self.assertEqual(response.status_code, 400)
+
+
+class FallbackSearchTests(SearchTestCase):
+    """
+    The substring fallback of backends without a full-text index.
+
+    It matches substrings and does not rank, so results come newest first.
+    """
+
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch('search_app.index.connection',
+                             mock.Mock(vendor='other', wraps=connection))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_all_words_match_as_substrings(self):
+        pipeline = self.create_task('Deploy pipeline')
+        self.create_task('Deploy docs')
+
+        self.assertEqual(self.search('deploy pipe'), [('task', pipeline.pk)])
+        # Substrings match anywhere in a word
+        self.assertEqual(self.search('ploy line'), [('task', pipeline.pk)])
+
+    def test_matches_are_not_ranked(self):
+        first = self.create_task('Login fails')
+        second = self.create_task('Bug', 'The login page is blank')
+
+        data = self.client.get('/api/search/', {'q': 'login'}).json()
+        self.assertEqual([result['id'] for result in data['results']],
+                         [second.pk, first.pk])
+        self.assertEqual({result['score'] for result in data['results']},
+                         {None})
+
+    def test_only_visible_boards_are_searched(self):
+        visible = self.create_task('Deploy backend')
+        comment = TaskComment.objects.create(
+            task=visible, author=self.owner, content='Deploy on Friday')
+        self.create_task('Deploy secrets', board=self.other_board)
+
+        self.assertEqual(self.search('deploy'), [('comment', comment.pk),
+                                                 ('task', visible.pk)])
+        self.assertEqual(self.search('deploy', board=self.other_board.pk), [])
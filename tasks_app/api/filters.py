@@ -0,0 +1,219 @@
+"""
+Task list filtering.
+
+This module defines the query parameters of the assigned and reviewing
+task lists and the filter backend applying them in SQL. Filters on the
+due date use the (assignee, due_date) and (reviewer, due_date) indexes;
+the status, priority and board filters narrow the tasks of one user,
+which the assignee and reviewer indexes already single out.
+"""
+
+from datetime import date
+
+from django.db.models import Case, IntegerField, Q, Value, When
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.fields import empty
+from rest_framework.filters import BaseFilterBackend
+
+from ..models import choices_priority, choices_status
+from .serializers import TASK_FIELDS
+
+# Values of ?ordering= and the annotation or field each one sorts by
+ORDERING_FIELDS = {
+    'id': 'id',
+    'due_date': 'due_sort',
+    'priority': 'priority_rank',
+    'updated_at': 'updated_at',
+}
+
+DEFAULT_ORDERING = '-id'
+
+
+class CommaSeparatedListField(serializers.ListField):
+    """List field read from one comma-separated query parameter."""
+
+    def get_value(self, dictionary):
+        value = dictionary.get(self.field_name, empty)
+        if value is empty:
+            return empty
+        return [item.strip() for item in value.split(',') if item.strip()]
+
+
+class TaskListQuerySerializer(serializers.Serializer):
+    """
+    Validate the query parameters of the task lists.
+
+    Fields:
+        board (int): Only tasks of this board
+        status__in (list): Comma-separated statuses
+        priority__in (list): Comma-separated priorities
+        due_date__gte (date): Due on or after this date
+        due_date__lte (date): Due on or before this date
+        overdue (bool): Only tasks past their due date and not done (true)
+            or only the others (false)
+        ordering (str): id, due_date, priority or updated_at, prefixed
+            with - for descending order; tasks without due date come last
+        fields (list): Comma-separated output fields; all when omitted
+    """
+
+    board = serializers.IntegerField(required=False, min_value=1)
+    status__in = CommaSeparatedListField(
+        child=serializers.ChoiceField(choices=choices_status()),
+        required=False,
+        allow_empty=False,
+    )
+    priority__in = CommaSeparatedListField(
+        child=serializers.ChoiceField(choices=choices_priority()),
+        required=False,
+        allow_empty=False,
+    )
+    due_date__gte = serializers.DateField(required=False)
+    due_date__lte = serializers.DateField(required=False)
+    overdue = serializers.BooleanField(
+        required=False, allow_null=True, default=None)
+    ordering = serializers.ChoiceField(
+        choices=[prefix + name for name in ORDERING_FIELDS
+                 for prefix in ('', '-')],
+        required=False,
+        default=DEFAULT_ORDERING,
+    )
+    fields = CommaSeparatedListField(
+        child=serializers.ChoiceField(choices=TASK_FIELDS),
+        required=False,
+        allow_empty=False,
+    )
+
+    def validate_fields(self, value):
+        """Return the selected fields once each, in serializer order."""
+        return [name for name in TASK_FIELDS if name in value]
+
+    def validate(self, attrs):
+        """
+        Validate that the due date range is not reversed.
+
+        Raises:
+            ValidationError: If due_date__gte is after due_date__lte
+        """
+        start = attrs.get('due_date__gte')
+        end = attrs.get('due_date__lte')
+        if start and end and start > end:
+            raise serializers.ValidationError(
+                {'due_date__gte': "Must not be after due_date__lte."})
+        return attrs
+
+
+def task_list_params(request):
+    """
+    Return the validated task list query parameters of a request.
+
+    The result is memoized on the underlying Django HttpRequest, so the
+    view, the filter backend and the paginator validate the parameters
+    once.
+
+    Args:
+        request: DRF Request
+
+    Returns:
+        dict: Validated parameters; fields is None when not selected
+
+    Raises:
+        ValidationError: If a parameter is invalid (400)
+    """
+    http_request = getattr(request, '_request', request)
+    params = getattr(http_request, '_task_list_params', None)
+    if params is None:
+        serializer = TaskListQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        params = dict(serializer.validated_data)
+        params.setdefault('fields', None)
+        http_request._task_list_params = params
+    return params
+
+
+def ordering_annotation(ordering):
+    """
+    Return the annotation an ordering sorts by, if it needs one.
+
+    Due dates are coalesced so tasks without one come last in both
+    directions; priorities are ranked low < medium < high.
+
+    Args:
+        ordering (str): Validated ordering parameter
+
+    Returns:
+        dict: Annotations to add to the queryset
+    """
+    descending = ordering.startswith('-')
+    name = ordering.lstrip('-')
+    if name == 'due_date':
+        return {'due_sort': Coalesce(
+            'due_date', Value(date.min if descending else date.max))}
+    if name == 'priority':
+        return {'priority_rank': Case(
+            *[When(priority=priority, then=Value(rank))
+              for rank, priority in enumerate(choices_priority())],
+            output_field=IntegerField(),
+        )}
+    return {}
+
+
+class TaskListFilter(BaseFilterBackend):
+    """
+    Filter and order task lists by their query parameters.
+
+    Also provides get_ordering(), which cursor pagination uses instead of
+    its fixed ordering, so pages follow the requested order.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        """
+        Apply the filters and ordering of the request.
+
+        Args:
+            request: DRF Request
+            queryset (QuerySet): Tasks of the user
+            view: Task list view
+
+        Returns:
+            QuerySet: Filtered and ordered tasks
+        """
+        params = task_list_params(request)
+        filters = Q()
+        if 'board' in params:
+            filters &= Q(board_id=params['board'])
+        if 'status__in' in params:
+            filters &= Q(status__in=params['status__in'])
+        if 'priority__in' in params:
+            filters &= Q(priority__in=params['priority__in'])
+        if 'due_date__gte' in params:
+            filters &= Q(due_date__gte=params['due_date__gte'])
+        if 'due_date__lte' in params:
+            filters &= Q(due_date__lte=params['due_date__lte'])
+        if params.get('overdue') is not None:
+            overdue = (Q(due_date__lt=timezone.localdate())
+                       & ~Q(status='done'))
+            filters &= overdue if params['overdue'] else ~overdue
+        return (queryset.filter(filters)
+                .annotate(**ordering_annotation(params['ordering']))
+                .order_by(*self.get_ordering(request, queryset, view)))
+
+    def get_ordering(self, request, queryset, view):
+        """
+        Return the ordering of the request, ending with the task ID.
+
+        Args:
+            request: DRF Request
+            queryset (QuerySet): Tasks of the user
+            view: Task list view
+
+        Returns:
+            tuple: Ordering fields and annotations
+        """
+        ordering = task_list_params(request)['ordering']
+        prefix = '-' if ordering.startswith('-') else ''
+        name = ORDERING_FIELDS[ordering.lstrip('-')]
+        if name == 'id':
+            return (prefix + name,)
+        return (prefix + name, '-id')
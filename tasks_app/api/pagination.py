@@ -0,0 +1,147 @@
+"""
+Task API pagination.
+
+This module defines cursor pagination classes for task and comment endpoints.
+"""
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+
+from core.pagination import OptionalCursorPagination
+
+
+class TaskCursorPagination(OptionalCursorPagination):
+    """
+    Cursor pagination for task lists.
+
+    Follows the Task Meta ordering (newest first), or the ordering of
+    TaskListFilter. Due dates, priorities and update times are not unique,
+    so those orderings end with the task ID and their cursors hold the
+    sort value and the ID of the last task; the next page starts right
+    after that pair. DRF's cursors only hold the sort value and skip tied
+    tasks by offset, which re-reads every tie on each page and loses tasks
+    when paging back.
+    """
+
+    ordering = '-id'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Return a page of tasks following or preceding the cursor position.
+
+        Args:
+            queryset (QuerySet): Filtered tasks
+            request: DRF Request
+            view: Task list view
+
+        Returns:
+            list | None: Tasks of the page, or None without pagination
+
+        Raises:
+            NotFound: If the cursor is invalid
+        """
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+        self.ordering = self.get_ordering(request, queryset, view)
+        if len(self.ordering) == 1:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.cursor = self.decode_cursor(request)
+        reverse = self.cursor is not None and self.cursor.reverse
+        position = self.cursor and self.cursor.position
+
+        ordering = self.ordering
+        if reverse:
+            ordering = [name[1:] if name.startswith('-') else f'-{name}'
+                        for name in ordering]
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            try:
+                queryset = queryset.filter(
+                    self.after_position(ordering, position))
+            except (ValueError, ValidationError):
+                raise NotFound(self.invalid_cursor_message)
+
+        results = list(queryset[:self.page_size + 1])
+        self.page = results[:self.page_size]
+        following = None
+        if len(results) > self.page_size:
+            following = self._get_position_from_instance(
+                results[-1], self.ordering)
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = position is not None
+            self.next_position = position
+            self.has_previous = following is not None
+            self.previous_position = following
+        else:
+            self.has_next = following is not None
+            self.next_position = following
+            self.has_previous = position is not None
+            self.previous_position = position
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def after_position(self, ordering, position):
+        """
+        Return the filter for tasks after a cursor position.
+
+        Args:
+            ordering (list): Sort field and ID ordering of the query
+            position (str): Cursor position, "<task ID>:<sort value>"
+
+        Returns:
+            Q: Tasks sorting after the position
+
+        Raises:
+            NotFound: If the position is malformed
+        """
+        pk, _, value = position.partition(':')
+        if not pk.isdigit():
+            raise NotFound(self.invalid_cursor_message)
+        field, id_field = ordering
+        name = field.lstrip('-')
+        after = 'lt' if field.startswith('-') else 'gt'
+        after_id = 'lt' if id_field.startswith('-') else 'gt'
+        return (Q(**{f'{name}__{after}': value})
+                | Q(**{name: value, f'id__{after_id}': int(pk)}))
+
+    def _get_position_from_instance(self, instance, ordering):
+        """Return the sort value, prefixed with the ID if it is not unique."""
+        position = super()._get_position_from_instance(instance, ordering)
+        if len(ordering) == 1:
+            return position
+        return f'{instance.pk}:{position}'
+
+
+class TaskCommentCursorPagination(OptionalCursorPagination):
+    """
+    Cursor pagination for task comment lists.
+
+    Follows the TaskComment Meta ordering (oldest first), so clients can
+    stream through long comment histories in chronological order.
+    """
+
+    ordering = 'created_at'
+
+
+class TaskColumnCursorPagination(CursorPagination):
+    """
+    Cursor pagination for the tasks of one board column.
+
+    Always paginates, since the board tasks endpoint exists to load columns
+    lazily instead of embedding every task in the board detail. Follows the
+    column order (position, then ID).
+    """
+
+    page_size = 25
+    max_page_size = 200
+    page_size_query_param = 'page_size'
+    ordering = ('position', 'id')
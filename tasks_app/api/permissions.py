@@ -4,9 +4,11 @@ Task API permissions.
 This module defines custom permission classes for task-level access control.
 """
 
-from rest_framework.permissions import BasePermission, SAFE_METHODS
+from rest_framework.permissions import BasePermission
 from rest_framework.exceptions import NotFound
 
+from boards_app.membership import has_board_access
+
 
 class IsBoardOwnerOrMember(BasePermission):
     """
@@ -40,7 +42,7 @@ class IsBoardOwnerOrMember(BasePermission):
 
             try:
                 board = Board.objects.get(pk=board_id)
-                return board.owner == request.user or request.user in board.members.all()
+                return has_board_access(board, request.user, request)
             except Board.DoesNotExist:
                 raise NotFound(detail="Board with this ID does not exist.")
 
@@ -58,8 +60,7 @@ class IsBoardOwnerOrMember(BasePermission):
         Returns:
             bool: True if user is owner or member, False otherwise
         """
-        board = obj.board
-        return board.owner == request.user or request.user in board.members.all()
+        return has_board_access(obj.board, request.user, request)
 
 
 class IsBoardOwner(BasePermission):
@@ -94,7 +95,7 @@ class IsBoardOwner(BasePermission):
 
             try:
                 board = Board.objects.get(pk=board_id)
-                return board.owner == request.user
+                return board.owner_id == request.user.pk
             except Board.DoesNotExist:
                 return False
 
@@ -112,7 +113,7 @@ class IsBoardOwner(BasePermission):
         Returns:
             bool: True if user owns the board, False otherwise
         """
-        return obj.board.owner == request.user
+        return obj.board.owner_id == request.user.pk
 
 
 class IsTaskOwner(BasePermission):
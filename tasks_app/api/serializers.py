@@ -6,7 +6,8 @@ This module contains serializers for task and task comment management.
 
 from django.contrib.auth.models import User
 from rest_framework import serializers
-from ..models import Task, TaskComment
+from ..models import Task, TaskComment, choices_status
+from boards_app.membership import has_board_access, is_board_member
 from boards_app.models import Board
 
 
@@ -32,6 +33,56 @@ class UserSerializer(serializers.ModelSerializer):
         """Retrieve full name from associated UserProfile."""
         return obj.userprofile.full_name
 
+    def to_representation(self, instance):
+        """
+        Return the user as a plain dict.
+
+        Read path shortcut: builds the output directly instead of running
+        every declared field, with the same keys and values.
+        """
+        return user_representation(instance)
+
+
+def user_representation(user):
+    """
+    Serialize a user like UserSerializer without field objects.
+
+    Args:
+        user (User): User with userprofile loaded, or None
+
+    Returns:
+        dict | None: id, fullname and email, or None without a user
+    """
+    if user is None:
+        return None
+    return {
+        'id': user.id,
+        'fullname': user.userprofile.full_name,
+        'email': user.email,
+    }
+
+
+_due_date_field = serializers.DateField()
+
+# Read path shortcuts of TaskSerializer output fields. They return what the
+# declared field would; output fields without one are rendered by their
+# serializer field, so a field added to Meta.fields is never left out.
+_FIELD_GETTERS = {
+    'id': lambda serializer, task: task.id,
+    'board': lambda serializer, task: task.board_id,
+    'title': lambda serializer, task: task.title,
+    'description': lambda serializer, task: task.description,
+    'status': lambda serializer, task: task.status,
+    'priority': lambda serializer, task: task.priority,
+    'assignee': lambda serializer, task: user_representation(task.assignee),
+    'reviewer': lambda serializer, task: user_representation(task.reviewer),
+    'due_date': lambda serializer, task:
+        _due_date_field.to_representation(task.due_date),
+    'comments_count': lambda serializer, task:
+        serializer.get_comments_count(task),
+    'position': lambda serializer, task: task.position,
+}
+
 
 class TaskSerializer(serializers.ModelSerializer):
     """
@@ -51,6 +102,8 @@ class TaskSerializer(serializers.ModelSerializer):
         reviewer (dict): Reviewer user details (read-only)
         due_date (date): Task deadline
         comments_count (int): Number of comments on task
+        position (int): Rank within the board column (read-only, changed
+            through the move endpoint)
         assignee_id (int): Assignee user ID (write-only)
         reviewer_id (int): Reviewer user ID (write-only)
     """
@@ -84,18 +137,44 @@ class TaskSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'board', 'title', 'description', 'status', 'priority',
             'assignee', 'reviewer', 'due_date', 'comments_count',
-            'assignee_id', 'reviewer_id'
+            'position', 'assignee_id', 'reviewer_id'
         ]
+        read_only_fields = ['position']
 
     def get_comments_count(self, obj):
-        """Return the number of comments on this task."""
+        """
+        Return the number of comments on this task.
+
+        Prefers a comments_count annotation on the instance and only falls
+        back to a COUNT query when the task was loaded without it.
+        """
+        comments_count = getattr(obj, 'comments_count', None)
+        if comments_count is not None:
+            return comments_count
         return obj.comments.count()
 
+    @classmethod
+    def output_fields(cls):
+        """
+        Return the names of the rendered fields in Meta.fields order.
+
+        Returns:
+            list: Field names without the write-only ones
+        """
+        return [name for name in cls.Meta.fields
+                if not getattr(cls._declared_fields.get(name),
+                               'write_only', False)]
+
     def to_representation(self, instance):
         """
         Customize serialized output.
 
-        Removes comments_count from PATCH responses to optimize payload.
+        Responses of writes (serializers given data) run every declared
+        field. Reads build the dict from the output fields directly, which
+        dominates the cost of large task lists; keys and values are the
+        same. Removes comments_count from PATCH responses to optimize
+        payload. Renders only the fields listed in the 'fields' context
+        entry when it is set.
 
         Args:
             instance (Task): Task instance to serialize
@@ -103,12 +182,44 @@ class TaskSerializer(serializers.ModelSerializer):
         Returns:
             dict: Serialized task data
         """
-        data = super().to_representation(instance)
+        fields = self.context.get('fields')
+        if fields is not None:
+            return self.to_sparse_representation(instance, fields)
+        if hasattr(self, 'initial_data'):
+            data = super().to_representation(instance)
+        else:
+            data = self.to_sparse_representation(instance, TASK_FIELDS)
         request = self.context.get("request")
         if request and request.method == "PATCH":
             data.pop("comments_count", None)
         return data
 
+    def to_sparse_representation(self, instance, fields):
+        """
+        Serialize only some fields of a task.
+
+        Unselected fields are not computed, so a task loaded with
+        TaskQuerySet.for_fields() renders without touching the relations
+        it did not load.
+
+        Args:
+            instance (Task): Task instance to serialize
+            fields (list): Output fields to render
+
+        Returns:
+            dict: Serialized task data
+        """
+        data = {}
+        for name in fields:
+            getter = _FIELD_GETTERS.get(name)
+            if getter is not None:
+                data[name] = getter(self, instance)
+            else:
+                field = self.fields[name]
+                data[name] = field.to_representation(
+                    field.get_attribute(instance))
+        return data
+
     def validate(self, attrs):
         """
         Validate task data.
@@ -150,8 +261,7 @@ class TaskSerializer(serializers.ModelSerializer):
         if not request:
             return
 
-        user = request.user
-        if not (board.owner == user or user in board.members.all()):
+        if not has_board_access(board, request.user, request):
             raise serializers.ValidationError(
                 {"board": "You do not have access to this board. You must be the owner or a member."}
             )
@@ -194,7 +304,7 @@ class TaskSerializer(serializers.ModelSerializer):
         if user is None:
             return
 
-        if not board.members.filter(id=user.id).exists():
+        if not is_board_member(board, user, self.context.get('request')):
             raise serializers.ValidationError(
                 {role_name.lower(): f"{role_name} must be Member of Board."}
             )
@@ -219,6 +329,158 @@ class TaskSerializer(serializers.ModelSerializer):
             )
 
 
+# Output fields of TaskSerializer, e.g. the ones ?fields= can select
+TASK_FIELDS = TaskSerializer.output_fields()
+
+
+class TaskBulkItemSerializer(serializers.ModelSerializer):
+    """
+    Serializer for one operation of a bulk task request.
+
+    Users are passed as plain IDs and checked against the board's cached
+    member list, so validating an item does not query the database.
+    Update and delete items are validated with partial=True, which skips
+    required fields, so validate() checks op itself.
+
+    Context:
+        board (Board): Board of the bulk request
+        request: Current request used to memoize membership checks
+
+    Fields:
+        op (str): Operation (create, update, delete)
+        id (int): Task ID (update and delete only)
+        title, description, status, priority, due_date: Task fields
+        assignee_id (int): Assignee user ID
+        reviewer_id (int): Reviewer user ID
+    """
+
+    op = serializers.ChoiceField(
+        choices=['create', 'update', 'delete'],
+        help_text="Operation to perform"
+    )
+    id = serializers.IntegerField(
+        required=False,
+        help_text="Task ID (update and delete only)"
+    )
+    assignee_id = serializers.IntegerField(
+        required=False,
+        allow_null=True,
+        help_text="User ID to assign task to"
+    )
+    reviewer_id = serializers.IntegerField(
+        required=False,
+        allow_null=True,
+        help_text="User ID to assign as reviewer"
+    )
+
+    class Meta:
+        model = Task
+        fields = [
+            'op', 'id', 'title', 'description', 'status', 'priority',
+            'due_date', 'assignee_id', 'reviewer_id'
+        ]
+
+    def validate(self, attrs):
+        """
+        Validate one bulk operation.
+
+        Args:
+            attrs (dict): Attributes to validate
+
+        Returns:
+            dict: Validated attributes
+
+        Raises:
+            ValidationError: If the operation or task ID is missing or a
+            user is not a member of the board
+        """
+        if 'op' not in attrs:
+            raise serializers.ValidationError(
+                {"op": "This field is required."})
+        if attrs['op'] != 'create' and 'id' not in attrs:
+            raise serializers.ValidationError(
+                {"id": "This field is required."})
+        board = self.context['board']
+        request = self.context.get('request')
+        for field, role_name in (('assignee_id', 'Assignee'),
+                                 ('reviewer_id', 'Reviewer')):
+            user_id = attrs.get(field)
+            if user_id is not None and not is_board_member(
+                    board, user_id, request):
+                raise serializers.ValidationError({
+                    role_name.lower(): f"{role_name} must be Member of Board."
+                })
+        return attrs
+
+
+class TaskBulkSerializer(serializers.Serializer):
+    """
+    Serializer for the envelope of a bulk task request.
+
+    Fields:
+        board (int): Board all operations apply to
+        operations (list): Operations validated by TaskBulkItemSerializer
+    """
+
+    max_operations = 1000
+
+    board = serializers.PrimaryKeyRelatedField(
+        queryset=Board.objects.only('pk', 'owner_id'),
+        help_text="Board ID all operations apply to"
+    )
+    operations = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False,
+        max_length=max_operations,
+        help_text="List of create, update and delete operations"
+    )
+
+
+class TaskMoveSerializer(serializers.Serializer):
+    """
+    Serializer for one move of a task move request.
+
+    Fields:
+        id (int): Task to move
+        status (str): Target column
+        after (int): Task to place it after, or null for the top of the
+            column
+    """
+
+    id = serializers.IntegerField(help_text="Task ID")
+    status = serializers.ChoiceField(
+        choices=choices_status(),
+        help_text="Target column"
+    )
+    after = serializers.IntegerField(
+        required=False,
+        allow_null=True,
+        default=None,
+        help_text="Task ID to place the task after, null for the top"
+    )
+
+
+class TaskMoveBatchSerializer(serializers.Serializer):
+    """
+    Serializer for a batch of task moves on one board.
+
+    Fields:
+        board (int): Board all moved tasks belong to
+        moves (list): Moves applied in order
+    """
+
+    board = serializers.PrimaryKeyRelatedField(
+        queryset=Board.objects.only('pk', 'owner_id'),
+        help_text="Board ID all moved tasks belong to"
+    )
+    moves = TaskMoveSerializer(
+        many=True,
+        allow_empty=False,
+        max_length=TaskBulkSerializer.max_operations,
+        help_text="Moves applied in order"
+    )
+
+
 class TaskCommentSerializer(serializers.ModelSerializer):
     """
     Serializer for task comments.
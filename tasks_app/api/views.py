@@ -6,13 +6,29 @@ including filtered task views for assigned and reviewing tasks.
 """
 
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from rest_framework import viewsets, mixins
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.serializers import as_serializer_error
 
+from boards_app.membership import has_board_access
+from core.conditional import (
+    compute_etag, not_modified_response, set_validators)
+from core.streaming import StreamingJSONResponse, stream_rows, wants_stream
+from ..bulk import apply_bulk_operations, move_tasks
 from ..models import Task, TaskComment
-from .serializers import TaskSerializer, TaskCommentSerializer
+from .filters import TaskListFilter, task_list_params
+from .pagination import TaskCursorPagination, TaskCommentCursorPagination
+from .serializers import (
+    TaskBulkItemSerializer,
+    TaskBulkSerializer,
+    TaskCommentSerializer,
+    TaskMoveBatchSerializer,
+    TaskSerializer
+)
 from .permissions import IsBoardOwner, IsTaskOwner, IsBoardOwnerOrMember
 
 
@@ -30,14 +46,18 @@ class TaskViewSet(mixins.CreateModelMixin,
         POST /api/tasks/ - Create new task
         PUT/PATCH /api/tasks/{id}/ - Update task
         DELETE /api/tasks/{id}/ - Delete task
+        POST /api/tasks/bulk/ - Create, update and delete tasks of one board
+        POST /api/tasks/move/ - Move tasks within or across board columns
 
     Permissions:
         - Create: IsBoardOwner (only board owner can create tasks)
         - Update: IsMemberOfBoard (board members can update tasks)
         - Delete: IsBoardOwner | IsTaskOwner (owner or assignee can delete)
+        - Bulk: Board member or owner; deletes need owner or assignee
+        - Move: Board member or owner
     """
 
-    queryset = Task.objects.all()
+    queryset = Task.objects.select_related('board').for_serializer()
     lookup_field = 'pk'
     serializer_class = TaskSerializer
 
@@ -58,6 +78,167 @@ class TaskViewSet(mixins.CreateModelMixin,
             permission_classes = [IsAuthenticated]
         return [permission() for permission in permission_classes]
 
+    @action(detail=False, methods=['post'])
+    def bulk(self, request):
+        """
+        Apply a batch of task operations to one board.
+
+        POST /api/tasks/bulk/
+        {"board": 1, "operations": [
+            {"op": "create", "title": "New task", "assignee_id": 2},
+            {"op": "update", "id": 5, "status": "done"},
+            {"op": "delete", "id": 7}
+        ]}
+
+        All operations are validated before anything is written; users are
+        checked once per distinct ID and the referenced tasks are loaded in
+        one query. If any operation fails, nothing is written and every
+        other operation is reported with status 424. Otherwise all of them
+        are applied in one transaction.
+
+        Args:
+            request: HTTP request with board and operations
+
+        Returns:
+            Response: Per-operation results (200), per-operation errors
+            (400) or forbidden error (403)
+        """
+        envelope = TaskBulkSerializer(data=request.data)
+        envelope.is_valid(raise_exception=True)
+        board = envelope.validated_data['board']
+        if not has_board_access(board, request.user, request):
+            raise PermissionDenied(
+                "You do not have access to this board. "
+                "You must be the owner or a member."
+            )
+
+        # One serializer per mode is reused for all items, so fields are
+        # built once instead of once per operation.
+        item_serializers = {
+            partial: TaskBulkItemSerializer(
+                partial=partial, context={'board': board, 'request': request})
+            for partial in (False, True)
+        }
+        items, results = [], []
+        for data in envelope.validated_data['operations']:
+            serializer = item_serializers[data.get('op') != 'create']
+            try:
+                items.append(serializer.run_validation(data))
+                results.append(None)
+            except ValidationError as exc:
+                items.append(None)
+                results.append(
+                    {'status': 400, 'errors': as_serializer_error(exc)})
+
+        tasks = Task.objects.filter(board=board).in_bulk([
+            item['id'] for item in items
+            if item is not None and item['op'] != 'create'
+        ])
+        self.check_bulk_targets(items, tasks, board, results)
+
+        if any(results):
+            for index, result in enumerate(results):
+                if result is None:
+                    results[index] = {'status': 424, 'errors': {
+                        'detail': "Not applied because another operation "
+                                  "failed."}}
+            return Response({'results': results}, status=400)
+
+        creates, updates, deletes = [], [], []
+        for item in items:
+            values = {key: value for key, value in item.items()
+                      if key not in ('op', 'id')}
+            if item['op'] == 'create':
+                creates.append(values)
+            elif item['op'] == 'update':
+                updates.append((tasks[item['id']], values))
+            else:
+                deletes.append(tasks[item['id']])
+        created = apply_bulk_operations(board, creates, updates, deletes)
+
+        written = Task.objects.for_serializer().in_bulk(
+            [task.pk for task in created] + [task.pk for task, _ in updates])
+        data = dict(zip(written, TaskSerializer(
+            list(written.values()), many=True).data))
+        created = iter(created)
+        for index, item in enumerate(items):
+            if item['op'] == 'create':
+                results[index] = {'status': 201,
+                                  'data': data[next(created).pk]}
+            elif item['op'] == 'update':
+                results[index] = {'status': 200, 'data': data[item['id']]}
+            else:
+                results[index] = {'status': 204, 'id': item['id']}
+        return Response({'results': results})
+
+    @action(detail=False, methods=['post'])
+    def move(self, request):
+        """
+        Move one or more tasks to a position in a board column.
+
+        POST /api/tasks/move/
+        {"board": 1, "moves": [
+            {"id": 5, "status": "done", "after": 9},
+            {"id": 6, "status": "done", "after": 5}
+        ]}
+
+        after is the task the moved task should follow, or null for the
+        top of the column. Moves are applied in order in one transaction.
+
+        Args:
+            request: HTTP request with board and moves
+
+        Returns:
+            Response: Moved tasks (200), validation error (400) or
+            forbidden error (403)
+        """
+        serializer = TaskMoveBatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        board = serializer.validated_data['board']
+        if not has_board_access(board, request.user, request):
+            raise PermissionDenied(
+                "You do not have access to this board. "
+                "You must be the owner or a member."
+            )
+
+        task_ids = move_tasks(board, serializer.validated_data['moves'])
+        tasks = Task.objects.for_serializer().in_bulk(task_ids)
+        return Response({'tasks': TaskSerializer(
+            [tasks[pk] for pk in dict.fromkeys(task_ids)], many=True).data})
+
+    def check_bulk_targets(self, items, tasks, board, results):
+        """
+        Check the tasks referenced by bulk update and delete operations.
+
+        Records a 404 for tasks not on the board, a 403 for deletes by
+        users who are neither board owner nor assignee and a 400 for tasks
+        referenced more than once.
+
+        Args:
+            items (list): Validated operations (None for invalid ones)
+            tasks (dict): Tasks of the board by ID
+            board (Board): Board of the request
+            results (list): Per-operation results, updated in place
+        """
+        user_id = self.request.user.pk
+        seen = set()
+        for index, item in enumerate(items):
+            if item is None or item['op'] == 'create':
+                continue
+            task = tasks.get(item['id'])
+            if item['id'] in seen:
+                results[index] = {'status': 400, 'errors': {
+                    'id': "Task appears in more than one operation."}}
+            elif task is None:
+                results[index] = {'status': 404, 'errors': {
+                    'detail': "Not found."}}
+            elif (item['op'] == 'delete'
+                  and user_id not in (board.owner_id, task.assignee_id)):
+                results[index] = {'status': 403, 'errors': {
+                    'detail': "You do not have permission to perform this "
+                              "action."}}
+            seen.add(item['id'])
+
 
 class TaskCommentsViewSet(mixins.ListModelMixin,
                           mixins.CreateModelMixin,
@@ -77,17 +258,22 @@ class TaskCommentsViewSet(mixins.ListModelMixin,
     Permissions:
         - List/Create: Board member or owner
         - Delete: Comment author only
+
+    Pagination:
+        List is cursor-paginated when page_size or cursor is given.
     """
 
     queryset = TaskComment.objects.all()
     serializer_class = TaskCommentSerializer
+    pagination_class = TaskCommentCursorPagination
     lookup_field = 'pk'
 
     def get_queryset(self):
         """
         Return comments for the specified task.
 
-        Only board members can view comments.
+        Only board members can view comments. Authors are joined with
+        their profiles, since the serializer renders their full name.
 
         Returns:
             QuerySet: Filtered comment queryset
@@ -98,16 +284,15 @@ class TaskCommentsViewSet(mixins.ListModelMixin,
         task_id = self.kwargs.get('task_pk')
         task = get_object_or_404(
             Task.objects.select_related("board"), pk=task_id)
-        user = self.request.user
-        board = task.board
 
         # Verify user is board member or owner
-        if user != board.owner and user not in board.members.all():
+        if not has_board_access(task.board, self.request.user, self.request):
             raise PermissionDenied(
                 "You do not have permission to view comments for this task."
             )
 
-        return TaskComment.objects.filter(task=task).select_related("author")
+        return (TaskComment.objects.filter(task=task)
+                .select_related("author__userprofile"))
 
     def create(self, request, *args, **kwargs):
         """
@@ -123,10 +308,9 @@ class TaskCommentsViewSet(mixins.ListModelMixin,
         task = get_object_or_404(
             Task.objects.select_related("board"), pk=task_id)
         user = request.user
-        board = task.board
 
         # Verify user is board member or owner
-        if user != board.owner and user not in board.members.all():
+        if not has_board_access(task.board, user, request):
             return Response(
                 {'detail': 'You do not have permission to perform this action.'},
                 status=403
@@ -185,10 +369,30 @@ class TaskAssignedOrReviewerViewSet(mixins.ListModelMixin,
 
     Permissions:
         - IsAuthenticated: User must be logged in
+
+    Query Parameters:
+        board, status__in, priority__in, due_date__gte, due_date__lte,
+        overdue: Filters applied in SQL (see TaskListQuerySerializer)
+        ordering (str): id, due_date, priority or updated_at, - for
+            descending order (default -id)
+        fields (str): Comma-separated output fields; relations and
+            counts that are not selected are neither loaded nor rendered
+
+    Pagination:
+        List is cursor-paginated when page_size or cursor is given.
+        Otherwise ?stream=1 streams the list row by row instead of
+        rendering it at once.
+
+    Conditional requests:
+        List responses carry an ETag derived from the task IDs and the
+        versions of the boards the tasks belong to, plus the current date
+        when overdue is given.
     """
 
     permission_classes = [IsAuthenticated]
     serializer_class = TaskSerializer
+    pagination_class = TaskCursorPagination
+    filter_backends = [TaskListFilter]
     mode = None
 
     def get_dispatch(self, request, *args, **kwargs):
@@ -209,14 +413,90 @@ class TaskAssignedOrReviewerViewSet(mixins.ListModelMixin,
         """
         Return tasks based on mode (assigned or reviewer).
 
+        Only the selected fields are loaded, plus the column the list is
+        ordered by, which cursor pagination reads.
+
         Returns:
-            QuerySet: Filtered task queryset
+            QuerySet: Filtered task queryset prepared for TaskSerializer
+        """
+        params = task_list_params(self.request)
+        fields = params['fields']
+        if fields is not None and params['ordering'].endswith('updated_at'):
+            fields = [*fields, 'updated_at']
+        return self.filter_by_mode(Task.objects.for_fields(fields))
+
+    def get_serializer_context(self):
         """
-        query_set = Task.objects.all()
+        Add the selected output fields to the serializer context.
 
+        Returns:
+            dict: Serializer context with 'fields' (None for all fields)
+        """
+        context = super().get_serializer_context()
+        context['fields'] = task_list_params(self.request)['fields']
+        return context
+
+    def filter_by_mode(self, query_set):
+        """
+        Restrict tasks to those assigned to or reviewed by the user.
+
+        Args:
+            query_set (QuerySet): Task queryset to filter
+
+        Returns:
+            QuerySet: Filtered task queryset
+        """
         if self.mode == 'assigned':
             qs = query_set.filter(assignee=self.request.user)
         elif self.mode == 'reviewer':
             qs = query_set.filter(reviewer=self.request.user)
 
         return qs
+
+    def list(self, request, *args, **kwargs):
+        """
+        List tasks, answering conditional requests before serialization.
+
+        Args:
+            request: HTTP request
+
+        Returns:
+            Response: Task list (200), invalid parameters (400) or Not
+            Modified (304)
+        """
+        params = task_list_params(request)
+        rows = (self.filter_by_mode(Task.objects.all())
+                .order_by('pk')
+                .values_list('pk', 'board_id', 'board__version'))
+        # Tasks become overdue when the date rolls over without any change
+        today = (timezone.localdate()
+                 if params.get('overdue') is not None else None)
+        etag = compute_etag(
+            self.mode,
+            request.user.pk,
+            list(rows),
+            sorted(request.query_params.lists()),
+            today,
+        )
+
+        response = not_modified_response(request, etag)
+        if response is None and self.should_stream():
+            response = StreamingJSONResponse(stream_rows(
+                self.filter_queryset(self.get_queryset()),
+                self.get_serializer()))
+        if response is None:
+            response = super().list(request, *args, **kwargs)
+        return set_validators(response, etag)
+
+    def should_stream(self):
+        """
+        Return whether the list is streamed instead of rendered at once.
+
+        Streaming is requested with ?stream=1 and only applies to the
+        unpaginated list; paginated pages are small enough to render whole.
+
+        Returns:
+            bool: True if the list should be streamed
+        """
+        return (wants_stream(self.request)
+                and self.paginator.get_page_size(self.request) is None)
@@ -0,0 +1,151 @@
+"""
+Bulk task writes.
+
+Applies many task creates, updates, deletes and moves on one board with a
+fixed number of queries per operation. The per-task signal handlers are
+suppressed and the board counters, change log and search index are
+updated once for the whole batch.
+"""
+
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from boards_app.changes import record_changes
+from boards_app.stats import apply_task_changes
+from search_app.index import INDEXED_TASK_FIELDS, index_tasks
+from .models import Task
+from .positions import (
+    POSITION_GAP, position_after, rebalance_column, top_positions
+)
+from .signals import suppress_task_signals
+
+
+def _state(task):
+    """Return the (board_id, status, priority) state of a task."""
+    return (task.board_id, task.status, task.priority)
+
+
+def apply_bulk_operations(board, creates=(), updates=(), deletes=()):
+    """
+    Create, update and delete tasks of a board in one transaction.
+
+    Args:
+        board (Board): Board all tasks belong to
+        creates (list): Validated field values of the tasks to create
+        updates (list): (task, field values) pairs of tasks to update
+        deletes (list): Tasks to delete
+
+    Returns:
+        list: The created tasks, in the order of creates
+    """
+    now = timezone.now()
+    stats_changes = []
+    log = []
+
+    with transaction.atomic(), suppress_task_signals():
+        # New tasks and tasks changing column go on top of their column.
+        new_tasks = [Task(board=board, **values) for values in creates]
+        moved = [(task, values) for task, values in updates
+                 if values.get('status', task.status) != task.status]
+        tops = top_positions(board.pk, {task.status for task in new_tasks}
+                             | {values['status'] for _, values in moved})
+        for task in new_tasks:
+            task.position = tops[task.status]
+            tops[task.status] -= POSITION_GAP
+        for _, values in moved:
+            values['position'] = tops[values['status']]
+            tops[values['status']] -= POSITION_GAP
+
+        created = Task.objects.bulk_create(new_tasks)
+        for task in created:
+            stats_changes.append((None, _state(task)))
+            log.append((board.pk, 'task', task.pk, 'created'))
+
+        fields = {'updated_at'}
+        for task, values in updates:
+            old = _state(task)
+            for field, value in values.items():
+                setattr(task, field, value)
+            task.updated_at = now
+            fields.update(values)
+            stats_changes.append((old, _state(task)))
+            log.append((board.pk, 'task', task.pk, 'updated'))
+        if updates:
+            Task.objects.bulk_update(
+                [task for task, _ in updates], sorted(fields), batch_size=500)
+
+        if deletes:
+            for task in deletes:
+                stats_changes.append((_state(task), None))
+                log.append((board.pk, 'task', task.pk, 'deleted'))
+            Task.objects.filter(pk__in=[task.pk for task in deletes]).delete()
+
+        apply_task_changes(stats_changes)
+        record_changes(log)
+        index_tasks(created + [task for task, values in updates
+                               if INDEXED_TASK_FIELDS & set(values)])
+
+    return created
+
+
+def move_tasks(board, moves):
+    """
+    Move tasks to a position in a column of their board.
+
+    Moves are applied in order, so a move may reference a task placed by
+    an earlier one. Each move rewrites a single row; a column is only
+    renumbered when its gap at the target runs out.
+
+    Args:
+        board (Board): Board of the tasks
+        moves (list): Dicts with id, status and after (ID of the task to
+            follow, or None for the top of the column)
+
+    Returns:
+        list: IDs of the moved tasks
+
+    Raises:
+        ValidationError: If a task is not on the board or the task to
+            follow is not in the target column
+    """
+    task_ids = [move['id'] for move in moves]
+    tasks = Task.objects.filter(board=board).in_bulk(task_ids)
+    missing = sorted(set(task_ids) - set(tasks))
+    if missing:
+        raise ValidationError({"moves": (
+            f"Tasks {', '.join(map(str, missing))} are not on this board.")})
+
+    now = timezone.now()
+    stats_changes = []
+    changed = set()
+    with transaction.atomic(), suppress_task_signals():
+        for move in moves:
+            task, status = tasks[move['id']], move['status']
+            after = None
+            if move.get('after') is not None:
+                after = (Task.objects
+                         .filter(board=board, status=status, pk=move['after'])
+                         .exclude(pk=task.pk)
+                         .values_list('pk', 'position').first())
+                if after is None:
+                    raise ValidationError({"after": (
+                        f"Task {move['after']} is not in column {status}.")})
+
+            position = position_after(board.pk, status, after, task.pk)
+            if position is None:
+                changed.update(rebalance_column(board.pk, status))
+                after = Task.objects.values_list(
+                    'pk', 'position').get(pk=after[0])
+                position = position_after(board.pk, status, after, task.pk)
+
+            old = _state(task)
+            Task.objects.filter(pk=task.pk).update(
+                status=status, position=position, updated_at=now)
+            task.status, task.position = status, position
+            stats_changes.append((old, _state(task)))
+            changed.add(task.pk)
+
+        apply_task_changes(stats_changes)
+        record_changes((board.pk, 'task', pk, 'updated') for pk in changed)
+    return task_ids
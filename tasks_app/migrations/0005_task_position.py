@@ -0,0 +1,46 @@
+# Generated by Django 5.2.7 on 2026-10-18 14:13
+
+from django.conf import settings
+from django.db import migrations, models
+
+POSITION_GAP = 1 << 16
+
+
+def populate_positions(apps, schema_editor):
+    """Rank existing tasks per column in their previous newest-first order."""
+    Task = apps.get_model('tasks_app', 'Task')
+    tasks = list(Task.objects.order_by('board_id', 'status', '-id')
+                 .only('pk', 'board_id', 'status'))
+    column, index = None, 0
+    for task in tasks:
+        if (task.board_id, task.status) != column:
+            column, index = (task.board_id, task.status), 0
+        task.position = index * POSITION_GAP
+        index += 1
+    Task.objects.bulk_update(tasks, ['position'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0006_boardchange_action'),
+        ('tasks_app', '0004_task_updated_at_taskcomment_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_board_status_idx',
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='position',
+            field=models.BigIntegerField(default=0, help_text='Rank within the board column, lower comes first'),
+        ),
+        migrations.RunPython(populate_positions, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['board', 'status', 'position'], name='task_board_column_idx'),
+        ),
+    ]
@@ -0,0 +1,85 @@
+# Generated by Django 5.2.7 on 2026-10-18 16:16
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0006_boardchange_action'),
+        ('tasks_app', '0006_task_due_date_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='task',
+            options={'ordering': ['-id'], 'verbose_name': 'Task', 'verbose_name_plural': 'Tasks'},
+        ),
+        migrations.AlterModelOptions(
+            name='taskcomment',
+            options={'ordering': ['created_at'], 'verbose_name': 'Task Comment', 'verbose_name_plural': 'Task Comments'},
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='assignee',
+            field=models.ForeignKey(blank=True, help_text='User assigned to complete this task', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='assignee', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='board',
+            field=models.ForeignKey(help_text='Board this task belongs to', on_delete=django.db.models.deletion.CASCADE, to='boards_app.board'),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='description',
+            field=models.TextField(blank=True, help_text='Detailed task description'),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='due_date',
+            field=models.DateField(blank=True, help_text='Task deadline', null=True),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='priority',
+            field=models.CharField(choices=[('low', 'low'), ('medium', 'medium'), ('high', 'high')], default='medium', help_text='Task priority level', max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='reviewer',
+            field=models.ForeignKey(blank=True, help_text='User assigned to review this task', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='reviewer', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='status',
+            field=models.CharField(choices=[('to-do', 'to-do'), ('in-progress', 'in-progress'), ('review', 'review'), ('done', 'done')], default='to-do', help_text='Current task status', max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='title',
+            field=models.CharField(help_text='Task title/summary', max_length=200),
+        ),
+        migrations.AlterField(
+            model_name='taskcomment',
+            name='author',
+            field=models.ForeignKey(help_text='Comment author', on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='taskcomment',
+            name='content',
+            field=models.TextField(help_text='Comment content'),
+        ),
+        migrations.AlterField(
+            model_name='taskcomment',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, help_text='Comment creation timestamp'),
+        ),
+        migrations.AlterField(
+            model_name='taskcomment',
+            name='task',
+            field=models.ForeignKey(help_text='Task this comment belongs to', on_delete=django.db.models.deletion.CASCADE, related_name='comments', to='tasks_app.task'),
+        ),
+    ]
@@ -5,7 +5,8 @@ This module defines models for task management and task comments within boards.
 """
 
 from django.contrib.auth.models import User
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count
 from boards_app.models import Board
 
 
@@ -31,6 +32,67 @@ def choices_priority():
     return priority
 
 
+class TaskQuerySet(models.QuerySet):
+    """
+    Custom queryset for tasks.
+
+    Bundles the joins and aggregates TaskSerializer needs, so every view
+    returning tasks renders them with a fixed number of queries.
+    """
+
+    def with_comments_count(self):
+        """
+        Annotate the number of comments of each task.
+
+        TaskSerializer reads the annotation instead of running a COUNT
+        query per task.
+
+        Returns:
+            TaskQuerySet: Queryset annotated with comments_count
+        """
+        return self.annotate(comments_count=Count('comments'))
+
+    def for_serializer(self):
+        """
+        Prepare tasks for TaskSerializer.
+
+        Joins assignee and reviewer with their profiles and annotates the
+        comment count.
+
+        Returns:
+            TaskQuerySet: Queryset ready for serialization
+        """
+        return (self
+                .select_related('assignee__userprofile',
+                                'reviewer__userprofile')
+                .with_comments_count())
+
+    def for_fields(self, fields):
+        """
+        Prepare tasks for a TaskSerializer rendering only some fields.
+
+        Loads only the columns of the selected fields and joins assignee,
+        reviewer and the comment count only when they are selected.
+
+        Args:
+            fields (list | None): TaskSerializer output fields, or None
+                for all of them
+
+        Returns:
+            TaskQuerySet: Queryset ready for serialization
+        """
+        if fields is None:
+            return self.for_serializer()
+        queryset = self.only('id', *(set(fields) - {'comments_count'}))
+        related = [f'{name}__userprofile' for name in ('assignee', 'reviewer')
+                   if name in fields]
+        if related:
+            queryset = queryset.select_related(*related)
+        if 'comments_count' in fields:
+            queryset = queryset.with_comments_count()
+        return queryset
+
+
 class Task(models.Model):
     """
     Task model for Kanban boards.
@@ -47,6 +109,9 @@ class Task(models.Model):
         assignee (User): User responsible for completing the task (optional)
         reviewer (User): User responsible for reviewing the task (optional)
         due_date (date): Task deadline (optional)
+        position (int): Sparse rank of the task within its board column
+            (see tasks_app.positions)
+        updated_at (datetime): Time of the last modification (auto-generated)
         
     Related Names:
         assignee: Reverse relation from User to assigned tasks
@@ -99,15 +164,40 @@ class Task(models.Model):
         blank=True,
         help_text="Task deadline"
     )
+    position = models.BigIntegerField(
+        default=0,
+        help_text="Rank within the board column, lower comes first"
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text="Task last modification timestamp"
+    )
     
+    objects = TaskQuerySet.as_manager()
+
     def __str__(self):
         """Return string representation of the task."""
         return f'{self.title}'
+
+    def save(self, *args, **kwargs):
+        """Save the task and its board statistics in one transaction."""
+        with transaction.atomic():
+            super().save(*args, **kwargs)
     
     class Meta:
         verbose_name = "Task"
         verbose_name_plural = "Tasks"
         ordering = ['-id']
+        indexes = [
+            models.Index(fields=['board', 'status', 'position'],
+                         name='task_board_column_idx'),
+            models.Index(fields=['board', 'priority'],
+                         name='task_board_priority_idx'),
+            models.Index(fields=['assignee', 'due_date'],
+                         name='task_assignee_due_idx'),
+            models.Index(fields=['reviewer', 'due_date'],
+                         name='task_reviewer_due_idx'),
+        ]
 
 
 class TaskComment(models.Model):
@@ -121,6 +211,7 @@ class TaskComment(models.Model):
         author (User): The user who created the comment
         content (str): The comment text content
         created_at (datetime): Timestamp when comment was created (auto-generated)
+        updated_at (datetime): Time of the last modification (auto-generated)
         
     Related Names:
         comments: Reverse relation from Task to its comments
@@ -144,6 +235,10 @@ class TaskComment(models.Model):
         auto_now_add=True,
         help_text="Comment creation timestamp"
     )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text="Comment last modification timestamp"
+    )
     
     def __str__(self):
         """Return string representation of the comment."""
@@ -152,4 +247,8 @@ class TaskComment(models.Model):
     class Meta:
         verbose_name = "Task Comment"
         verbose_name_plural = "Task Comments"
-        ordering = ['created_at']
\ No newline at end of file
+        ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['task', 'created_at'],
+                         name='comment_task_created_idx'),
+        ]
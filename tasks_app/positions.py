@@ -0,0 +1,90 @@
+"""
+Task column positions.
+
+Tasks are ordered within their (board, status) column by a sparse integer
+rank. Ranks are spaced POSITION_GAP apart, so moving a task only rewrites
+its own row with the midpoint of its new neighbours. A column is
+renumbered only when two neighbours have no free rank left between them.
+Moves are applied by tasks_app.bulk.move_tasks.
+"""
+
+from django.db.models import Min, Q
+
+from .models import Task
+
+POSITION_GAP = 1 << 16
+
+
+def top_positions(board_id, statuses):
+    """
+    Return the rank above the first task of each column.
+
+    New tasks and tasks changing column are placed on top, matching the
+    newest-first order tasks were shown in before they had positions.
+
+    Args:
+        board_id (int): Board ID
+        statuses (iterable): Column statuses
+
+    Returns:
+        dict: Free top rank keyed by status
+    """
+    tops = dict.fromkeys(statuses, 0)
+    rows = (Task.objects
+            .filter(board_id=board_id, status__in=list(tops))
+            .order_by().values('status')
+            .annotate(first=Min('position')))
+    for row in rows:
+        tops[row['status']] = row['first'] - POSITION_GAP
+    return tops
+
+
+def position_after(board_id, status, after, exclude_id):
+    """
+    Return a free rank directly below a task, or on top of the column.
+
+    Args:
+        board_id (int): Board ID
+        status (str): Column status
+        after (tuple): (ID, position) of the task to follow, or None to
+            place on top
+        exclude_id (int): ID of the task being moved
+
+    Returns:
+        int | None: Free rank, or None if the neighbours leave no gap
+    """
+    column = (Task.objects.filter(board_id=board_id, status=status)
+              .exclude(pk=exclude_id).order_by('position', 'id'))
+    if after is None:
+        first = column.values_list('position', flat=True).first()
+        return 0 if first is None else first - POSITION_GAP
+
+    after_id, after_position = after
+    following = (column
+                 .filter(Q(position__gt=after_position)
+                         | Q(position=after_position, id__gt=after_id))
+                 .values_list('position', flat=True).first())
+    if following is None:
+        return after_position + POSITION_GAP
+    if following - after_position < 2:
+        return None
+    return (after_position + following) // 2
+
+
+def rebalance_column(board_id, status):
+    """
+    Renumber a column with evenly spaced ranks, keeping its order.
+
+    Args:
+        board_id (int): Board ID
+        status (str): Column status
+
+    Returns:
+        list: IDs of the renumbered tasks
+    """
+    tasks = list(Task.objects.filter(board_id=board_id, status=status)
+                 .order_by('position', 'id').only('pk', 'position'))
+    for index, task in enumerate(tasks):
+        task.position = index * POSITION_GAP
+    Task.objects.bulk_update(tasks, ['position'], batch_size=500)
+    return [task.pk for task in tasks]
@@ -0,0 +1,180 @@
+"""
+Task app signal handlers.
+
+Keeps the denormalized BoardStats counters, the board version and the
+board change log in sync with task and comment writes. Bulk writers
+disable the per-task handlers with suppress_task_signals() and reconcile
+the whole batch themselves. The task handlers run inside the transaction
+opened by Task.save() or by the delete collector, so counters and tasks are
+committed together.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.contrib.auth.models import User
+from django.db.models import Q
+from django.db.models.signals import (
+    post_delete, post_init, post_save, pre_delete, pre_save
+)
+from django.dispatch import receiver
+
+from boards_app.changes import record_changes
+from boards_app.models import Board
+from boards_app.stats import apply_task_change
+from .models import Task, TaskComment
+from .positions import top_positions
+
+_suppressed = ContextVar('task_signals_suppressed', default=False)
+
+
+@contextmanager
+def suppress_task_signals():
+    """
+    Skip the per-task save and delete handlers inside the block.
+
+    The caller is responsible for updating counters and the change log of
+    the tasks it writes (see tasks_app.bulk).
+    """
+    token = _suppressed.set(True)
+    try:
+        yield
+    finally:
+        _suppressed.reset(token)
+
+
+def task_signals_suppressed():
+    """Return whether the per-task handlers are suppressed right now."""
+    return _suppressed.get()
+
+
+def _stats_state(task):
+    """
+    Return the (board_id, status, priority) state of a loaded task.
+
+    Returns None when one of the fields is deferred, so loading a partial
+    task never triggers extra queries.
+    """
+    values = task.__dict__
+    if not all(f in values for f in ('board_id', 'status', 'priority')):
+        return None
+    return (values['board_id'], values['status'], values['priority'])
+
+
+def _stored_state(pk):
+    """Return the (board_id, status, priority) state stored for a task."""
+    row = (Task.objects.filter(pk=pk)
+           .values_list('board_id', 'status', 'priority').first())
+    return tuple(row) if row else None
+
+
+@receiver(post_init, sender=Task)
+def remember_stats_state(sender, instance, **kwargs):
+    """Remember the state a task was loaded or constructed with."""
+    instance._stats_state = _stats_state(instance)
+
+
+@receiver(pre_save, sender=Task)
+def resolve_stats_state(sender, instance, raw=False, **kwargs):
+    """
+    Make sure the persisted state is known before an update.
+
+    Falls back to the database for tasks loaded with deferred fields and
+    for unsaved instances built with an explicit primary key.
+    """
+    if raw or instance.pk is None or _suppressed.get():
+        return
+    if instance._state.adding or instance._stats_state is None:
+        instance._stats_state = _stored_state(instance.pk)
+
+
+@receiver(pre_save, sender=Task)
+def place_in_column(sender, instance, raw=False, **kwargs):
+    """
+    Put new tasks and tasks changing column on top of their column.
+
+    Runs after resolve_stats_state, so the persisted column is known.
+    Explicit positions are set through the move endpoint instead.
+    """
+    if raw or _suppressed.get():
+        return
+    old = None if instance._state.adding else instance._stats_state
+    if old is None or old[:2] != (instance.board_id, instance.status):
+        tops = top_positions(instance.board_id, [instance.status])
+        instance.position = tops[instance.status]
+
+
+@receiver(post_save, sender=Task)
+def update_stats_on_save(sender, instance, created, raw=False, **kwargs):
+    """Apply the counter changes of a created or updated task."""
+    if raw or _suppressed.get():
+        return
+    old = None if created else instance._stats_state
+    new = _stats_state(instance) or _stored_state(instance.pk)
+    apply_task_change(old, new)
+    if old and new and old[0] == new[0]:
+        record_changes([(new[0], 'task', instance.pk, 'updated')])
+    else:
+        record_changes([(old and old[0], 'task', instance.pk, 'deleted'),
+                        (new and new[0], 'task', instance.pk, 'created')])
+    instance._stats_state = new
+
+
+def _origin_model(origin):
+    """Return the model of the instance or queryset a delete started from."""
+    return getattr(origin, 'model', type(origin))
+
+
+@receiver(post_delete, sender=Task)
+def update_stats_on_delete(sender, instance, origin=None, **kwargs):
+    """
+    Remove a deleted task from its board counters.
+
+    Skipped when the task is deleted because its board is, since the
+    counters and the board row disappear as well.
+    """
+    if _suppressed.get():
+        return
+    if origin is not None and _origin_model(origin) is not Task:
+        return
+    old = instance._stats_state or _stats_state(instance)
+    apply_task_change(old, None)
+    record_changes([(old and old[0], 'task', instance.pk, 'deleted')])
+
+
+@receiver(post_save, sender=TaskComment)
+@receiver(post_delete, sender=TaskComment)
+def log_comment_change(sender, instance, signal, created=False, raw=False,
+                       origin=None, **kwargs):
+    """
+    Log a comment added to, changed on or removed from a board.
+
+    Skipped when the comment is deleted along with its task or board, which
+    log the change themselves.
+    """
+    if raw or _origin_model(origin) in (Task, Board):
+        return
+    if TaskComment.task.is_cached(instance):
+        board_id = instance.task.board_id
+    else:
+        board_id = (Task.objects.filter(pk=instance.task_id)
+                    .values_list('board_id', flat=True).first())
+    if signal is post_delete:
+        action = 'deleted'
+    else:
+        action = 'created' if created else 'updated'
+    record_changes([(board_id, 'comment', instance.pk, action)])
+
+
+@receiver(pre_delete, sender=User)
+def log_unassigned_tasks(sender, instance, **kwargs):
+    """
+    Log tasks whose assignee or reviewer is being deleted.
+
+    The foreign keys are cleared by an UPDATE without save signals, so the
+    affected tasks are recorded here.
+    """
+    tasks = Task.objects.filter(
+        Q(assignee=instance) | Q(reviewer=instance)
+    ).values_list('board_id', 'pk')
+    record_changes((board_id, 'task', pk, 'updated') for board_id, pk in tasks)
@@ -0,0 +1,626 @@
+"""
+Task app tests.
+
+Covers the indexes serving the hot task and comment filters, the bulk
+task endpoint and the read path of TaskSerializer.
+"""
+
+import base64
+import datetime
+import itertools
+import unittest
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.test import APITestCase
+
+from auth_app.models import UserProfile
+from boards_app.models import Board, BoardStats
+from .api.serializers import TASK_FIELDS, TaskSerializer, UserSerializer
+from .api.filters import ORDERING_FIELDS
+from .models import Task, TaskComment, choices_priority, choices_status
+from .positions import POSITION_GAP, rebalance_column
+
+
+@unittest.skipUnless(connection.vendor in ('sqlite', 'postgresql'),
+                     'Query plan output is backend specific')
+class TaskIndexPlanTests(TestCase):
+    """The hot task and comment filters are answered from their indexes."""
+
+    def assertUsesIndex(self, queryset, index_name):
+        """Assert that the query plan of a queryset searches an index."""
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                # Empty test tables are cheaper to scan than any index
+                cursor.execute('SET LOCAL enable_seqscan = off')
+            expected = [f'Index Scan using {index_name} ',
+                        f'Index Only Scan using {index_name} ',
+                        f'Bitmap Index Scan on {index_name}']
+        else:
+            expected = [f'USING INDEX {index_name} ',
+                        f'USING COVERING INDEX {index_name} ']
+        plan = queryset.explain()
+        self.assertTrue(any(text in plan for text in expected), plan)
+
+    def test_board_column_uses_column_index(self):
+        tasks = (Task.objects.filter(board_id=1, status='to-do')
+                 .order_by('position', 'id'))
+        self.assertUsesIndex(tasks, 'task_board_column_idx')
+
+    def test_board_priority_uses_priority_index(self):
+        tasks = Task.objects.filter(board_id=1, priority='high')
+        self.assertUsesIndex(tasks, 'task_board_priority_idx')
+
+    def test_task_comments_use_comment_index(self):
+        comments = (TaskComment.objects.filter(task_id=1)
+                    .order_by('created_at'))
+        self.assertUsesIndex(comments, 'comment_task_created_idx')
+
+    def test_assigned_tasks_use_assignee_index(self):
+        tasks = Task.objects.filter(assignee_id=1).order_by('due_date')
+        self.assertUsesIndex(tasks, 'task_assignee_due_idx')
+
+    def test_reviewed_tasks_use_reviewer_index(self):
+        tasks = Task.objects.filter(reviewer_id=1).order_by('due_date')
+        self.assertUsesIndex(tasks, 'task_reviewer_due_idx')
+
+    def test_overdue_filter_uses_due_date_range(self):
+        tasks = Task.objects.filter(assignee_id=1,
+                                    due_date__lt=datetime.date(2026, 1, 1))
+        self.assertUsesIndex(tasks, 'task_assignee_due_idx')
+
+
+def create_user(username):
+    """Create a user with a profile, as registration does."""
+    user = User.objects.create_user(
+        username, f'{username}@example.com', 'password')
+    UserProfile.objects.create(user=user, full_name=username.title())
+    return user
+
+
+class TaskBulkTests(APITestCase):
+    """POST /api/tasks/bulk/ validates every operation before writing."""
+
+    url = '/api/tasks/bulk/'
+
+    def setUp(self):
+        # Membership edits are invalidated on commit, which TestCase skips
+        cache.clear()
+        self.owner = create_user('owner')
+        self.member = create_user('member')
+        self.board = Board.objects.create(title='Board', owner=self.owner)
+        self.board.members.add(self.member)
+        self.task = Task.objects.create(board=self.board, title='Existing')
+        self.client.force_authenticate(self.owner)
+
+    def bulk(self, *operations):
+        return self.client.post(
+            self.url, {'board': self.board.pk, 'operations': operations},
+            format='json')
+
+    def assertRejected(self, response, index, field):
+        """Assert that nothing was written and operation index failed."""
+        self.assertEqual(response.status_code, 400)
+        results = response.json()['results']
+        self.assertEqual(results[index]['status'], 400)
+        self.assertIn(field, results[index]['errors'])
+        for other, result in enumerate(results):
+            if other != index:
+                self.assertEqual(result['status'], 424)
+        self.assertEqual(list(Task.objects.values_list('title', flat=True)),
+                         ['Existing'])
+
+    def test_missing_op_is_rejected(self):
+        response = self.bulk({'op': 'create', 'title': 'New'},
+                             {'id': self.task.pk, 'title': 'Changed'})
+        self.assertRejected(response, 1, 'op')
+
+    def test_unknown_op_is_rejected(self):
+        response = self.bulk({'op': 'create', 'title': 'New'},
+                             {'op': 'archive', 'id': self.task.pk})
+        self.assertRejected(response, 1, 'op')
+
+    def test_update_and_delete_need_an_id(self):
+        for op in ('update', 'delete'):
+            with self.subTest(op=op):
+                response = self.bulk({'op': 'create', 'title': 'New'},
+                                     {'op': op, 'title': 'Changed'})
+                self.assertRejected(response, 1, 'id')
+
+    def test_failed_operation_rejects_the_whole_batch(self):
+        response = self.bulk(
+            {'op': 'create', 'title': 'New'},
+            {'op': 'update', 'id': self.task.pk, 'title': 'Changed'},
+            {'op': 'delete', 'id': self.task.pk + 100})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([result['status']
+                          for result in response.json()['results']],
+                         [424, 424, 404])
+        self.assertEqual(list(Task.objects.values_list('title', flat=True)),
+                         ['Existing'])
+
+    def test_operations_are_applied(self):
+        response = self.bulk(
+            {'op': 'create', 'title': 'New', 'assignee_id': self.member.pk},
+            {'op': 'update', 'id': self.task.pk, 'status': 'done'})
+        self.assertEqual(response.status_code, 200)
+        created, updated = response.json()['results']
+        self.assertEqual(created['status'], 201)
+        self.assertEqual(created['data']['assignee']['id'], self.member.pk)
+        self.assertEqual(updated['data']['status'], 'done')
+
+        response = self.bulk({'op': 'delete', 'id': self.task.pk})
+        self.assertEqual(response.json()['results'],
+                         [{'status': 204, 'id': self.task.pk}])
+        self.assertFalse(Task.objects.filter(pk=self.task.pk).exists())
+
+    def test_size_limits(self):
+        self.assertEqual(self.bulk().status_code, 400)
+        operations = [{'op': 'create', 'title': 'New'}] * 1001
+        response = self.bulk(*operations)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('operations', response.json())
+        self.assertEqual(Task.objects.count(), 1)
+
+    def test_query_count_does_not_grow_with_operations(self):
+        def create(count):
+            return [{'op': 'create', 'title': f'Task {index}',
+                     'assignee_id': self.member.pk} for index in range(count)]
+
+        self.bulk(*create(1))
+        with CaptureQueriesContext(connection) as few:
+            self.bulk(*create(2))
+        with self.assertNumQueries(len(few)):
+            self.bulk(*create(20))
+
+    def test_writes_are_one_transaction(self):
+        with mock.patch('tasks_app.bulk.record_changes',
+                        side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self.bulk({'op': 'create', 'title': 'New'},
+                          {'op': 'update', 'id': self.task.pk,
+                           'title': 'Changed'})
+        self.assertEqual(list(Task.objects.values_list('title', flat=True)),
+                         ['Existing'])
+
+
+def model_serializer_representation(task, fields=None):
+    """
+    Render a task with ModelSerializer's generic to_representation.
+
+    This is the output TaskSerializer and UserSerializer produced before
+    their read path shortcuts; only the selected fields are kept.
+    """
+    with mock.patch.object(UserSerializer, 'to_representation',
+                           serializers.ModelSerializer.to_representation):
+        data = serializers.ModelSerializer.to_representation(
+            TaskSerializer(), task)
+    if fields is not None:
+        data = {name: data[name] for name in fields}
+    return data
+
+
+class TaskRepresentationTests(TestCase):
+    """TaskSerializer's read path renders what ModelSerializer rendered."""
+
+    def setUp(self):
+        owner = create_user('owner')
+        member = create_user('member')
+        board = Board.objects.create(title='Board', owner=owner)
+        board.members.add(member)
+        assigned = Task.objects.create(
+            board=board, title='Assigned', description='Details',
+            status='review', priority='high', assignee=member,
+            reviewer=owner, due_date=datetime.date(2026, 10, 18))
+        Task.objects.create(board=board, title='Unassigned')
+        TaskComment.objects.create(task=assigned, author=owner,
+                                   content='Comment')
+
+    def test_all_fields_match(self):
+        tasks = Task.objects.for_serializer().order_by('pk')
+        for task in tasks:
+            with self.subTest(task=task.title):
+                self.assertEqual(TaskSerializer(task).data,
+                                 model_serializer_representation(task))
+        self.assertEqual(TaskSerializer(tasks, many=True).data,
+                         [model_serializer_representation(task)
+                          for task in tasks])
+
+    def test_field_subsets_match(self):
+        subsets = [[name] for name in TASK_FIELDS]
+        subsets += [list(pair) for pair in itertools.combinations(
+            TASK_FIELDS, 2)]
+        subsets.append(TASK_FIELDS)
+        for fields in subsets:
+            with self.subTest(fields=fields):
+                for task in Task.objects.for_fields(fields).order_by('pk'):
+                    data = TaskSerializer(
+                        task, context={'fields': fields}).data
+                    self.assertEqual(list(data), fields)
+                    full = Task.objects.for_serializer().get(pk=task.pk)
+                    self.assertEqual(
+                        data, model_serializer_representation(full, fields))
+
+
+class TaskListConditionalTests(APITestCase):
+    """The assigned and reviewing lists answer If-None-Match with 304."""
+
+    def setUp(self):
+        cache.clear()
+        self.owner = create_user('owner')
+        self.board = Board.objects.create(title='Board', owner=self.owner)
+        self.task = Task.objects.create(
+            board=self.board, title='Task', assignee=self.owner)
+        self.client.force_authenticate(self.owner)
+
+    def test_assigned_list_answers_if_none_match(self):
+        url = '/api/tasks/assigned-to-me/'
+        response = self.client.get(url)
+        self.assertNotIn('Last-Modified', response)
+        etag = response['ETag']
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.task.title = 'Renamed'
+        self.task.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()[0]['title'], 'Renamed')
+
+    def test_task_leaving_the_list_changes_the_etag(self):
+        url = '/api/tasks/reviewing/'
+        Task.objects.filter(pk=self.task.pk).update(reviewer=self.owner)
+        etag = self.client.get(url)['ETag']
+
+        self.task.reviewer = None
+        self.task.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [])
+
+
+class TaskMoveTests(APITestCase):
+    """POST /api/tasks/move/ places tasks and keeps column order."""
+
+    def setUp(self):
+        cache.clear()
+        self.owner = create_user('owner')
+        self.board = Board.objects.create(title='Board', owner=self.owner)
+        # New tasks go on top: the column reads c, b, a
+        self.a, self.b, self.c = (
+            Task.objects.create(board=self.board, title=title)
+            for title in 'abc')
+        self.client.force_authenticate(self.owner)
+
+    def move(self, *moves):
+        """Send (task, status, task to follow) moves."""
+        return self.client.post('/api/tasks/move/', {
+            'board': self.board.pk,
+            'moves': [{'id': task.pk, 'status': status,
+                       'after': after and after.pk}
+                      for task, status, after in moves],
+        }, format='json')
+
+    def column(self, status='to-do'):
+        """Return the task IDs of a column in display order."""
+        return list(Task.objects
+                    .filter(board=self.board, status=status)
+                    .order_by('position', 'id')
+                    .values_list('pk', flat=True))
+
+    def displayed_column(self, status='to-do'):
+        """Return the task IDs of a column as the board endpoint lists them."""
+        response = self.client.get(f'/api/boards/{self.board.pk}/tasks/',
+                                   {'status': status})
+        return [task['id'] for task in response.json()['results']]
+
+    def positions(self):
+        """Return the positions of all tasks by ID."""
+        return dict(Task.objects.filter(board=self.board)
+                    .values_list('pk', 'position'))
+
+    def test_move_after_a_task(self):
+        self.assertEqual(self.column(), [self.c.pk, self.b.pk, self.a.pk])
+        before = self.positions()
+
+        response = self.move((self.a, 'to-do', self.c))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([task['id'] for task in response.json()['tasks']],
+                         [self.a.pk])
+        expected = [self.c.pk, self.a.pk, self.b.pk]
+        self.assertEqual(self.column(), expected)
+        self.assertEqual(self.displayed_column(), expected)
+        after = self.positions()
+        # Only the moved task is rewritten
+        self.assertEqual({pk for pk in after if after[pk] != before[pk]},
+                         {self.a.pk})
+
+    def test_move_to_the_top(self):
+        response = self.move((self.a, 'to-do', None))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.column(), [self.a.pk, self.c.pk, self.b.pk])
+
+    def test_moves_apply_in_order_across_columns(self):
+        response = self.move((self.a, 'done', None), (self.c, 'done', self.a))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.column('done'), [self.a.pk, self.c.pk])
+        self.assertEqual(self.column(), [self.b.pk])
+        stats = BoardStats.objects.get(board=self.board)
+        self.assertEqual((stats.to_do_count, stats.done_count), (1, 2))
+
+    def test_exhausted_gap_rebalances_the_column(self):
+        """
+        Repeatedly inserting right below c halves the gap above b until no
+        rank is left, which renumbers the column.
+        """
+        inserted = []
+        with mock.patch('tasks_app.bulk.rebalance_column',
+                        wraps=rebalance_column) as rebalance:
+            for index in range(POSITION_GAP.bit_length() + 2):
+                task = Task.objects.create(board=self.board,
+                                           title=f'Inserted {index}')
+                response = self.move((task, 'to-do', self.c))
+                self.assertEqual(response.status_code, 200)
+                inserted.insert(0, task.pk)
+        rebalance.assert_called()
+
+        expected = [self.c.pk, *inserted, self.b.pk, self.a.pk]
+        self.assertEqual(self.column(), expected)
+        positions = self.positions()
+        ranks = [positions[pk] for pk in expected]
+        self.assertEqual(len(set(ranks)), len(ranks))
+
+    def test_invalid_moves_are_rejected(self):
+        other = Board.objects.create(title='Other', owner=self.owner)
+        foreign = Task.objects.create(board=other, title='Foreign')
+
+        response = self.move((foreign, 'to-do', None))
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('moves', response.json())
+
+        response = self.move((self.a, 'done', self.c))
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('after', response.json())
+        self.assertEqual(self.column(), [self.c.pk, self.b.pk, self.a.pk])
+
+    def test_non_member_is_forbidden(self):
+        self.client.force_authenticate(create_user('outsider'))
+        response = self.move((self.a, 'to-do', None))
+        self.assertEqual(response.status_code, 403)
+
+
+class TaskListFilterTests(APITestCase):
+    """
+    The assigned and reviewing lists filter, order, select fields and page
+    in SQL.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = create_user('jane')
+        other = create_user('john')
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        self.other_board = Board.objects.create(title='Other', owner=self.user)
+        self.today = timezone.localdate()
+        statuses, priorities = choices_status(), choices_priority()
+        for index in range(14):
+            Task.objects.create(
+                board=self.board if index % 3 else self.other_board,
+                title=f'Task {index}',
+                status=statuses[index % len(statuses)],
+                priority=priorities[index % len(priorities)],
+                due_date=(None if index % 5 == 0 else
+                          self.today + datetime.timedelta(days=index % 4 - 2)),
+                assignee=self.user,
+                reviewer=other,
+            )
+        Task.objects.create(board=self.board, title='Not mine',
+                            assignee=other)
+        self.client.force_authenticate(self.user)
+
+    def get(self, url='/api/tasks/assigned-to-me/', **params):
+        """Request a task list and return the response data."""
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def ids(self, **params):
+        """Return the task IDs of the unpaginated assigned list."""
+        return [task['id'] for task in self.get(**params)]
+
+    def tasks(self):
+        """Return the assigned tasks as dicts."""
+        return list(Task.objects.filter(assignee=self.user).values(
+            'id', 'board_id', 'status', 'priority', 'due_date', 'updated_at'))
+
+    def matching(self, predicate):
+        """Return the assigned task IDs matching predicate, newest first."""
+        return sorted((task['id'] for task in self.tasks() if predicate(task)),
+                      reverse=True)
+
+    def expected_order(self, ordering):
+        """Return the assigned task IDs in the order ?ordering= describes."""
+        descending = ordering.startswith('-')
+        name = ordering.lstrip('-')
+        tasks = sorted(self.tasks(), key=lambda task: -task['id'])
+        if name == 'id':
+            key = lambda task: task['id']  # noqa: E731
+        elif name == 'due_date':
+            missing = datetime.date.min if descending else datetime.date.max
+            key = lambda task: task['due_date'] or missing  # noqa: E731
+        elif name == 'priority':
+            priorities = choices_priority()
+            key = lambda task: priorities.index(task['priority'])  # noqa: E731
+        else:
+            key = lambda task: task['updated_at']  # noqa: E731
+        return [task['id']
+                for task in sorted(tasks, key=key, reverse=descending)]
+
+    def walk(self, ordering, fields=None):
+        """
+        Follow the next links of a paginated list, then the previous links
+        back, and return the IDs of both walks page by page.
+        """
+        params = {'ordering': ordering, 'page_size': 4}
+        if fields:
+            params['fields'] = fields
+        forward, backward = [], []
+        data = self.get(**params)
+        forward.append([task['id'] for task in data['results']])
+        while data['next']:
+            data = self.get(data['next'])
+            forward.append([task['id'] for task in data['results']])
+        while data['previous']:
+            data = self.get(data['previous'])
+            backward.insert(0, [task['id'] for task in data['results']])
+        backward.append(forward[-1])
+        return forward, backward
+
+    def test_filters(self):
+        cases = [
+            ({'status__in': 'to-do,done'},
+             lambda task: task['status'] in ('to-do', 'done')),
+            ({'priority__in': 'high'},
+             lambda task: task['priority'] == 'high'),
+            ({'board': self.other_board.pk},
+             lambda task: task['board_id'] == self.other_board.pk),
+            ({'due_date__gte': self.today, 'due_date__lte': self.today},
+             lambda task: task['due_date'] == self.today),
+            ({'overdue': 'true'},
+             lambda task: (task['due_date'] is not None
+                           and task['due_date'] < self.today
+                           and task['status'] != 'done')),
+            # Tasks without due date are never overdue
+            ({'overdue': 'false'},
+             lambda task: not (task['due_date'] is not None
+                               and task['due_date'] < self.today
+                               and task['status'] != 'done')),
+            ({'status__in': 'review', 'priority__in': 'low,medium'},
+             lambda task: (task['status'] == 'review'
+                           and task['priority'] != 'high')),
+        ]
+        for params, predicate in cases:
+            with self.subTest(params=params):
+                expected = self.matching(predicate)
+                self.assertTrue(expected)
+                self.assertEqual(self.ids(**params), expected)
+
+    def test_invalid_parameters(self):
+        for params in ({'status__in': 'open'}, {'priority__in': ''},
+                       {'ordering': 'title'}, {'fields': 'id,secret'},
+                       {'due_date__gte': self.today,
+                        'due_date__lte': self.today - datetime.timedelta(1)},
+                       {'board': 'first'}):
+            with self.subTest(params=params):
+                response = self.client.get('/api/tasks/assigned-to-me/',
+                                           params)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn(next(iter(params)), response.json())
+
+    def test_orderings(self):
+        for ordering in [prefix + name for name in ORDERING_FIELDS
+                         for prefix in ('', '-')]:
+            with self.subTest(ordering=ordering):
+                self.assertEqual(self.ids(ordering=ordering),
+                                 self.expected_order(ordering))
+
+    def test_cursor_pages_follow_every_ordering(self):
+        for ordering in [prefix + name for name in ORDERING_FIELDS
+                         for prefix in ('', '-')]:
+            for fields in (None, 'id,title'):
+                with self.subTest(ordering=ordering, fields=fields):
+                    forward, backward = self.walk(ordering, fields)
+                    self.assertGreater(len(forward), 2)
+                    self.assertEqual(sum(forward, []),
+                                     self.expected_order(ordering))
+                    self.assertEqual(backward, forward)
+
+    def test_invalid_cursor(self):
+        for ordering, position in (('priority', 'x:1'), ('priority', '12'),
+                                   ('due_date', '12:soon')):
+            cursor = base64.b64encode(f'p={position}'.encode()).decode()
+            response = self.client.get('/api/tasks/assigned-to-me/',
+                                       {'ordering': ordering,
+                                        'cursor': cursor})
+            self.assertEqual(response.status_code, 404)
+
+    def test_filtered_pages(self):
+        data = self.get(status__in='to-do,review', ordering='due_date',
+                        page_size=2)
+        ids = [task['id'] for task in data['results']]
+        while data['next']:
+            data = self.get(data['next'])
+            ids += [task['id'] for task in data['results']]
+        expected = [pk for pk in self.expected_order('due_date')
+                    if pk in self.matching(
+                        lambda task: task['status'] in ('to-do', 'review'))]
+        self.assertEqual(ids, expected)
+
+    def test_fields(self):
+        data = self.get(fields='title,id,status')
+        self.assertEqual(len(data), 14)
+        for task in data:
+            self.assertEqual(list(task), ['id', 'title', 'status'])
+
+        full = self.get(fields=','.join(TASK_FIELDS))
+        self.assertEqual(full, self.get())
+
+        self.client.force_authenticate(User.objects.get(username='john'))
+        data = self.get('/api/tasks/reviewing/', fields='id,reviewer')
+        self.assertEqual(len(data), 14)
+        self.assertEqual(list(data[0]), ['id', 'reviewer'])
+        self.assertEqual(data[0]['reviewer']['fullname'], 'John')
+
+
+class TaskListStreamTests(APITestCase):
+    """?stream=1 returns the bytes of the buffered task list."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = create_user('jane')
+        board = Board.objects.create(title='Board', owner=self.user)
+        for index in range(30):
+            task = Task.objects.create(
+                board=board,
+                title=f'Tâche {index} \u2028 "quoted" \U0001f600',
+                description='Line\nbreak' if index % 2 else '',
+                priority=choices_priority()[index % 3],
+                due_date=(datetime.date(2026, 1, 1 + index % 9)
+                          if index % 4 else None),
+                assignee=self.user,
+                reviewer=self.user if index % 3 else None,
+            )
+            if index % 5 == 0:
+                TaskComment.objects.create(task=task, author=self.user,
+                                           content='Noted')
+        self.client.force_authenticate(self.user)
+
+    def test_stream_matches_buffered_response(self):
+        for url in ('/api/tasks/assigned-to-me/', '/api/tasks/reviewing/'):
+            for params in ({}, {'ordering': 'due_date'},
+                           {'fields': 'id,title,assignee',
+                            'priority__in': 'high'}):
+                with self.subTest(url=url, params=params):
+                    buffered = self.client.get(url, params)
+                    streamed = self.client.get(url, {**params, 'stream': 1})
+                    self.assertTrue(streamed.streaming)
+                    self.assertEqual(streamed['Content-Type'],
+                                     'application/json')
+                    self.assertEqual(b''.join(streamed.streaming_content),
+                                     buffered.content)
+
+    def test_paginated_lists_are_not_streamed(self):
+        response = self.client.get('/api/tasks/assigned-to-me/',
+                                   {'stream': 1, 'page_size': 10})
+        self.assertFalse(response.streaming)
+        self.assertEqual(len(response.json()['results']), 10)